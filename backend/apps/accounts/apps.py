@@ -5,3 +5,11 @@ class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.accounts"
     label = "accounts"
+
+    def ready(self):
+        from core import checks  # noqa: F401 (registers the shared cache check)
+        from core.metrics import registry
+
+        from .blacklist import TokenBlacklistCache
+
+        registry.register_collector(TokenBlacklistCache.prometheus_lines)
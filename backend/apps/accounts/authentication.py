@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .services import TokenVersionService
+
+User = get_user_model()
+
+# Claim name -> User field, carried in every token issued by LoginSerializer.
+USER_CLAIMS = {
+    "role": "role",
+    "is_staff": "is_staff",
+    "is_active": "is_active",
+    "ver": "token_version",
+}
+
+
+def add_user_claims(token, user):
+    for claim, field in USER_CLAIMS.items():
+        token[claim] = getattr(user, field)
+    return token
+
+
+def check_token_version(user_id, version):
+    current = TokenVersionService.get(user_id)
+    if current is None:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+    if version != current:
+        raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """JWT authentication that builds ``request.user`` from token claims.
+
+    The user is a real ``User`` instance whose id, role, is_staff, is_active
+    and token_version come from the token; every other column is deferred and
+    loaded in a single query the first time a view touches it. The only
+    per-request lookup is the cached token version, which lets
+    ``UserManagementService.update_user`` revoke outstanding tokens.
+
+    Tokens issued before these claims existed fall back to the database.
+    """
+
+    def get_user(self, validated_token):
+        if any(claim not in validated_token for claim in USER_CLAIMS):
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        check_token_version(user_id, validated_token["ver"])
+        if api_settings.CHECK_USER_IS_ACTIVE and not validated_token["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        known = {api_settings.USER_ID_FIELD: user_id}
+        known.update((field, validated_token[claim]) for claim, field in USER_CLAIMS.items())
+        # from_db expects values in concrete field order.
+        field_names = [f.attname for f in User._meta.concrete_fields if f.attname in known]
+        user = User.from_db(DEFAULT_DB_ALIAS, field_names, [known[name] for name in field_names])
+        user._from_token_claims = True
+        return user
@@ -0,0 +1,186 @@
+import hashlib
+import math
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter; ``in`` may return false positives, never false negatives."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str) -> Iterable[int]:
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class TokenBlacklistCache:
+    """Cached answers to "is this jti blacklisted?" in front of the token_blacklist tables.
+
+    Positive answers are stored with ``set`` until the token expires. Negative
+    ones are stored with ``add`` for ``TOKEN_BLACKLIST_NEGATIVE_CACHE_SECONDS``
+    only, so a concurrent blacklist write always wins over a stale fill and a
+    blacklist made outside :meth:`mark_blacklisted` shows up soon after. The
+    cache must be shared between workers (see ``apps.accounts.checks``).
+
+    The optional per-process Bloom filter holds every unexpired blacklisted
+    jti as of its last sync. A miss is only trusted for tokens issued before
+    that sync, and only after the shared cache has no positive entry for it.
+    """
+
+    ALIAS = "auth"
+    KEY = "auth:blacklisted:{}"
+
+    _lock = threading.Lock()
+    _bloom: Optional[BloomFilter] = None
+    _bloom_synced_at = 0.0
+    _bloom_synced_wall = 0.0
+    _bloom_last_id = 0
+    _stats = {"hits": 0, "misses": 0, "bloom_negatives": 0, "blacklisted": 0}
+
+    @staticmethod
+    def _cache():
+        return caches[TokenBlacklistCache.ALIAS]
+
+    @staticmethod
+    def _record(stat: str) -> None:
+        with TokenBlacklistCache._lock:
+            TokenBlacklistCache._stats[stat] += 1
+
+    @staticmethod
+    def _timeout(exp: int) -> int:
+        return max(1, int(exp - time.time()))
+
+    @staticmethod
+    def _sync_bloom() -> None:
+        # Taken before the read: anything blacklisted after it may be missing.
+        started = time.time()
+        bloom = TokenBlacklistCache._bloom
+        rows = BlacklistedToken.objects.filter(token__expires_at__gt=aware_utcnow())
+        if bloom is None or bloom.count >= bloom.capacity:
+            # Bloom filters cannot forget, so start over once purged tokens fill it up.
+            bloom = BloomFilter(
+                settings.TOKEN_BLACKLIST_BLOOM_CAPACITY, settings.TOKEN_BLACKLIST_BLOOM_ERROR_RATE
+            )
+            last_id = 0
+        else:
+            last_id = TokenBlacklistCache._bloom_last_id
+            rows = rows.filter(id__gt=last_id)
+        for row_id, jti in rows.order_by("id").values_list("id", "token__jti").iterator():
+            bloom.add(jti)
+            last_id = row_id
+        TokenBlacklistCache._bloom = bloom
+        TokenBlacklistCache._bloom_last_id = last_id
+        TokenBlacklistCache._bloom_synced_at = time.monotonic()
+        TokenBlacklistCache._bloom_synced_wall = started
+
+    @staticmethod
+    def _bloom_rules_out(jti: str, iat: Optional[int]) -> bool:
+        """True when the filter, synced after the token was issued, does not hold ``jti``."""
+        with TokenBlacklistCache._lock:
+            stale = time.monotonic() - TokenBlacklistCache._bloom_synced_at
+            if TokenBlacklistCache._bloom is None or stale >= settings.TOKEN_BLACKLIST_BLOOM_SYNC_SECONDS:
+                TokenBlacklistCache._sync_bloom()
+            if jti in TokenBlacklistCache._bloom:
+                return False
+            return iat is not None and iat < TokenBlacklistCache._bloom_synced_wall
+
+    @staticmethod
+    def is_blacklisted(jti: str, exp: int, iat: Optional[int] = None) -> bool:
+        cache = TokenBlacklistCache._cache()
+        key = TokenBlacklistCache.KEY.format(jti)
+        cached = cache.get(key)
+        if cached is not None:
+            TokenBlacklistCache._record("hits")
+            return cached
+
+        if settings.TOKEN_BLACKLIST_BLOOM and TokenBlacklistCache._bloom_rules_out(jti, iat):
+            TokenBlacklistCache._record("bloom_negatives")
+            return False
+
+        TokenBlacklistCache._record("misses")
+        blacklisted = BlacklistedToken.objects.filter(token__jti=jti).exists()
+        if blacklisted:
+            cache.set(key, True, timeout=TokenBlacklistCache._timeout(exp))
+        elif settings.TOKEN_BLACKLIST_NEGATIVE_CACHE_SECONDS:
+            timeout = min(settings.TOKEN_BLACKLIST_NEGATIVE_CACHE_SECONDS, TokenBlacklistCache._timeout(exp))
+            cache.add(key, False, timeout=timeout)
+        return blacklisted
+
+    @staticmethod
+    def mark_blacklisted(jti: str, exp: int) -> None:
+        TokenBlacklistCache._cache().set(
+            TokenBlacklistCache.KEY.format(jti), True, timeout=TokenBlacklistCache._timeout(exp)
+        )
+        with TokenBlacklistCache._lock:
+            if TokenBlacklistCache._bloom is not None:
+                TokenBlacklistCache._bloom.add(jti)
+            TokenBlacklistCache._stats["blacklisted"] += 1
+
+    @staticmethod
+    def reset_bloom() -> None:
+        with TokenBlacklistCache._lock:
+            TokenBlacklistCache._bloom = None
+            TokenBlacklistCache._bloom_last_id = 0
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        with TokenBlacklistCache._lock:
+            stats = dict(TokenBlacklistCache._stats)
+            stats["bloom_entries"] = TokenBlacklistCache._bloom.count if TokenBlacklistCache._bloom else 0
+        return stats
+
+    @staticmethod
+    def prometheus_lines():
+        stats = TokenBlacklistCache.stats()
+        bloom_entries = stats.pop("bloom_entries")
+        lines = [
+            "# HELP lms_token_blacklist_events_total Token blacklist lookups and writes by kind",
+            "# TYPE lms_token_blacklist_events_total counter",
+        ]
+        for event, count in sorted(stats.items()):
+            lines.append(f'lms_token_blacklist_events_total{{event="{event}"}} {count}')
+        lines.append("# HELP lms_token_blacklist_bloom_entries Blacklisted tokens held in the Bloom filter")
+        lines.append("# TYPE lms_token_blacklist_bloom_entries gauge")
+        lines.append(f"lms_token_blacklist_bloom_entries {bloom_entries}")
+        return lines
+
+
+class CachedRefreshToken(RefreshToken):
+    """Refresh token whose blacklist check goes through :class:`TokenBlacklistCache`."""
+
+    def check_blacklist(self) -> None:
+        if TokenBlacklistCache.is_blacklisted(
+            self.payload[api_settings.JTI_CLAIM], self.payload["exp"], self.payload.get("iat")
+        ):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        TokenBlacklistCache.mark_blacklisted(self.payload[api_settings.JTI_CLAIM], self.payload["exp"])
+        return result
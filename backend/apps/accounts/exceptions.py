@@ -18,3 +18,7 @@ class RoleChangeError(UserValidationError):
 
 class UserNotFoundError(Exception):
     pass
+
+
+class UserImportError(Exception):
+    pass
@@ -0,0 +1,75 @@
+from django.db import migrations
+
+SQLITE_TRIGGERS = {
+    "accounts_user_trgm_insert": (
+        "AFTER INSERT ON accounts_user BEGIN "
+        "INSERT INTO accounts_user_trgm (rowid, email, name, registration_number) "
+        "VALUES (new.id, new.email, '', coalesce(new.registration_number, '')); END"
+    ),
+    "accounts_user_trgm_update": (
+        "AFTER UPDATE OF email, registration_number ON accounts_user BEGIN "
+        "UPDATE accounts_user_trgm SET email = new.email, registration_number = coalesce(new.registration_number, '') "
+        "WHERE rowid = new.id; END"
+    ),
+    "accounts_user_trgm_delete": (
+        "AFTER DELETE ON accounts_user BEGIN "
+        "DELETE FROM accounts_user_trgm WHERE rowid = old.id; END"
+    ),
+    "accounts_profile_trgm_insert": (
+        "AFTER INSERT ON accounts_profile BEGIN "
+        "UPDATE accounts_user_trgm SET name = new.name WHERE rowid = new.user_id; END"
+    ),
+    "accounts_profile_trgm_update": (
+        "AFTER UPDATE OF name ON accounts_profile BEGIN "
+        "UPDATE accounts_user_trgm SET name = new.name WHERE rowid = new.user_id; END"
+    ),
+}
+
+
+def create_search_index(apps, schema_editor):
+    """Create the vendor-specific trigram index for user search"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # Expression indexes matching the UPPER(...) LIKE UPPER(...) that icontains generates.
+        schema_editor.execute(
+            "CREATE INDEX accounts_user_email_trgm ON accounts_user USING gin (UPPER(email::text) gin_trgm_ops)"
+        )
+        schema_editor.execute(
+            "CREATE INDEX accounts_profile_name_trgm ON accounts_profile USING gin (UPPER(name::text) gin_trgm_ops)"
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS accounts_user_trgm "
+            "USING fts5(email, name, registration_number, tokenize='trigram')"
+        )
+        # Triggers rather than signals: bulk_create imports skip signals but not triggers.
+        for name, body in SQLITE_TRIGGERS.items():
+            schema_editor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+        schema_editor.execute(
+            "INSERT INTO accounts_user_trgm (rowid, email, name, registration_number) "
+            "SELECT u.id, u.email, coalesce(p.name, ''), coalesce(u.registration_number, '') "
+            "FROM accounts_user u LEFT JOIN accounts_profile p ON p.user_id = u.id"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS accounts_user_email_trgm")
+        schema_editor.execute("DROP INDEX IF EXISTS accounts_profile_name_trgm")
+    elif vendor == 'sqlite':
+        for name in SQLITE_TRIGGERS:
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        schema_editor.execute("DROP TABLE IF EXISTS accounts_user_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_token_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, reverse_code=drop_search_index),
+    ]
@@ -45,6 +45,8 @@ class User(AbstractBaseUser, PermissionsMixin):
 	is_active = models.BooleanField(default=True)
 	is_staff = models.BooleanField(default=False)
 	date_joined = models.DateTimeField(default=timezone.now)
+	# Embedded in issued JWTs; bumping it invalidates every outstanding token for the user.
+	token_version = models.PositiveIntegerField(default=0, editable=False)
 
 	objects = UserManager()
 
@@ -55,10 +57,21 @@ class User(AbstractBaseUser, PermissionsMixin):
 		verbose_name = "user"
 		verbose_name_plural = "users"
 		ordering = ("-date_joined",)
+		indexes = [
+			models.Index(fields=["-date_joined", "-id"], name="user_joined_id_idx"),
+			models.Index(fields=["role", "-date_joined", "-id"], name="user_role_joined_idx"),
+		]
 
 	def __str__(self):
 		return self.email
 
+	def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+		# Users built from token claims defer every other column; load them all on first access.
+		if fields is not None and getattr(self, "_from_token_claims", False):
+			fields = set(fields) | self.get_deferred_fields()
+			self._from_token_claims = False
+		super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
 
 class Profile(models.Model):
 	user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="profile")
@@ -0,0 +1,91 @@
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from .models import Profile, User
+
+TRIGRAM_TABLE = "accounts_user_trgm"
+# Trigram indexes only help once the term has a whole trigram in it.
+MIN_TRIGRAM_LENGTH = 3
+
+
+def _prefix_bounds(prefix: str):
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def prefix_range(field: str, prefix: str) -> Q:
+    """``field`` starts with ``prefix``, written as a range so a plain b-tree index serves it."""
+    lower, upper = _prefix_bounds(prefix)
+    return Q(**{f"{field}__gte": lower, f"{field}__lt": upper})
+
+
+class UserSearchBackend:
+    """Substring matching on email, profile name and registration number, without an index."""
+
+    def prefix(self, qs: QuerySet, term: str) -> QuerySet:
+        return qs.filter(prefix_range("email", term.lower()) | prefix_range("registration_number", term.upper()))
+
+    def substring(self, qs: QuerySet, term: str) -> QuerySet:
+        return qs.filter(
+            Q(email__icontains=term) |
+            Q(profile__name__icontains=term) |
+            prefix_range("registration_number", term.upper())
+        )
+
+    def search(self, qs: QuerySet, term: str) -> QuerySet:
+        term = term.strip()
+        if not term:
+            return qs
+        if len(term) < MIN_TRIGRAM_LENGTH:
+            return self.prefix(qs, term)
+        return self.substring(qs, term)
+
+
+class PostgresTrigramUserSearch(UserSearchBackend):
+    """Served by the pg_trgm GIN indexes on ``upper(email)`` and ``upper(profile.name)``.
+
+    The three matches are unioned by id so each one can use its own index; OR-ing them
+    across the profile join would make the planner scan the users table.
+    """
+
+    def substring(self, qs: QuerySet, term: str) -> QuerySet:
+        pattern = f"%{connection.ops.prep_for_like_query(term)}%"
+        user_table, profile_table = User._meta.db_table, Profile._meta.db_table
+        matches = RawSQL(
+            f"SELECT id FROM {user_table} WHERE UPPER(email::text) LIKE UPPER(%s) "
+            f"UNION SELECT user_id FROM {profile_table} WHERE UPPER(name::text) LIKE UPPER(%s) "
+            f"UNION SELECT id FROM {user_table} WHERE registration_number >= %s AND registration_number < %s",
+            [pattern, pattern, *_prefix_bounds(term.upper())],
+        )
+        return qs.filter(pk__in=matches)
+
+
+class SQLiteTrigramUserSearch(UserSearchBackend):
+    """Served by an FTS5 ``trigram`` table that triggers keep in step with users and profiles."""
+
+    def substring(self, qs: QuerySet, term: str) -> QuerySet:
+        phrase = '"' + term.replace('"', '""') + '"'
+        matches = RawSQL(f"SELECT rowid FROM {TRIGRAM_TABLE} WHERE {TRIGRAM_TABLE} MATCH %s", [phrase])
+        return qs.filter(pk__in=matches)
+
+
+VENDOR_BACKENDS = {
+    'postgresql': PostgresTrigramUserSearch,
+    'sqlite': SQLiteTrigramUserSearch,
+}
+
+_backend: Optional[UserSearchBackend] = None
+
+
+def get_user_search_backend() -> UserSearchBackend:
+    global _backend
+    if _backend is None:
+        if settings.USER_SEARCH_BACKEND:
+            _backend = import_string(settings.USER_SEARCH_BACKEND)()
+        else:
+            _backend = VENDOR_BACKENDS.get(connection.vendor, UserSearchBackend)()
+    return _backend
@@ -3,9 +3,16 @@ from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 
+from core.projection import ProjectedSerializerMixin
+from .authentication import add_user_claims, check_token_version
+from .blacklist import CachedRefreshToken
 from .models import Profile
+from .exceptions import UserImportError
+from .services import TokenVersionService, UserImportService
 
 User = get_user_model()
 
@@ -27,13 +34,15 @@ class ProfileSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(ProjectedSerializerMixin, serializers.ModelSerializer):
     profile = ProfileSerializer(read_only=True)
+    name = serializers.ReadOnlyField(source="profile.name")
     
     class Meta:
         model = User
-        fields = ["id", "email", "registration_number", "role", "is_active", "date_joined", "profile"]
+        fields = ["id", "email", "name", "registration_number", "role", "is_active", "date_joined", "profile"]
         read_only_fields = ["id", "registration_number", "role", "is_active", "date_joined"]
+        summary_fields = ["id", "email", "name", "registration_number", "role", "is_active"]
 
 
 class AdminUserUpdateSerializer(serializers.ModelSerializer):
@@ -62,11 +71,11 @@ class RegisterSerializer(serializers.ModelSerializer):
 
 
 class LoginSerializer(TokenObtainPairSerializer):
+    token_class = CachedRefreshToken
+
     @classmethod
     def get_token(cls, user):
-        token = super().get_token(user)
-        token["role"] = user.role
-        return token
+        return add_user_claims(super().get_token(user), user)
 
     def validate(self, attrs):
         data = super().validate(attrs)
@@ -76,10 +85,77 @@ class LoginSerializer(TokenObtainPairSerializer):
         return data
 
 
+class RefreshSerializer(TokenRefreshSerializer):
+    """``TokenRefreshSerializer`` that parses (and blacklist-checks) the token once.
+
+    Tokens carrying the ``ver`` claim are checked against the cached token
+    version instead of loading the user: deactivation and role changes bump
+    it. Older tokens fall back to simplejwt's user lookup.
+    """
+
+    token_class = CachedRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if "ver" in refresh:
+            check_token_version(user_id, refresh["ver"])
+        elif user_id:
+            user = User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+            if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+                raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+
+        data = {"access": str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
+
+
 class LogoutSerializer(serializers.Serializer):
     refresh = serializers.CharField()
 
 
+class UserImportSerializer(serializers.Serializer):
+    MAX_ROWS = 5000
+
+    users = serializers.ListField(
+        child=serializers.DictField(child=serializers.CharField(allow_blank=True)), required=False
+    )
+    file = serializers.FileField(required=False)
+
+    def validate(self, attrs):
+        if "file" in attrs:
+            rows = self._read_csv(attrs["file"])
+        elif "users" in attrs:
+            rows = attrs["users"]
+        else:
+            raise serializers.ValidationError("Provide users or a CSV file.")
+
+        if not rows:
+            raise serializers.ValidationError("No users provided.")
+        if len(rows) > self.MAX_ROWS:
+            raise serializers.ValidationError(
+                f"At most {self.MAX_ROWS} users can be imported at once; use the import_users command for more."
+            )
+        attrs["rows"] = rows
+        return attrs
+
+    def _read_csv(self, upload):
+        try:
+            text = upload.read().decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise serializers.ValidationError({"file": "CSV file must be UTF-8 encoded."})
+        try:
+            return UserImportService.read_csv(text)
+        except UserImportError as e:
+            raise serializers.ValidationError({"file": str(e)})
+
+
 class PasswordResetRequestSerializer(serializers.Serializer):
     email = serializers.EmailField()
 
@@ -115,6 +191,7 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
         new_password = self.validated_data["new_password"]
         user.set_password(new_password)
         user.save(update_fields=["password"])
+        TokenVersionService.bump(user.pk)
         return user
 
 
@@ -1,8 +1,27 @@
-from typing import Dict, Any, List, Optional
+import csv
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Dict, Any, List, Optional, Tuple
+
+import django
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import QuerySet
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, OperationalError, transaction
+from django.db.models import F, QuerySet
+from core.database import statement_timeout
+from core.routers import read_db
+from .models import Profile
+from .search import MIN_TRIGRAM_LENGTH, get_user_search_backend
+from .signals import users_bulk_changed
 from .validators import UserValidator
-from .exceptions import UserNotFoundError
+from .exceptions import UserImportError, UserNotFoundError
 
 User = get_user_model()
 
@@ -33,7 +52,7 @@ class UserManagementService:
             qs = qs.filter(is_active=filters['active'] == 'true')
         
         if filters.get('q'):
-            qs = qs.filter(email__icontains=filters['q'])
+            qs = get_user_search_backend().search(qs, filters['q'])
         
         return qs
     
@@ -48,6 +67,7 @@ class UserManagementService:
                 setattr(target_user, field, value)
         
         target_user.save()
+        TokenVersionService.bump(target_user.pk)
         return target_user
     
     @staticmethod
@@ -55,25 +75,227 @@ class UserManagementService:
         return user.role in ['admin', 'instructor']
 
 
+class TokenVersionService:
+    """Per-user counter embedded in JWTs; tokens carrying an older value are rejected."""
+
+    ALIAS = "auth"
+    KEY = "auth:token_version:{}"
+
+    @staticmethod
+    def get(user_id: int) -> Optional[int]:
+        cache = caches[TokenVersionService.ALIAS]
+        key = TokenVersionService.KEY.format(user_id)
+        version = cache.get(key)
+        if version is None:
+            version = User.objects.filter(pk=user_id).values_list("token_version", flat=True).first()
+            if version is not None:
+                cache.set(key, version, timeout=settings.AUTH_TOKEN_VERSION_CACHE_SECONDS)
+        return version
+
+    @staticmethod
+    def bump(user_id: int) -> None:
+        User.objects.filter(pk=user_id).update(token_version=F("token_version") + 1)
+        cache = caches[TokenVersionService.ALIAS]
+        key = TokenVersionService.KEY.format(user_id)
+        cache.delete(key)
+        # Drop again after commit so a concurrent reader cannot re-cache the old value.
+        transaction.on_commit(lambda: cache.delete(key))
+
+
 class UserQueryService:
     
+    TYPEAHEAD_FIELDS = ('id', 'email', 'registration_number', 'role', 'is_active', 'profile__name')
+    
     @staticmethod
     def search_users(query: str, limit: int = 10) -> QuerySet:
-        return User.objects.filter(
-            email__icontains=query
+        return get_user_search_backend().search(
+            User.objects.using(read_db()), query
         ).order_by('email')[:limit]
     
+    @staticmethod
+    def typeahead(current_user, term: str, limit: int = 10) -> Dict[str, Any]:
+        """Up to ``limit`` users visible to ``current_user``: email and registration number
+        prefix matches first, then substring matches on email, name and registration number.
+
+        Each query is capped at ``USER_TYPEAHEAD_TIMEOUT_MS`` on PostgreSQL; when one is cancelled
+        the matches found so far come back with ``timed_out`` set."""
+        term = term.strip()
+        results: List[Dict[str, Any]] = []
+        if not term:
+            return {'results': results, 'timed_out': False}
+        
+        backend = get_user_search_backend()
+        users = UserManagementService.get_users_for_role(current_user).using(read_db())
+        fields = UserQueryService.TYPEAHEAD_FIELDS
+        try:
+            with statement_timeout(users.db, settings.USER_TYPEAHEAD_TIMEOUT_MS):
+                results += backend.prefix(users, term).order_by('email').values(*fields)[:limit]
+            if len(results) < limit and len(term) >= MIN_TRIGRAM_LENGTH:
+                with statement_timeout(users.db, settings.USER_TYPEAHEAD_TIMEOUT_MS):
+                    results += backend.substring(users, term).exclude(
+                        pk__in=[row['id'] for row in results]
+                    ).order_by('email').values(*fields)[:limit - len(results)]
+        except OperationalError:
+            return {'results': results, 'timed_out': True}
+        return {'results': results, 'timed_out': False}
+    
     @staticmethod
     def get_users_by_role(role: str) -> QuerySet:
-        return User.objects.filter(role=role).order_by('-date_joined')
+        return User.objects.using(read_db()).filter(role=role).order_by('-date_joined')
     
     @staticmethod
     def get_active_users_count() -> int:
-        return User.objects.filter(is_active=True).count()
+        return User.objects.using(read_db()).filter(is_active=True).count()
     
     @staticmethod
     def get_users_by_role_counts() -> Dict[str, int]:
         from django.db.models import Count
         
-        role_counts = User.objects.values('role').annotate(count=Count('id'))
+        role_counts = User.objects.using(read_db()).values('role').annotate(count=Count('id'))
         return {item['role']: item['count'] for item in role_counts}
+
+
+class UserImportService:
+    """Bulk account creation for onboarding.
+
+    Rows are validated and checked against existing emails in one query, passwords are
+    hashed, and users and profiles are inserted with ``bulk_create`` one batch per
+    transaction. The ``import_users`` command hashes across a process pool (PBKDF2 is
+    CPU-bound, so threads would not help); the API hashes in the request's process,
+    which never waits for workers to start.
+    """
+
+    ROLES = (User.ROLE_STUDENT, User.ROLE_INSTRUCTOR)
+    MIN_PASSWORD_LENGTH = 8
+    # Below this many passwords, starting worker processes costs more than it saves.
+    POOL_MIN_PASSWORDS = 32
+
+    @staticmethod
+    def read_csv(text: str) -> List[Dict[str, str]]:
+        rows = [row for row in csv.reader(io.StringIO(text)) if any(cell.strip() for cell in row)]
+        if not rows:
+            return []
+        header = [cell.strip().lower() for cell in rows[0]]
+        if "email" not in header:
+            raise UserImportError("The CSV needs a header row with an email column (and optionally password, role, name).")
+        return [dict(zip(header, row)) for row in rows[1:]]
+
+    @staticmethod
+    def pool_workers() -> int:
+        return settings.USER_IMPORT_HASH_WORKERS or os.cpu_count() or 1
+
+    @staticmethod
+    def hash_passwords(passwords: List[str], workers: int = 1) -> List[str]:
+        """Hash in argument order; blank passwords get an unusable hash (the user resets it).
+
+        ``workers`` above one hashes across that many spawned processes.
+        """
+        usable = [password for password in passwords if password]
+        if workers <= 1 or len(usable) < UserImportService.POOL_MIN_PASSWORDS:
+            return [make_password(password or None) for password in passwords]
+
+        workers = min(workers, len(usable))
+        # Spawned rather than forked: the caller may be a threaded server holding DB connections.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"), initializer=django.setup) as pool:
+            hashed = iter(list(pool.map(make_password, usable, chunksize=max(1, len(usable) // (workers * 4)))))
+        return [next(hashed) if password else make_password(None) for password in passwords]
+
+    @staticmethod
+    def _validate(rows: List[Dict[str, str]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        report, candidates, seen = [], [], set()
+        for index, row in enumerate(rows, start=1):
+            email = User.objects.normalize_email((row.get("email") or "").strip())
+            role = (row.get("role") or "").strip().lower() or User.ROLE_STUDENT
+            password = row.get("password") or ""
+            entry = {"row": index, "email": email}
+            report.append(entry)
+            try:
+                validate_email(email)
+            except DjangoValidationError:
+                entry["result"] = "invalid_email"
+                continue
+            if role not in UserImportService.ROLES:
+                entry["result"] = "invalid_role"
+            elif password and len(password) < UserImportService.MIN_PASSWORD_LENGTH:
+                entry["result"] = "password_too_short"
+            elif email in seen:
+                entry["result"] = "duplicate"
+            else:
+                seen.add(email)
+                candidates.append({
+                    "entry": entry, "role": role, "password": password,
+                    "name": (row.get("name") or "").strip()[:255],
+                })
+        return report, candidates
+
+    @staticmethod
+    def _insert_batch(batch: List[Dict[str, Any]]) -> None:
+        users = [User(email=item["entry"]["email"], role=item["role"], password=item["hash"]) for item in batch]
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+                Profile.objects.bulk_create([Profile(user=user, name=item["name"]) for user, item in zip(users, batch)])
+                users_bulk_changed.send(sender=User, changes=[
+                    (None, {"role": user.role, "is_active": user.is_active}) for user in users
+                ])
+        except IntegrityError:
+            # Someone registered one of these emails after the up-front check; skip it and retry the rest.
+            taken = set(User.objects.filter(email__in=[user.email for user in users]).values_list("email", flat=True))
+            if not taken:
+                raise
+            remaining = []
+            for item in batch:
+                if item["entry"]["email"] in taken:
+                    item["entry"]["result"] = "exists"
+                else:
+                    remaining.append(item)
+            if remaining:
+                UserImportService._insert_batch(remaining)
+            return
+
+        for user, item in zip(users, batch):
+            item["entry"].update(result="created", user_id=user.pk)
+
+    @staticmethod
+    def import_users(rows: List[Dict[str, str]], workers: int = 1, batch_size: int = 500) -> Dict[str, Any]:
+        """Create accounts for ``rows`` (dicts with email, password, role, name).
+
+        Returns a per-row report, a summary by result, phase timings and rows per second.
+        """
+        started = time.perf_counter()
+        report, candidates = UserImportService._validate(rows)
+        existing = set(User.objects.filter(
+            email__in=[item["entry"]["email"] for item in candidates]
+        ).values_list("email", flat=True))
+        pending = []
+        for item in candidates:
+            if item["entry"]["email"] in existing:
+                item["entry"]["result"] = "exists"
+            else:
+                pending.append(item)
+        validated = time.perf_counter()
+
+        hashes = UserImportService.hash_passwords([item["password"] for item in pending], workers)
+        for item, hashed in zip(pending, hashes):
+            item["hash"] = hashed
+        hashed_at = time.perf_counter()
+
+        for start in range(0, len(pending), batch_size):
+            UserImportService._insert_batch(pending[start:start + batch_size])
+        finished = time.perf_counter()
+
+        summary = {}
+        for entry in report:
+            summary[entry["result"]] = summary.get(entry["result"], 0) + 1
+        elapsed = finished - started
+        return {
+            "summary": summary,
+            "rows": report,
+            "timings": {
+                "validate_seconds": round(validated - started, 3),
+                "hash_seconds": round(hashed_at - validated, 3),
+                "insert_seconds": round(finished - hashed_at, 3),
+                "total_seconds": round(elapsed, 3),
+            },
+            "rows_per_second": round(len(report) / elapsed, 1) if elapsed else None,
+        }
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Sent after bulk writes that bypass post_save/post_delete.
+# ``changes`` is a list of (old_state, new_state) pairs; each state is None or a
+# dict with ``role`` and ``is_active``.
+users_bulk_changed = Signal()
@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from core.testing import QueryCountAssertionsMixin
+
+from .serializers import LoginSerializer
+from .services import UserManagementService
+
+User = get_user_model()
+
+
+class UserListQueryTests(QueryCountAssertionsMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", role=User.ROLE_ADMIN)
+        for n in range(20):
+            User.objects.create_user(email=f"student{n}@example.com")
+
+    def setUp(self):
+        self.client.force_authenticate(self.admin)
+
+    def test_user_list(self):
+        self.assertConstantListQueries("/api/auth/users/")
+
+    def test_user_list_keyset(self):
+        self.assertConstantListQueries("/api/auth/users/", params={"pagination": "cursor"})
+
+    def test_user_list_summary(self):
+        self.assertConstantListQueries("/api/auth/users/", params={"view": "summary"})
+
+
+class RefreshTests(APITestCase):
+    def setUp(self):
+        caches["auth"].clear()
+        self.user = User.objects.create_user(email="student@example.com")
+        self.admin = User.objects.create_user(email="admin@example.com", role=User.ROLE_ADMIN)
+        self.refresh = str(LoginSerializer.get_token(self.user))
+
+    def post_refresh(self, token):
+        return self.client.post("/api/auth/refresh/", {"refresh": token}, format="json")
+
+    def test_refresh_does_not_load_the_user(self):
+        self.post_refresh(str(LoginSerializer.get_token(self.user)))  # warm the version and blacklist caches
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post_refresh(self.refresh)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("refresh", response.data)
+        user_table = User._meta.db_table
+        self.assertFalse([q["sql"] for q in queries if f'FROM "{user_table}"' in q["sql"]])
+
+    def test_rotated_token_is_rejected(self):
+        self.assertEqual(self.post_refresh(self.refresh).status_code, 200)
+        self.assertEqual(self.post_refresh(self.refresh).status_code, 401)
+
+    def test_deactivated_user_cannot_refresh(self):
+        UserManagementService.update_user(self.admin, self.user.pk, {"is_active": False})
+        self.assertEqual(self.post_refresh(self.refresh).status_code, 401)
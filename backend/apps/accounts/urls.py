@@ -3,8 +3,11 @@ from django.urls import path
 from .views import (
 	LoginView,
 	LogoutView,
+    AdminUserExportView,
+    AdminUserImportView,
     AdminUserListView,
     AdminUserUpdateView,
+    UserTypeaheadView,
 	PasswordResetConfirmView,
 	PasswordResetRequestView,
 	RefreshView,
@@ -19,5 +22,8 @@ urlpatterns = [
 	path("forgot-password/", PasswordResetRequestView.as_view(), name="forgot_password"),
 	path("reset-password/", PasswordResetConfirmView.as_view(), name="reset_password"),
     path("users/", AdminUserListView.as_view(), name="admin-users"),
+    path("users/export/", AdminUserExportView.as_view(), name="admin-users-export"),
+    path("users/import/", AdminUserImportView.as_view(), name="admin-users-import"),
+    path("users/typeahead/", UserTypeaheadView.as_view(), name="admin-users-typeahead"),
     path("users/<int:pk>/", AdminUserUpdateView.as_view(), name="admin-user-update"),
 ]
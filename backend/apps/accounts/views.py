@@ -1,12 +1,17 @@
 from django.contrib.auth import get_user_model
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from apps.notifications.services import EmailOutboxService
+from core.exports import StreamingExportMixin
+from core.middleware import SerializationTimingMixin
+from core.prefetch import PrefetchPlanMixin
+from core.projection import ProjectionMixin
+from core.routers import read_db
+
+from .blacklist import CachedRefreshToken
 from .serializers import (
     AdminUserUpdateSerializer,
     LoginSerializer,
@@ -14,11 +19,13 @@ from .serializers import (
     PasswordResetConfirmSerializer,
     PasswordResetRequestSerializer,
     ProfileSerializer,
+    RefreshSerializer,
     RegisterSerializer,
+    UserImportSerializer,
     UserSerializer,
     build_password_reset_payload,
 )
-from .services import UserManagementService, UserQueryService
+from .services import UserImportService, UserManagementService, UserQueryService
 from .exceptions import (
     UserValidationError,
     PermissionDeniedError,
@@ -46,6 +53,7 @@ class LoginView(TokenObtainPairView):
 
 class RefreshView(TokenRefreshView):
     permission_classes = [permissions.AllowAny]
+    serializer_class = RefreshSerializer
 
 
 class LogoutView(APIView):
@@ -56,7 +64,7 @@ class LogoutView(APIView):
         serializer.is_valid(raise_exception=True)
         refresh_token = serializer.validated_data["refresh"]
         try:
-            token = RefreshToken(refresh_token)
+            token = CachedRefreshToken(refresh_token)
             token.blacklist()
         except Exception:
             return Response({"detail": "Invalid token."}, status=status.HTTP_400_BAD_REQUEST)
@@ -70,13 +78,15 @@ class PasswordResetRequestView(APIView):
         serializer = PasswordResetRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.instance
-        if user and user.is_active:
-            payload = build_password_reset_payload(user)
-            context = {"uid": payload["uid"], "token": payload["token"], "email": user.email}
-            subject = "Password reset request"
-            body = render_to_string("emails/password_reset.txt", context=context)
-            email = EmailMultiAlternatives(subject, body, to=[user.email])
-            email.send()
+        known = user is not None and user.is_active
+        context = {"email": user.email if known else serializer.validated_data["email"]}
+        if known:
+            context.update(build_password_reset_payload(user))
+        # Unknown addresses are queued too, for the worker to drop, so both cases write the same row and
+        # take the same time. Delivery happens in send_queued_emails so the response never waits on SMTP.
+        EmailOutboxService.enqueue(
+            context["email"], "Password reset request", "emails/password_reset.txt", context, drop=not known
+        )
         return Response({"detail": "If the email exists, a reset link has been sent."})
 
 
@@ -90,7 +100,7 @@ class PasswordResetConfirmView(APIView):
         return Response({"detail": "Password has been reset."})
 
 
-class ProfileView(generics.RetrieveUpdateAPIView):
+class ProfileView(SerializationTimingMixin, generics.RetrieveUpdateAPIView):
     serializer_class = ProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -114,9 +124,10 @@ class IsAdminOrInstructorRole(permissions.BasePermission):
         )
 
 
-class AdminUserListView(generics.ListAPIView):
+class AdminUserListView(SerializationTimingMixin, PrefetchPlanMixin, ProjectionMixin, generics.ListAPIView):
     serializer_class = UserSerializer
     permission_classes = [IsAdminOrInstructorRole]
+    keyset_ordering = "-date_joined"
 
     def get_queryset(self):
         filters = {
@@ -127,7 +138,61 @@ class AdminUserListView(generics.ListAPIView):
         return UserManagementService.get_users_for_role(self.request.user, filters)
 
 
-class AdminUserUpdateView(generics.UpdateAPIView):
+class AdminUserExportView(StreamingExportMixin, AdminUserListView):
+    export_filename = "users"
+    export_columns = (
+        ("id", "id"),
+        ("email", "email"),
+        ("name", "profile__name"),
+        ("registration_number", "registration_number"),
+        ("role", "role"),
+        ("is_active", "is_active"),
+        ("date_joined", "date_joined"),
+    )
+
+    def get_queryset(self):
+        return super().get_queryset().using(read_db()).order_by("-date_joined", "-id")
+
+
+class UserTypeaheadView(APIView):
+    """Top matches for a partial email, name or registration number, for search-as-you-type."""
+
+    permission_classes = [IsAdminOrInstructorRole]
+    MAX_LIMIT = 25
+
+    def get(self, request):
+        try:
+            limit = min(max(int(request.query_params.get("limit") or 10), 1), self.MAX_LIMIT)
+        except ValueError:
+            return Response({"limit": "Must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        data = UserQueryService.typeahead(request.user, request.query_params.get("q", ""), limit)
+        data["results"] = [
+            {
+                "id": row["id"],
+                "email": row["email"],
+                "name": row["profile__name"] or "",
+                "registration_number": row["registration_number"],
+                "role": row["role"],
+                "is_active": row["is_active"],
+            }
+            for row in data["results"]
+        ]
+        return Response(data)
+
+
+class AdminUserImportView(APIView):
+    """Create students and instructors in bulk from a CSV upload or a JSON list."""
+
+    permission_classes = [IsAdminRole]
+
+    def post(self, request):
+        serializer = UserImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        report = UserImportService.import_users(serializer.validated_data["rows"])
+        return Response(report, status=status.HTTP_200_OK)
+
+
+class AdminUserUpdateView(SerializationTimingMixin, generics.UpdateAPIView):
     serializer_class = AdminUserUpdateSerializer
     permission_classes = [IsAdminOrInstructorRole]
     queryset = User.objects.all()
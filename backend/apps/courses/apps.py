@@ -5,3 +5,11 @@ class CoursesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.courses"
     label = "courses"
+
+    def ready(self):
+        from core.metrics import registry
+
+        from . import signals  # noqa: F401
+        from .cache import CatalogCache
+
+        registry.register_collector(CatalogCache.prometheus_lines)
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+
+class CatalogCache:
+    """Read-through cache for serialized published-catalog pages.
+
+    Keys embed a catalog version; any course or category write bumps the
+    version so every previously cached page becomes unreachable at once.
+    """
+
+    ALIAS = "catalog"
+    VERSION_KEY = "catalog:version"
+
+    _lock = threading.Lock()
+    _stats = {"hits": 0, "misses": 0, "sets": 0, "skipped": 0, "invalidations": 0}
+
+    @staticmethod
+    def _cache():
+        return caches[CatalogCache.ALIAS]
+
+    @staticmethod
+    def _record(stat: str) -> None:
+        with CatalogCache._lock:
+            CatalogCache._stats[stat] += 1
+
+    @staticmethod
+    def get_version() -> int:
+        cache = CatalogCache._cache()
+        version = cache.get(CatalogCache.VERSION_KEY)
+        if version is None:
+            # Seed from the clock so an evicted counter never reuses an old version.
+            cache.add(CatalogCache.VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(CatalogCache.VERSION_KEY)
+        return version
+
+    @staticmethod
+    def bump_version() -> None:
+        cache = CatalogCache._cache()
+        try:
+            cache.incr(CatalogCache.VERSION_KEY)
+        except ValueError:
+            cache.set(CatalogCache.VERSION_KEY, time.time_ns(), timeout=None)
+        CatalogCache._record("invalidations")
+
+    @staticmethod
+    def invalidate() -> None:
+        transaction.on_commit(CatalogCache.bump_version)
+
+    @staticmethod
+    def key_for(request) -> str:
+        params = sorted(request.query_params.lists())
+        raw = json.dumps([request.get_host(), request.path, params])
+        digest = hashlib.sha1(raw.encode()).hexdigest()
+        return f"catalog:v{CatalogCache.get_version()}:{digest}"
+
+    @staticmethod
+    def get(key: str) -> Optional[Any]:
+        data = CatalogCache._cache().get(key)
+        CatalogCache._record("misses" if data is None else "hits")
+        return data
+
+    @staticmethod
+    def set(key: str, data: Any) -> bool:
+        size = len(json.dumps(data, cls=DjangoJSONEncoder))
+        if size > settings.CATALOG_CACHE_MAX_PAGE_BYTES:
+            CatalogCache._record("skipped")
+            return False
+        CatalogCache._cache().set(key, data)
+        CatalogCache._record("sets")
+        return True
+
+    @staticmethod
+    def stats() -> Dict[str, Any]:
+        with CatalogCache._lock:
+            stats = dict(CatalogCache._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["version"] = CatalogCache.get_version()
+        return stats
+
+    @staticmethod
+    def prometheus_lines():
+        with CatalogCache._lock:
+            stats = dict(CatalogCache._stats)
+        lines = [
+            "# HELP lms_catalog_cache_events_total Catalog cache events by kind",
+            "# TYPE lms_catalog_cache_events_total counter",
+        ]
+        for event, count in sorted(stats.items()):
+            lines.append(f'lms_catalog_cache_events_total{{event="{event}"}} {count}')
+        return lines
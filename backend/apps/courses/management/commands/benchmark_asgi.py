@@ -0,0 +1,174 @@
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from apps.accounts.serializers import LoginSerializer
+
+User = get_user_model()
+
+DEFAULT_PATHS = ("/api/courses/", "/api/courses/?search=python", "/api/dashboard/summary/", "/api/my-courses/")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare requests/sec of the WSGI views against the async ASGI views. "
+        "With --spawn both are served by uvicorn (WSGI interface vs. core.asgi); "
+        "otherwise point --wsgi-url and --asgi-url at servers you started yourself."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wsgi-url", default="http://127.0.0.1:8100")
+        parser.add_argument("--asgi-url", default="http://127.0.0.1:8101")
+        parser.add_argument("--spawn", action="store_true", help="Start both servers with uvicorn for the run")
+        parser.add_argument("--workers", type=int, default=1, help="Server worker processes when spawning")
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--duration", type=float, default=10.0, help="Seconds per endpoint and server")
+        parser.add_argument("--email", help="Account to authenticate as (default: the student with most enrollments)")
+        parser.add_argument("--path", action="append", dest="paths", help="Endpoint to load; repeatable")
+
+    def handle(self, *args, **options):
+        token = self._token(options["email"])
+        paths = options["paths"] or DEFAULT_PATHS
+        servers = {"wsgi": options["wsgi_url"], "asgi": options["asgi_url"]}
+
+        processes = self._spawn(servers, options["workers"]) if options["spawn"] else []
+        try:
+            results = {}
+            for name, base_url in servers.items():
+                for path in paths:
+                    results[(name, path)] = asyncio.run(
+                        self._load(base_url, path, token, options["concurrency"], options["duration"])
+                    )
+                    self._print(name, path, results[(name, path)])
+        finally:
+            for process in processes:
+                process.terminate()
+                process.wait(timeout=10)
+
+        self.stdout.write("\nASGI vs WSGI throughput:")
+        for path in paths:
+            wsgi, asgi = results[("wsgi", path)]["rps"], results[("asgi", path)]["rps"]
+            change = (asgi / wsgi - 1) * 100 if wsgi else 0.0
+            self.stdout.write(f"{path:>40}: {wsgi:8.1f} -> {asgi:8.1f} req/s ({change:+.1f}%)")
+
+    def _token(self, email):
+        if email:
+            user = User.objects.filter(email=email).first()
+        else:
+            user = User.objects.filter(role=User.ROLE_STUDENT, is_active=True).annotate(
+                enrollment_total=Count("enrollments")
+            ).order_by("-enrollment_total").first()
+        if user is None:
+            raise CommandError("No user to authenticate as; run seed_synthetic or pass --email.")
+        return str(LoginSerializer.get_token(user).access_token)
+
+    def _spawn(self, servers, workers):
+        apps = {"wsgi": ["core.wsgi:application", "--interface", "wsgi"], "asgi": ["core.asgi:application"]}
+        processes = []
+        for name, base_url in servers.items():
+            url = urlsplit(base_url)
+            env = dict(os.environ, ASYNC_READ_VIEWS="true" if name == "asgi" else "false")
+            command = [
+                sys.executable, "-m", "uvicorn", *apps[name],
+                "--host", url.hostname, "--port", str(url.port),
+                "--workers", str(workers), "--no-access-log", "--log-level", "warning",
+            ]
+            processes.append(subprocess.Popen(command, cwd=settings.BASE_DIR, env=env))
+        for base_url in servers.values():
+            self._wait_until_listening(base_url)
+        return processes
+
+    def _wait_until_listening(self, base_url, timeout=30.0):
+        url = urlsplit(base_url)
+        deadline = time.monotonic() + timeout
+
+        async def probe():
+            _, writer = await asyncio.open_connection(url.hostname, url.port)
+            writer.close()
+
+        while time.monotonic() < deadline:
+            try:
+                asyncio.run(probe())
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise CommandError(f"Server at {base_url} did not start within {timeout:.0f}s")
+
+    async def _load(self, base_url, path, token, concurrency, duration):
+        url = urlsplit(base_url)
+        request = (
+            f"GET {path} HTTP/1.1\r\nHost: {url.netloc}\r\n"
+            f"Authorization: Bearer {token}\r\nAccept: application/json\r\n\r\n"
+        ).encode()
+        latencies = []
+        errors = 0
+        deadline = time.perf_counter() + duration
+
+        async def client():
+            nonlocal errors
+            reader, writer = await asyncio.open_connection(url.hostname, url.port)
+            try:
+                while time.perf_counter() < deadline:
+                    start = time.perf_counter()
+                    writer.write(request)
+                    status, keep_alive = await self._read_response(reader)
+                    latencies.append(time.perf_counter() - start)
+                    if status != 200:
+                        errors += 1
+                    if not keep_alive:
+                        writer.close()
+                        reader, writer = await asyncio.open_connection(url.hostname, url.port)
+            finally:
+                writer.close()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        count = len(latencies)
+        return {
+            "requests": count,
+            "errors": errors,
+            "rps": count / elapsed if elapsed else 0.0,
+            "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+            "p95_ms": latencies[int(0.95 * (count - 1))] * 1000 if latencies else 0.0,
+        }
+
+    async def _read_response(self, reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise CommandError("Server closed the connection")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                await reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        else:
+            await reader.readexactly(int(headers.get("content-length", 0)))
+        return status, headers.get("connection", "").lower() != "close"
+
+    def _print(self, server, path, result):
+        self.stdout.write(
+            f"{server} {path:>40}: {result['rps']:8.1f} req/s  p50={result['p50_ms']:7.2f}ms  "
+            f"p95={result['p95_ms']:7.2f}ms  requests={result['requests']}  errors={result['errors']}"
+        )
@@ -0,0 +1,86 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.courses.models import Course, CourseCategory
+from apps.courses.search import CourseSearchBackend, get_search_backend
+
+User = get_user_model()
+
+WORDS = (
+    "python django algebra calculus finance marketing physics chemistry biology history "
+    "literature painting music spanish french german statistics databases networks security "
+    "robotics circuits design management accounting economics philosophy poetry anatomy nutrition"
+).split()
+
+
+class Command(BaseCommand):
+    help = "Compare course search latency of the full-text backend against icontains on synthetic data"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--courses", type=int, default=100000)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--terms", nargs="+", default=["python", "data", "music history", "zzzz"])
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        baseline = CourseSearchBackend()
+
+        # Everything runs in a transaction that is rolled back, so the synthetic rows never persist.
+        with transaction.atomic():
+            self._seed(options["courses"])
+            start = time.perf_counter()
+            backend.rebuild()
+            self.stdout.write(f"Indexed {options['courses']} courses in {time.perf_counter() - start:.2f}s "
+                              f"with {type(backend).__name__}")
+
+            published = Course.objects.filter(status=Course.STATUS_PUBLISHED).order_by("-created_at")
+            for term in options["terms"]:
+                for name, search in (("icontains", baseline), ("fulltext", backend)):
+                    timings, count = self._measure(search, published, term, options["repeat"])
+                    self.stdout.write(
+                        f"{term!r:>16} {name:>10}: {count:>7} hits  "
+                        f"p50={statistics.median(timings):8.2f}ms  "
+                        f"p95={self._percentile(timings, 95):8.2f}ms"
+                    )
+
+            transaction.set_rollback(True)
+
+    def _seed(self, total):
+        rng = random.Random(42)
+        instructor = User.objects.create_user(
+            email=f"bench-instructor-{time.time_ns()}@example.com", password=None, role=User.ROLE_INSTRUCTOR
+        )
+        category, _ = CourseCategory.objects.get_or_create(name="Benchmark")
+        batch = []
+        for n in range(total):
+            batch.append(Course(
+                title=" ".join(rng.sample(WORDS, 3)).title(),
+                description=" ".join(rng.choices(WORDS, k=60)),
+                category=category,
+                instructor=instructor,
+                status=Course.STATUS_PUBLISHED if n % 5 else Course.STATUS_DRAFT,
+            ))
+            if len(batch) == 5000:
+                Course.objects.bulk_create(batch)
+                batch = []
+        Course.objects.bulk_create(batch)
+
+    def _measure(self, backend, qs, term, repeat):
+        timings = []
+        count = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = backend.search(qs, term)
+            count = results.count()
+            list(results[:20])
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings, count
+
+    def _percentile(self, values, pct):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
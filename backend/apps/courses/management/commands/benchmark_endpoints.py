@@ -0,0 +1,160 @@
+import json
+import statistics
+import time
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count, Exists, OuterRef
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from apps.accounts.serializers import LoginSerializer
+from apps.courses.models import Course
+from apps.enrollments.models import Enrollment, EnrollmentRequest
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Measure p50/p95 latency and query counts of the key API endpoints and compare against a baseline"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2, help="Unmeasured requests per scenario")
+        parser.add_argument("--output", help="Write results as a JSON baseline to this path")
+        parser.add_argument("--compare", help="Compare results against a JSON baseline at this path")
+        parser.add_argument(
+            "--tolerance", type=float, default=0.2,
+            help="Allowed relative p95 slowdown before a scenario counts as regressed"
+        )
+        parser.add_argument("--search", default="python", help="Search term for the course search scenario")
+
+    def handle(self, *args, **options):
+        scenarios = self._scenarios(options["search"])
+        if not scenarios:
+            raise CommandError("No data to benchmark; run seed_synthetic first.")
+
+        results = {}
+        with override_settings(ALLOWED_HOSTS=["testserver"]):
+            for name, (user, method, path, data) in scenarios.items():
+                results[name] = self._measure(user, method, path, data, options["iterations"], options["warmup"])
+                self._print(name, results[name])
+
+        report = {
+            "generated_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "iterations": options["iterations"],
+            "results": results,
+        }
+
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(report, indent=2))
+            self.stdout.write(self.style.SUCCESS(f"\nBaseline written to {options['output']}"))
+
+        if options["compare"]:
+            baseline = json.loads(Path(options["compare"]).read_text())
+            regressions = self._compare(baseline["results"], results, options["tolerance"])
+            if regressions:
+                raise CommandError(f"{len(regressions)} scenario(s) regressed: {', '.join(regressions)}")
+            self.stdout.write(self.style.SUCCESS("\nNo regressions against baseline"))
+
+    def _scenarios(self, search_term):
+        admin = User.objects.filter(role=User.ROLE_ADMIN, is_active=True).first()
+        instructor = User.objects.filter(role=User.ROLE_INSTRUCTOR, is_active=True).annotate(
+            course_total=Count("courses")
+        ).order_by("-course_total").first()
+        student = User.objects.filter(role=User.ROLE_STUDENT, is_active=True).annotate(
+            enrollment_total=Count("enrollments")
+        ).order_by("-enrollment_total").first()
+
+        scenarios = {}
+        if student:
+            scenarios["course_list"] = (student, "get", "/api/courses/", None)
+            scenarios["course_search"] = (student, "get", "/api/courses/", {"search": search_term})
+            scenarios["dashboard_student"] = (student, "get", "/api/dashboard/summary/", None)
+            scenarios["my_courses_student"] = (student, "get", "/api/my-courses/", None)
+            course = Course.objects.filter(status=Course.STATUS_PUBLISHED).exclude(
+                enrollments__student=student
+            ).first()
+            if course:
+                scenarios["enroll"] = (student, "post", f"/api/enroll/{course.id}/", None)
+        if instructor:
+            scenarios["dashboard_instructor"] = (instructor, "get", "/api/dashboard/summary/", None)
+            scenarios["my_courses_instructor"] = (instructor, "get", "/api/my-courses/", None)
+            pending = EnrollmentRequest.objects.filter(
+                instructor=instructor, status=EnrollmentRequest.STATUS_PENDING
+            ).exclude(
+                Exists(Enrollment.objects.filter(student_id=OuterRef("student_id"), course_id=OuterRef("course_id")))
+            ).first()
+            if pending:
+                scenarios["approve_request"] = (
+                    instructor, "post", f"/api/enrollment-requests/{pending.id}/action/", {"action": "approve"}
+                )
+        if admin:
+            scenarios["dashboard_admin"] = (admin, "get", "/api/dashboard/summary/", None)
+            scenarios["admin_users"] = (admin, "get", "/api/auth/users/", None)
+        return scenarios
+
+    def _measure(self, user, method, path, data, iterations, warmup):
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {LoginSerializer.get_token(user).access_token}")
+        timings = []
+        queries = []
+        status = None
+        for iteration in range(warmup + iterations):
+            # Writes are rolled back so every iteration sees the same starting state.
+            with transaction.atomic():
+                with CaptureQueriesContext(connection) as captured:
+                    start = time.perf_counter()
+                    if method == "get":
+                        response = client.get(path, data)
+                    else:
+                        response = client.post(path, data or {}, content_type="application/json")
+                    timings.append((time.perf_counter() - start) * 1000)
+                transaction.set_rollback(True)
+            status = response.status_code
+            if iteration < warmup:
+                timings.pop()
+                continue
+            queries.append(len(captured))
+
+        timings.sort()
+        return {
+            "path": path,
+            "method": method.upper(),
+            "status": status,
+            "p50_ms": round(statistics.median(timings), 3),
+            "p95_ms": round(timings[min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))], 3),
+            "mean_ms": round(statistics.fmean(timings), 3),
+            "queries": max(queries),
+        }
+
+    def _print(self, name, result):
+        self.stdout.write(
+            f"{name:>24}: {result['method']:>4} {result['status']}  p50={result['p50_ms']:8.2f}ms  "
+            f"p95={result['p95_ms']:8.2f}ms  queries={result['queries']}"
+        )
+
+    def _compare(self, baseline, results, tolerance):
+        regressions = []
+        self.stdout.write("\nComparison against baseline:")
+        for name, result in results.items():
+            previous = baseline.get(name)
+            if previous is None:
+                self.stdout.write(f"{name:>24}: new scenario")
+                continue
+            slower = result["p95_ms"] > previous["p95_ms"] * (1 + tolerance)
+            chattier = result["queries"] > previous["queries"]
+            change = (result["p95_ms"] / previous["p95_ms"] - 1) * 100 if previous["p95_ms"] else 0.0
+            line = (
+                f"{name:>24}: p95 {previous['p95_ms']:.2f} -> {result['p95_ms']:.2f}ms ({change:+.1f}%)  "
+                f"queries {previous['queries']} -> {result['queries']}"
+            )
+            if slower or chattier:
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+        return regressions
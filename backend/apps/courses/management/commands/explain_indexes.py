@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.services import UserQueryService
+from apps.courses.models import Course, CourseCategory
+from apps.courses.services import CourseQueryService
+from apps.enrollments.models import EnrollmentRequest
+from apps.enrollments.services import EnrollmentQueryService, EnrollmentRequestService
+from core.testing import explain_plan, planned_index
+
+User = get_user_model()
+
+
+def service_querysets():
+    """(label, queryset, indexes the plan may use) for each hot list query."""
+    # EXPLAIN needs no matching rows, only saved-looking instances to filter on.
+    student, instructor = User(pk=1), User(pk=1)
+    course, category = Course(pk=1), CourseCategory(pk=1)
+    return [
+        ("published catalog", CourseQueryService.get_published_courses(),
+         ("course_status_created_idx",)),
+        ("published catalog by category", CourseQueryService.get_published_courses({"category": category.pk}),
+         ("course_published_cat_idx",)),
+        ("instructor courses", CourseQueryService.get_courses_for_instructor(instructor),
+         ("course_instr_created_idx",)),
+        ("student enrollments", EnrollmentQueryService.get_student_enrollments(student),
+         ("enroll_student_enrolled_idx", "enroll_student_status_idx")),
+        ("student enrollments by status", EnrollmentQueryService.get_student_enrollments(student, "active"),
+         ("enroll_student_status_idx",)),
+        ("course enrollments by status", EnrollmentQueryService.get_course_enrollments(course, "active"),
+         ("enroll_course_status_idx",)),
+        ("instructor requests by status", EnrollmentRequestService.get_instructor_requests(instructor, "pending"),
+         ("enrollreq_instr_status_idx",)),
+        ("pending requests of a course",
+         EnrollmentRequest.objects.filter(course_id=course.pk, status="pending").order_by("id"),
+         ("enrollreq_pending_course_idx",)),
+        ("user search", UserQueryService.search_users("examp"),
+         ("accounts_user_email_trgm", "accounts_user_trgm")),
+    ]
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the course, enrollment and request list querysets and check each one is served by its index"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verbose-plans", action="store_true", help="Print the full plan for every query")
+        parser.add_argument(
+            "--no-seqscan", action="store_true",
+            help="PostgreSQL: discourage sequential scans, which small tables otherwise prefer",
+        )
+
+    def handle(self, *args, **options):
+        missing = []
+        for label, queryset, indexes in service_querysets():
+            plan = explain_plan(queryset, options["no_seqscan"])
+            used = planned_index(plan, indexes)
+            if used:
+                self.stdout.write(f"{label:>32}: {self.style.SUCCESS(used)}")
+            else:
+                missing.append(label)
+                self.stdout.write(f"{label:>32}: {self.style.ERROR('no index from ' + ', '.join(indexes))}")
+            if options["verbose_plans"] or not used:
+                self.stdout.write("    " + plan.replace("\n", "\n    "))
+
+        if missing:
+            raise CommandError(f"{len(missing)} queries are not using their index: {', '.join(missing)}")
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.courses.services import CourseCounterService
+
+
+class Command(BaseCommand):
+    help = "Recount Course enrollment counters and CourseCategory course counts that drifted from the source rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report drift without fixing it")
+
+    def handle(self, *args, **options):
+        drift = CourseCounterService.reconcile(dry_run=options["dry_run"])
+        verb = "Found" if options["dry_run"] else "Fixed"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {drift['courses']} courses and {drift['categories']} categories with stale counters"
+        ))
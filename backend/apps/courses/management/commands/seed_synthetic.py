@@ -0,0 +1,181 @@
+import random
+from datetime import timedelta
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.models import Profile
+from apps.courses.cache import CatalogCache
+from apps.courses.models import Course, CourseCategory
+from apps.courses.search import get_search_backend
+from apps.courses.services import CourseCounterService
+from apps.dashboard.services import DashboardSnapshotService, EnrollmentRollupService, InstructorStatsService
+from apps.enrollments.models import Enrollment, EnrollmentRequest
+
+User = get_user_model()
+
+WORDS = (
+    "introduction advanced applied modern practical foundations python django algebra calculus "
+    "finance marketing physics chemistry biology history literature music spanish statistics "
+    "databases networks security robotics design management accounting economics philosophy anatomy"
+).split()
+
+ENROLLMENT_STATUSES = ((Enrollment.STATUS_ACTIVE, 85), (Enrollment.STATUS_CANCELLED, 15))
+REQUEST_STATUSES = (
+    (EnrollmentRequest.STATUS_PENDING, 60),
+    (EnrollmentRequest.STATUS_APPROVED, 25),
+    (EnrollmentRequest.STATUS_REJECTED, 15),
+)
+COURSE_STATUSES = ((Course.STATUS_PUBLISHED, 75), (Course.STATUS_DRAFT, 20), (Course.STATUS_ARCHIVED, 5))
+
+
+class Command(BaseCommand):
+    help = "Bulk-generate skewed synthetic users, courses, enrollments and enrollment requests"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--students", type=int, default=1000)
+        parser.add_argument("--instructors", type=int, default=50)
+        parser.add_argument("--courses", type=int, default=500)
+        parser.add_argument("--enrollments", type=int, default=10000)
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--days", type=int, default=365, help="Spread timestamps over this many past days")
+        parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent for course/instructor popularity")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--prefix", default="synthetic", help="Email prefix for generated accounts")
+        parser.add_argument("--password", default="synthetic-pass-123")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.now = timezone.now()
+        self.days = options["days"]
+        self.batch_size = options["batch_size"]
+        prefix = options["prefix"]
+
+        if User.objects.filter(email__startswith=f"{prefix}.").exists():
+            raise CommandError(f"Accounts with prefix '{prefix}' already exist; pass a different --prefix.")
+
+        if not CourseCategory.objects.exists():
+            call_command("seed_categories", stdout=self.stdout)
+        categories = list(CourseCategory.objects.values_list("id", flat=True))
+
+        with transaction.atomic():
+            # Hash once; every synthetic account shares the same password.
+            password = make_password(options["password"])
+            instructors = self._create_users(prefix, "instructor", options["instructors"], password)
+            students = self._create_users(prefix, "student", options["students"], password)
+            courses = self._create_courses(options["courses"], instructors, categories, options["skew"])
+            enrollments = self._create_enrollments(options["enrollments"], students, courses, options["skew"])
+            requests = self._create_requests(options["requests"], students, courses, options["skew"])
+
+        # Bulk inserts skip model signals, so rebuild everything derived from them.
+        DashboardSnapshotService.rebuild()
+        InstructorStatsService.rebuild()
+        CourseCounterService.reconcile()
+        # Seeded rows are backdated behind the rollup watermark.
+        EnrollmentRollupService.rebuild()
+        get_search_backend().rebuild()
+        CatalogCache.bump_version()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(instructors)} instructors, {len(students)} students, {len(courses)} courses, "
+            f"{enrollments} enrollments and {requests} enrollment requests"
+        ))
+
+    def _weights(self, count, skew):
+        return list(accumulate(1 / (rank ** skew) for rank in range(1, count + 1)))
+
+    def _pick_status(self, choices):
+        statuses, weights = zip(*choices)
+        return self.rng.choices(statuses, weights=weights)[0]
+
+    def _past(self):
+        return self.now - timedelta(seconds=self.rng.randint(0, self.days * 86400))
+
+    def _create_users(self, prefix, role, count, password):
+        users = [
+            User(
+                email=f"{prefix}.{role}{n}@example.com",
+                password=password,
+                role=role,
+                date_joined=self._past(),
+            )
+            for n in range(count)
+        ]
+        users = User.objects.bulk_create(users, batch_size=self.batch_size)
+        Profile.objects.bulk_create(
+            [Profile(user=user, name=f"{role.title()} {n}") for n, user in enumerate(users)],
+            batch_size=self.batch_size,
+        )
+        return users
+
+    def _create_courses(self, count, instructors, categories, skew):
+        if not instructors:
+            return []
+        weights = self._weights(len(instructors), skew)
+        courses = [
+            Course(
+                title=" ".join(self.rng.sample(WORDS, 3)).title(),
+                description=" ".join(self.rng.choices(WORDS, k=self.rng.randint(20, 120))),
+                category_id=self.rng.choice(categories),
+                instructor=self.rng.choices(instructors, cum_weights=weights)[0],
+                status=self._pick_status(COURSE_STATUSES),
+            )
+            for _ in range(count)
+        ]
+        courses = Course.objects.bulk_create(courses, batch_size=self.batch_size)
+        self._backdate(courses, "created_at")
+        return courses
+
+    def _unique_pairs(self, count, students, courses, skew):
+        if not students or not courses:
+            return []
+        count = min(count, len(students) * len(courses))
+        weights = self._weights(len(courses), skew)
+        pairs = set()
+        attempts = 0
+        while len(pairs) < count and attempts < count * 20:
+            attempts += 1
+            course = self.rng.choices(courses, cum_weights=weights)[0]
+            pairs.add((self.rng.choice(students), course))
+        return list(pairs)
+
+    def _create_enrollments(self, count, students, courses, skew):
+        enrollments = [
+            Enrollment(student=student, course=course, status=self._pick_status(ENROLLMENT_STATUSES))
+            for student, course in self._unique_pairs(count, students, courses, skew)
+        ]
+        enrollments = Enrollment.objects.bulk_create(enrollments, batch_size=self.batch_size)
+        self._backdate(enrollments, "enrolled_at")
+        cancelled = [enrollment for enrollment in enrollments if enrollment.status == Enrollment.STATUS_CANCELLED]
+        for enrollment in cancelled:
+            enrollment.cancelled_at = enrollment.enrolled_at + (self.now - enrollment.enrolled_at) * self.rng.random()
+        Enrollment.objects.bulk_update(cancelled, ["cancelled_at"], batch_size=self.batch_size)
+        return len(enrollments)
+
+    def _create_requests(self, count, students, courses, skew):
+        requests = [
+            EnrollmentRequest(
+                student=student,
+                course=course,
+                instructor_id=course.instructor_id,
+                status=self._pick_status(REQUEST_STATUSES),
+            )
+            for student, course in self._unique_pairs(count, students, courses, skew)
+        ]
+        requests = EnrollmentRequest.objects.bulk_create(requests, batch_size=self.batch_size)
+        self._backdate(requests, "created_at")
+        return len(requests)
+
+    def _backdate(self, objects, field):
+        # auto_now_add fields are overwritten on insert; bulk_update writes the values as given.
+        if not objects:
+            return
+        for obj in objects:
+            setattr(obj, field, self._past())
+        type(objects[0]).objects.bulk_update(objects, [field], batch_size=self.batch_size)
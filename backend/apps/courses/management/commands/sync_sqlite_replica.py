@@ -0,0 +1,47 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.routers import PRIMARY, REPLICA
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the SQLite primary database into the SQLITE_REPLICA_PATH file. "
+        "With --loop the copy repeats, which imitates a replica lagging by --interval seconds."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="Keep copying instead of exiting after one pass")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds between copies with --loop")
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES[PRIMARY]
+        replica = settings.DATABASES.get(REPLICA)
+        if replica is None or not all(
+            db["ENGINE"] == "django.db.backends.sqlite3" for db in (primary, replica)
+        ):
+            raise CommandError("Needs USE_SQLITE=true and SQLITE_REPLICA_PATH pointing at the replica file.")
+
+        try:
+            while True:
+                started = time.perf_counter()
+                self._copy(primary["NAME"], replica["NAME"])
+                self.stdout.write(f"Copied {primary['NAME']} -> {replica['NAME']} in {time.perf_counter() - started:.2f}s")
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+    def _copy(self, source_path, target_path):
+        # The backup API takes a consistent snapshot even while the server is writing.
+        source = sqlite3.connect(source_path)
+        target = sqlite3.connect(target_path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
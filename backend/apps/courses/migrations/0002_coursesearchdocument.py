@@ -0,0 +1,60 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:55
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_search_index(apps, schema_editor):
+    """Create the vendor-specific full-text index and backfill it from existing courses"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        config = getattr(settings, 'COURSE_SEARCH_CONFIG', 'english')
+        schema_editor.execute(
+            "CREATE INDEX courses_search_vector_gin ON courses_coursesearchdocument USING gin (search_vector)"
+        )
+        schema_editor.execute(
+            "INSERT INTO courses_coursesearchdocument (course_id, search_vector, updated_at) "
+            "SELECT id, "
+            "setweight(to_tsvector(%s::regconfig, coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector(%s::regconfig, coalesce(description, '')), 'B'), "
+            "now() FROM courses_course",
+            params=[config, config],
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS courses_course_fts "
+            "USING fts5(title, description, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            "INSERT INTO courses_course_fts (rowid, title, description) "
+            "SELECT id, title, description FROM courses_course"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS courses_search_vector_gin")
+    elif vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS courses_course_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseSearchDocument',
+            fields=[
+                ('course', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='courses.course')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(create_search_index, reverse_code=drop_search_index),
+    ]
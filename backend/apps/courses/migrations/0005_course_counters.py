@@ -0,0 +1,55 @@
+# Generated by Django 5.1.2 on 2026-10-18 01:27
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, field):
+    rows = queryset.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(n=Count('pk')).values('n')
+    return Coalesce(Subquery(rows), 0)
+
+
+def backfill_counters(apps, schema_editor):
+    Course = apps.get_model('courses', 'Course')
+    CourseCategory = apps.get_model('courses', 'CourseCategory')
+    Enrollment = apps.get_model('enrollments', 'Enrollment')
+
+    Course.objects.update(
+        enrollment_count=_count(Enrollment.objects.all(), 'course'),
+        active_enrollment_count=_count(Enrollment.objects.filter(status='active'), 'course'),
+    )
+    CourseCategory.objects.update(course_count=_count(Course.objects.all(), 'category'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0004_course_course_published_created_idx_and_more'),
+        ('enrollments', '0004_enrollment_enroll_student_status_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='active_enrollment_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='enrollment_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='coursecategory',
+            name='course_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['-enrollment_count', '-id'], name='course_enrollment_count_idx'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
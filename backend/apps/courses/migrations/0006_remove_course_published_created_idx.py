@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-18 02:14
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0005_course_counters'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='course',
+            name='course_published_created_idx',
+        ),
+    ]
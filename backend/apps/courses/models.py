@@ -1,10 +1,37 @@
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 
-class CourseCategory(models.Model):
+class PreserveCountersMixin:
+	"""Leave ``COUNTER_FIELDS`` out of the UPDATE issued by ``save()``.
+
+	Counters only change through F() updates (see ``CourseCounterService``);
+	saving an instance loaded earlier must not write its stale copy back.
+	"""
+
+	COUNTER_FIELDS = ()
+
+	def save(self, *args, **kwargs):
+		if (
+			not self._state.adding and self.pk is not None and not args
+			and kwargs.get("update_fields") is None and not kwargs.get("force_insert")
+		):
+			# Deferred fields stay out too, as Django's own save() would leave them.
+			skipped = set(self.COUNTER_FIELDS) | self.get_deferred_fields()
+			kwargs["update_fields"] = [
+				field.name for field in self._meta.concrete_fields
+				if not field.primary_key and field.attname not in skipped and field.name not in skipped
+			]
+		super().save(*args, **kwargs)
+
+
+class CourseCategory(PreserveCountersMixin, models.Model):
+	COUNTER_FIELDS = ("course_count",)
+
 	name = models.CharField(max_length=255, unique=True)
 	description = models.TextField(blank=True)
+	course_count = models.IntegerField(default=0, editable=False)
 
 	created_at = models.DateTimeField(auto_now_add=True)
 	updated_at = models.DateTimeField(auto_now=True)
@@ -18,7 +45,9 @@ class CourseCategory(models.Model):
 		return self.name
 
 
-class Course(models.Model):
+class Course(PreserveCountersMixin, models.Model):
+	COUNTER_FIELDS = ("enrollment_count", "active_enrollment_count")
+
 	STATUS_DRAFT = "draft"
 	STATUS_PUBLISHED = "published"
 	STATUS_ARCHIVED = "archived"
@@ -34,11 +63,35 @@ class Course(models.Model):
 	category = models.ForeignKey(CourseCategory, on_delete=models.PROTECT, related_name="courses")
 	instructor = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name="courses")
 	status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_DRAFT)
+	enrollment_count = models.IntegerField(default=0, editable=False)
+	active_enrollment_count = models.IntegerField(default=0, editable=False)
 	created_at = models.DateTimeField(auto_now_add=True)
 	updated_at = models.DateTimeField(auto_now=True)
 
 	class Meta:
 		ordering = ("-created_at",)
+		indexes = [
+			models.Index(fields=["-created_at", "-id"], name="course_created_id_idx"),
+			models.Index(fields=["status", "-created_at", "-id"], name="course_status_created_idx"),
+			models.Index(fields=["instructor", "-created_at", "-id"], name="course_instr_created_idx"),
+			# The unfiltered published catalog is served by course_status_created_idx; the category
+			# filter gets a partial index so drafts stay out of it.
+			models.Index(
+				fields=["category", "-created_at", "-id"],
+				name="course_published_cat_idx",
+				condition=models.Q(status="published"),
+			),
+			models.Index(fields=["-enrollment_count", "-id"], name="course_enrollment_count_idx"),
+		]
 
 	def __str__(self):
 		return self.title
+
+
+class CourseSearchDocument(models.Model):
+	course = models.OneToOneField(Course, on_delete=models.CASCADE, primary_key=True, related_name="search_document")
+	search_vector = SearchVectorField(null=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	def __str__(self):
+		return f"Search document for course {self.course_id}"
@@ -0,0 +1,142 @@
+import re
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, Q, QuerySet, Value
+from django.utils.module_loading import import_string
+
+from .models import Course, CourseSearchDocument
+
+FTS_TABLE = "courses_course_fts"
+
+
+def tokenize(term: str) -> list:
+    return re.findall(r"\w+", term.lower())
+
+
+class CourseSearchBackend:
+    """Plain substring matching; used when no full-text index is available."""
+
+    def index(self, course: Course) -> None:
+        pass
+
+    def remove(self, course_id: int) -> None:
+        pass
+
+    def rebuild(self) -> int:
+        return 0
+
+    def search(self, qs: QuerySet, term: str) -> QuerySet:
+        return qs.filter(
+            Q(title__icontains=term) |
+            Q(description__icontains=term)
+        )
+
+
+class PostgresSearchBackend(CourseSearchBackend):
+
+    def __init__(self, config: Optional[str] = None):
+        self.config = config or settings.COURSE_SEARCH_CONFIG
+
+    def _vector(self, title, description):
+        return (
+            SearchVector(title, weight='A', config=self.config) +
+            SearchVector(description, weight='B', config=self.config)
+        )
+
+    def index(self, course: Course) -> None:
+        CourseSearchDocument.objects.update_or_create(
+            course_id=course.pk,
+            defaults={'search_vector': self._vector(Value(course.title), Value(course.description))}
+        )
+
+    def remove(self, course_id: int) -> None:
+        CourseSearchDocument.objects.filter(course_id=course_id).delete()
+
+    def rebuild(self) -> int:
+        document_table = CourseSearchDocument._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {document_table}")
+            cursor.execute(
+                f"INSERT INTO {document_table} (course_id, search_vector, updated_at) "
+                f"SELECT id, "
+                f"setweight(to_tsvector(%s::regconfig, coalesce(title, '')), 'A') || "
+                f"setweight(to_tsvector(%s::regconfig, coalesce(description, '')), 'B'), "
+                f"now() FROM {Course._meta.db_table}",
+                [self.config, self.config]
+            )
+            return cursor.rowcount
+
+    def search(self, qs: QuerySet, term: str) -> QuerySet:
+        tokens = tokenize(term)
+        if not tokens:
+            return super().search(qs, term)
+
+        query = SearchQuery(
+            " & ".join(f"{token}:*" for token in tokens), config=self.config, search_type='raw'
+        )
+        return qs.filter(
+            search_document__search_vector=query
+        ).annotate(
+            search_rank=SearchRank(F('search_document__search_vector'), query)
+        ).order_by('-search_rank', '-created_at')
+
+
+class SQLiteFTSSearchBackend(CourseSearchBackend):
+    # Title matches weigh ten times more than description matches in bm25().
+    RANK = f"bm25({FTS_TABLE}, 10.0, 1.0)"
+
+    def index(self, course: Course) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [course.pk])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description) VALUES (%s, %s, %s)",
+                [course.pk, course.title, course.description]
+            )
+
+    def remove(self, course_id: int) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [course_id])
+
+    def rebuild(self) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description) "
+                f"SELECT id, title, description FROM courses_course"
+            )
+            return cursor.rowcount
+
+    def search(self, qs: QuerySet, term: str) -> QuerySet:
+        tokens = tokenize(term)
+        if not tokens:
+            return super().search(qs, term)
+
+        match = " ".join(f'"{token}"*' for token in tokens)
+        # A join keeps bm25() to one evaluation per hit; the ORM has no way to join a virtual table.
+        return qs.extra(
+            tables=[FTS_TABLE],
+            where=[f"{FTS_TABLE}.rowid = {Course._meta.db_table}.id", f"{FTS_TABLE} MATCH %s"],
+            params=[match],
+            select={'search_rank': f"-{self.RANK}"},
+        ).order_by('-search_rank', '-created_at')
+
+
+VENDOR_BACKENDS = {
+    'postgresql': PostgresSearchBackend,
+    'sqlite': SQLiteFTSSearchBackend,
+}
+
+_backend = None
+
+
+def get_search_backend() -> CourseSearchBackend:
+    global _backend
+    if _backend is None:
+        if settings.COURSE_SEARCH_BACKEND:
+            _backend = import_string(settings.COURSE_SEARCH_BACKEND)()
+        else:
+            _backend = VENDOR_BACKENDS.get(connection.vendor, CourseSearchBackend)()
+    return _backend
@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from core.projection import ProjectedSerializerMixin
 from .models import Course, CourseCategory
 
 User = get_user_model()
@@ -12,10 +13,19 @@ class CourseCategorySerializer(serializers.ModelSerializer):
         fields = ["id", "name", "description"]
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class CategorySerializer(CourseCategorySerializer):
+    """Category endpoints; adds the ``course_count`` counter, which course payloads leave out."""
+
+    class Meta(CourseCategorySerializer.Meta):
+        fields = [*CourseCategorySerializer.Meta.fields, "course_count"]
+        read_only_fields = ["course_count"]
+
+
+class CourseSerializer(ProjectedSerializerMixin, serializers.ModelSerializer):
     instructor_email = serializers.ReadOnlyField(source="instructor.email")
     instructor_registration_number = serializers.ReadOnlyField(source="instructor.registration_number")
     category = CourseCategorySerializer(read_only=True)
+    category_name = serializers.ReadOnlyField(source="category.name")
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=CourseCategory.objects.all(), source="category", write_only=True
     )
@@ -27,6 +37,7 @@ class CourseSerializer(serializers.ModelSerializer):
             "title",
             "description",
             "category",
+            "category_name",
             "category_id",
             "instructor",
             "instructor_email",
@@ -36,6 +47,7 @@ class CourseSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "instructor", "instructor_email", "instructor_registration_number", "created_at", "updated_at"]
+        summary_fields = ["id", "title", "category_name", "instructor_email", "status", "created_at"]
 
     def validate_status(self, value):
         user = self.context["request"].user
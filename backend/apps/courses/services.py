@@ -1,6 +1,11 @@
-from typing import Dict, Any, Optional
-from django.db.models import QuerySet, Count, Q
+from typing import Dict, Any, Iterable, Optional, Tuple
+from django.db import transaction
+from django.db.models import QuerySet, Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from core.routers import read_db
 from .models import Course, CourseCategory
+from .search import get_search_backend
 from .validators import CourseValidator
 from .exceptions import CourseNotFoundError, CategoryNotFoundError
 
@@ -47,7 +52,7 @@ class CourseQueryService:
     
     @staticmethod
     def get_published_courses(filters: Optional[Dict[str, Any]] = None) -> QuerySet:
-        qs = Course.objects.filter(status='published').select_related(
+        qs = Course.objects.using(read_db()).filter(status='published').select_related(
             'category', 'instructor'
         ).order_by('-created_at')
         
@@ -61,17 +66,13 @@ class CourseQueryService:
             qs = qs.filter(instructor_id=filters['instructor'])
         
         if filters.get('search'):
-            search_term = filters['search']
-            qs = qs.filter(
-                Q(title__icontains=search_term) |
-                Q(description__icontains=search_term)
-            )
+            qs = get_search_backend().search(qs, filters['search'])
         
         return qs
     
     @staticmethod
     def get_courses_for_instructor(instructor) -> QuerySet:
-        return Course.objects.filter(
+        return Course.objects.using(read_db()).filter(
             instructor=instructor
         ).select_related('category').order_by('-created_at')
     
@@ -79,11 +80,12 @@ class CourseQueryService:
     def get_course_statistics() -> Dict[str, Any]:
         from django.db.models import Count
         
-        total_courses = Course.objects.count()
-        published_courses = Course.objects.filter(status='published').count()
-        draft_courses = Course.objects.filter(status='draft').count()
+        courses = Course.objects.using(read_db())
+        total_courses = courses.count()
+        published_courses = courses.filter(status='published').count()
+        draft_courses = courses.filter(status='draft').count()
         
-        courses_by_category = Course.objects.values(
+        courses_by_category = courses.values(
             'category__name'
         ).annotate(count=Count('id')).order_by('-count')
         
@@ -99,9 +101,7 @@ class CategoryService:
     
     @staticmethod
     def get_all_categories() -> QuerySet:
-        return CourseCategory.objects.annotate(
-            course_count=Count('courses')
-        ).order_by('name')
+        return CourseCategory.objects.using(read_db()).order_by('name')
     
     @staticmethod
     def get_category_by_id(category_id: int) -> CourseCategory:
@@ -109,3 +109,93 @@ class CategoryService:
             return CourseCategory.objects.get(id=category_id)
         except CourseCategory.DoesNotExist:
             raise CategoryNotFoundError(f"Category with id {category_id} not found")
+
+
+class CourseCounterService:
+    """Keeps ``Course.enrollment_count``/``active_enrollment_count`` and
+    ``CourseCategory.course_count`` in step with the rows they count."""
+
+    @staticmethod
+    def enrollment_columns(status: Optional[str]) -> Dict[str, int]:
+        if status is None:
+            return {}
+        return {
+            'enrollment_count': 1,
+            'active_enrollment_count': 1 if status == 'active' else 0,
+        }
+
+    @staticmethod
+    def _bump(model, deltas_by_pk: Dict[int, Dict[str, int]], touch: bool = False) -> None:
+        """``touch`` also moves ``updated_at``, for counters served under its ETag."""
+        # Fixed order so concurrent transactions lock rows the same way round.
+        for pk in sorted(deltas_by_pk):
+            changes = {column: F(column) + delta for column, delta in deltas_by_pk[pk].items() if delta}
+            if changes and touch:
+                changes['updated_at'] = timezone.now()
+            if changes:
+                model.objects.filter(pk=pk).update(**changes)
+
+    @staticmethod
+    def apply_enrollment_changes(changes: Iterable[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]) -> None:
+        """Apply (old_state, new_state) enrollment pairs; see ``enrollments_bulk_changed``."""
+        deltas = {}
+        for old, new in changes:
+            for state, sign in ((old, -1), (new, 1)):
+                if not state:
+                    continue
+                course_deltas = deltas.setdefault(state['course_id'], {})
+                for column, value in CourseCounterService.enrollment_columns(state['status']).items():
+                    course_deltas[column] = course_deltas.get(column, 0) + sign * value
+        with transaction.atomic():
+            CourseCounterService._bump(Course, deltas)
+
+    @staticmethod
+    def apply_course_change(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        old_category = old and old['category_id']
+        new_category = new and new['category_id']
+        if old_category == new_category:
+            return
+        deltas = {}
+        if old_category:
+            deltas[old_category] = {'course_count': -1}
+        if new_category:
+            deltas[new_category] = {'course_count': 1}
+        with transaction.atomic():
+            # The category endpoints serve course_count, validated by updated_at.
+            CourseCounterService._bump(CourseCategory, deltas, touch=True)
+
+    @staticmethod
+    def _count(queryset: QuerySet, field: str):
+        rows = queryset.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(n=Count('pk')).values('n')
+        return Coalesce(Subquery(rows), 0)
+
+    @staticmethod
+    def reconcile(dry_run: bool = False) -> Dict[str, int]:
+        """Recount drifted rows from the source tables; returns how many were off."""
+        from apps.enrollments.models import Enrollment
+
+        drifted_courses = list(Course.objects.annotate(
+            actual_total=Count('enrollments'),
+            actual_active=Count('enrollments', filter=Q(enrollments__status='active')),
+        ).exclude(
+            actual_total=F('enrollment_count'), actual_active=F('active_enrollment_count')
+        ).values_list('pk', flat=True))
+
+        drifted_categories = list(CourseCategory.objects.annotate(
+            actual=Count('courses')
+        ).exclude(actual=F('course_count')).values_list('pk', flat=True))
+
+        if not dry_run:
+            # Recount inside the UPDATE so enrollments written meanwhile are not lost.
+            Course.objects.filter(pk__in=drifted_courses).update(
+                enrollment_count=CourseCounterService._count(Enrollment.objects.all(), 'course'),
+                active_enrollment_count=CourseCounterService._count(
+                    Enrollment.objects.filter(status='active'), 'course'
+                ),
+            )
+            CourseCategory.objects.filter(pk__in=drifted_categories).update(
+                course_count=CourseCounterService._count(Course.objects.all(), 'category'),
+                updated_at=timezone.now(),
+            )
+
+        return {'courses': len(drifted_courses), 'categories': len(drifted_categories)}
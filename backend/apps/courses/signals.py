@@ -0,0 +1,72 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .cache import CatalogCache
+from .models import Course, CourseCategory
+from .search import get_search_backend
+
+User = get_user_model()
+
+SEARCH_FIELDS = {"title", "description"}
+# User fields copied into course payloads
+INSTRUCTOR_FIELDS = ("email", "registration_number")
+
+
+@receiver(post_save, sender=Course, dispatch_uid="course_search_index")
+def index_course(sender, instance, update_fields=None, **kwargs):
+	if update_fields is not None and not SEARCH_FIELDS.intersection(update_fields):
+		return
+	get_search_backend().index(instance)
+
+
+@receiver(post_delete, sender=Course, dispatch_uid="course_search_remove")
+def remove_course(sender, instance, **kwargs):
+	get_search_backend().remove(instance.pk)
+
+
+@receiver(post_save, sender=Course, dispatch_uid="catalog_cache_course_save")
+@receiver(post_delete, sender=Course, dispatch_uid="catalog_cache_course_delete")
+@receiver(post_save, sender=CourseCategory, dispatch_uid="catalog_cache_category_save")
+@receiver(post_delete, sender=CourseCategory, dispatch_uid="catalog_cache_category_delete")
+def invalidate_catalog(sender, instance, **kwargs):
+	CatalogCache.invalidate()
+
+
+def _embedded_instructor_fields(instance):
+	if any(field not in instance.__dict__ for field in INSTRUCTOR_FIELDS):
+		return None
+	return {field: instance.__dict__[field] for field in INSTRUCTOR_FIELDS}
+
+
+@receiver(post_init, sender=User, dispatch_uid="catalog_cache_instructor_init")
+def remember_instructor_fields(sender, instance, **kwargs):
+	# Deferred fields are left unknown instead of triggering a query per row.
+	instance._catalog_fields = _embedded_instructor_fields(instance) if instance.pk else None
+
+
+@receiver(pre_save, sender=User, dispatch_uid="catalog_cache_instructor_pre_save")
+def load_instructor_fields(sender, instance, **kwargs):
+	if instance._state.adding or instance.role != User.ROLE_INSTRUCTOR:
+		return
+	if getattr(instance, "_catalog_fields", None) is None:
+		instance._catalog_fields = User._default_manager.filter(pk=instance.pk).values(*INSTRUCTOR_FIELDS).first()
+
+
+@receiver(post_save, sender=User, dispatch_uid="catalog_cache_instructor_save")
+def invalidate_catalog_for_instructor(sender, instance, created, update_fields=None, **kwargs):
+	old = getattr(instance, "_catalog_fields", None) or {}
+	# Deferred fields, and fields left out of update_fields, were not saved and keep the old value.
+	saved = {
+		field for field in INSTRUCTOR_FIELDS
+		if field in instance.__dict__ and (update_fields is None or field in update_fields)
+	}
+	new = {field: instance.__dict__[field] if field in saved else old.get(field) for field in INSTRUCTOR_FIELDS}
+	instance._catalog_fields = new
+	# Course payloads embed instructor email and registration number; other edits leave them alone.
+	if created or instance.role != User.ROLE_INSTRUCTOR or old == new:
+		return
+	# Move updated_at too so the ETags derived from it change (update() sends no signals).
+	Course.objects.filter(instructor=instance).update(updated_at=timezone.now())
+	CatalogCache.invalidate()
@@ -0,0 +1,89 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APITestCase
+
+from core.testing import QueryCountAssertionsMixin, assert_uses_index, count_queries
+
+from .management.commands.explain_indexes import service_querysets
+from .models import Course, CourseCategory
+
+User = get_user_model()
+
+
+def create_courses(count, prefix="course"):
+    """Courses that each have their own instructor and category, so per-row lookups show up."""
+    courses = []
+    for n in range(count):
+        instructor = User.objects.create_user(email=f"{prefix}.instructor{n}@example.com", role=User.ROLE_INSTRUCTOR)
+        category = CourseCategory.objects.create(name=f"{prefix} category {n}")
+        courses.append(Course.objects.create(
+            title=f"{prefix} {n}", description="", category=category, instructor=instructor,
+            status=Course.STATUS_PUBLISHED,
+        ))
+    return courses
+
+
+class CourseListQueryTests(QueryCountAssertionsMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", role=User.ROLE_ADMIN)
+        create_courses(20)
+
+    def setUp(self):
+        self.client.force_authenticate(self.admin)
+
+    def test_course_list(self):
+        self.assertConstantListQueries("/api/courses/")
+
+    def test_course_list_keyset(self):
+        self.assertConstantListQueries("/api/courses/", params={"pagination": "cursor"})
+
+    def test_course_list_summary(self):
+        self.assertConstantListQueries("/api/courses/", params={"view": "summary"})
+
+
+class CategoryListQueryTests(QueryCountAssertionsMixin, APITestCase):
+    def test_category_list(self):
+        # Unpaginated, so compare one category against twenty.
+        user = User.objects.create_user(email="student@example.com")
+        self.client.force_authenticate(user)
+        create_courses(1, prefix="first")
+        small, _ = count_queries(self.client, "/api/courses/categories/")
+        create_courses(19, prefix="more")
+        large, queries = count_queries(self.client, "/api/courses/categories/")
+        self.assertEqual(small, large, "\n".join(query["sql"] for query in queries))
+
+
+class ListIndexTests(TestCase):
+    databases = "__all__"
+
+    def test_list_queries_use_their_index(self):
+        # The published catalog, course, enrollment and request lists explain_indexes checks.
+        for label, queryset, indexes in service_querysets():
+            with self.subTest(label):
+                assert_uses_index(queryset, *indexes)
+
+
+class PreserveCountersTests(TestCase):
+    def setUp(self):
+        self.course = create_courses(1)[0]
+
+    def test_save_leaves_counters_alone(self):
+        Course.objects.filter(pk=self.course.pk).update(enrollment_count=7)
+        self.course.title = "renamed"
+        self.course.save()
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.title, self.course.enrollment_count), ("renamed", 7))
+
+    def test_save_after_delete_inserts(self):
+        self.course.delete()
+        self.course.save()
+        self.assertTrue(Course.objects.filter(pk=self.course.pk).exists())
+
+    def test_deferred_fields_are_not_written(self):
+        course = Course.objects.only("id", "title").get(pk=self.course.pk)
+        Course.objects.filter(pk=course.pk).update(description="changed elsewhere")
+        course.title = "renamed"
+        course.save()
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.title, self.course.description), ("renamed", "changed elsewhere"))
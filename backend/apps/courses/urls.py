@@ -1,12 +1,24 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import CategoryViewSet, CourseViewSet
+from .views import AsyncCourseDetailView, AsyncCourseListView, CategoryViewSet, CourseExportView, CourseViewSet
 
 router = DefaultRouter()
 router.register(r"categories", CategoryViewSet, basename="category")
 router.register(r"", CourseViewSet, basename="course")
 
 urlpatterns = [
+	# Ahead of the router, whose detail route would otherwise take "export" as a pk.
+	path("export/", CourseExportView.as_view(), name="course-export"),
+]
+
+if settings.ASYNC_READ_VIEWS:
+	urlpatterns += [
+		path("", AsyncCourseListView.as_view(), name="course-list"),
+		path("<int:pk>/", AsyncCourseDetailView.as_view(), name="course-detail"),
+	]
+
+urlpatterns += [
 	path("", include(router.urls)),
 ]
@@ -1,10 +1,22 @@
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
-from rest_framework import permissions, status, viewsets
+from django.db.models import Count, Max
+from rest_framework import generics, permissions, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError, PermissionDenied, NotFound
 
+from core.async_views import AsyncAPIViewMixin, AsyncListModelMixin, AsyncRetrieveModelMixin
+from core.conditional import add_validators, make_validators, not_modified
+from core.exports import StreamingExportMixin
+from core.middleware import SerializationTimingMixin
+from core.prefetch import PrefetchPlanMixin
+from core.projection import ProjectionMixin
+from core.routers import read_db
+
+from .cache import CatalogCache
 from .models import Course, CourseCategory
-from .serializers import CourseCategorySerializer, CourseSerializer
+from .serializers import CategorySerializer, CourseSerializer
 from .services import CourseManagementService, CourseQueryService, CategoryService
 from .exceptions import (
     CourseValidationError,
@@ -17,16 +29,35 @@ from .exceptions import (
 User = get_user_model()
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(SerializationTimingMixin, viewsets.ModelViewSet):
     queryset = CourseCategory.objects.all()
-    serializer_class = CourseCategorySerializer
+    serializer_class = CategorySerializer
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = None
 
+    def get_queryset(self):
+        if self.action in ('list', 'retrieve'):
+            return CategoryService.get_all_categories()
+        return super().get_queryset()
+
     def list(self, request, *args, **kwargs):
         categories = CategoryService.get_all_categories()
+        state = categories.order_by().aggregate(count=Count('pk'), modified=Max('updated_at'))
+        validators = make_validators('categories', state['count'], state['modified'], last_modified=state['modified'])
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+        
         serializer = self.get_serializer(categories, many=True)
-        return Response(serializer.data)
+        return add_validators(Response(serializer.data), validators)
+
+    def retrieve(self, request, *args, **kwargs):
+        modified = self.get_queryset().filter(pk=kwargs['pk']).values_list('updated_at', flat=True).first()
+        validators = None if modified is None else make_validators('category', kwargs['pk'], modified, last_modified=modified)
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+        return add_validators(super().retrieve(request, *args, **kwargs), validators)
 
     def perform_create(self, serializer):
         self._require_admin()
@@ -48,20 +79,59 @@ class CategoryViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("Only admins can manage categories.")
 
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseAccessMixin:
     serializer_class = CourseSerializer
     permission_classes = [permissions.IsAuthenticated]
+    keyset_ordering = "-created_at"
 
     def get_queryset(self):
         user = self.request.user
         
         if user.role == User.ROLE_ADMIN or user.is_staff:
-            return Course.objects.select_related('category', 'instructor').order_by('-created_at')
+            return Course.objects.using(read_db()).select_related('category', 'instructor').order_by('-created_at')
         
         if user.role == User.ROLE_INSTRUCTOR:
             return CourseQueryService.get_courses_for_instructor(user)
         
-        return CourseQueryService.get_published_courses()
+        filters = {
+            'category': self.request.query_params.get('category'),
+            'instructor': self.request.query_params.get('instructor'),
+            'search': self.request.query_params.get('search'),
+        }
+        return CourseQueryService.get_published_courses(filters)
+
+    def _is_catalog_request(self):
+        # Admins and instructors see role-specific course lists; only the published catalog is shared.
+        user = self.request.user
+        return user.role == User.ROLE_STUDENT and not user.is_staff
+
+    def _validator_scope(self):
+        return 'catalog' if self._is_catalog_request() else f'user:{self.request.user.pk}'
+
+    def list_validators(self):
+        # get_queryset() reads from read_db(), so validators and body (and the catalog cache fill) come from
+        # the same alias; a lagging replica only yields a slightly older ETag for the matching older body.
+        # Course.updated_at also moves when the instructor's embedded details change (see signals).
+        state = self.filter_queryset(self.get_queryset()).order_by().aggregate(
+            count=Count('pk'), modified=Max('updated_at'), category_modified=Max('category__updated_at'),
+        )
+        last_modified = max(filter(None, (state['modified'], state['category_modified'])), default=None)
+        return make_validators(
+            'courses', self._validator_scope(), state['count'], last_modified, last_modified=last_modified
+        )
+
+    def detail_validators(self):
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        state = self.filter_queryset(self.get_queryset()).filter(**{self.lookup_field: lookup}).values(
+            'pk', 'updated_at', 'category__updated_at'
+        ).first()
+        if state is None:
+            return None
+        last_modified = max(state['updated_at'], state['category__updated_at'])
+        return make_validators('course', self._validator_scope(), state['pk'], last_modified, last_modified=last_modified)
+
+
+class CourseViewSet(SerializationTimingMixin, CourseAccessMixin, PrefetchPlanMixin, ProjectionMixin, viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         user = self.request.user
@@ -112,4 +182,98 @@ class CourseViewSet(viewsets.ModelViewSet):
             raise NotFound(str(e))
 
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        validators = self.list_validators()
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+        return add_validators(self._list(request, *args, **kwargs), validators)
+
+    def _list(self, request, *args, **kwargs):
+        if not self._is_catalog_request():
+            return super().list(request, *args, **kwargs)
+        
+        key = CatalogCache.key_for(request)
+        data = CatalogCache.get(key)
+        if data is not None:
+            return Response(data)
+        
+        response = super().list(request, *args, **kwargs)
+        CatalogCache.set(key, response.data)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        validators = self.detail_validators()
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+        return add_validators(super().retrieve(request, *args, **kwargs), validators)
+
+    @action(detail=False, methods=["get"], url_path="cache-stats")
+    def cache_stats(self, request):
+        user = request.user
+        if not (user.role == User.ROLE_ADMIN or user.is_staff):
+            raise PermissionDenied("Only admins can view cache statistics.")
+        return Response(CatalogCache.stats())
+
+
+class AsyncCourseListView(SerializationTimingMixin, AsyncAPIViewMixin, AsyncListModelMixin, CourseAccessMixin,
+                          PrefetchPlanMixin, ProjectionMixin, generics.GenericAPIView):
+    """Async ``GET /api/courses/``; other methods go to :class:`CourseViewSet`."""
+
+    sync_view = CourseViewSet.as_view({"get": "list", "post": "create"})
+
+    async def get(self, request, *args, **kwargs):
+        validators = await sync_to_async(self.list_validators)()
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+        return add_validators(await self._list(request, *args, **kwargs), validators)
+
+    async def _list(self, request, *args, **kwargs):
+        if not self._is_catalog_request():
+            return await self.alist(request, *args, **kwargs)
+
+        key, data = await sync_to_async(self._cached_page)(request)
+        if data is not None:
+            return Response(data)
+
+        response = await self.alist(request, *args, **kwargs)
+        await sync_to_async(CatalogCache.set)(key, response.data)
+        return response
+
+    def _cached_page(self, request):
+        key = CatalogCache.key_for(request)
+        return key, CatalogCache.get(key)
+
+
+class AsyncCourseDetailView(SerializationTimingMixin, AsyncAPIViewMixin, AsyncRetrieveModelMixin, CourseAccessMixin,
+                            generics.GenericAPIView):
+    """Async ``GET /api/courses/<pk>/``; other methods go to :class:`CourseViewSet`."""
+
+    sync_view = CourseViewSet.as_view({
+        "get": "retrieve", "put": "update", "patch": "partial_update", "delete": "destroy",
+    })
+
+    async def get(self, request, *args, **kwargs):
+        validators = await sync_to_async(self.detail_validators)()
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+        return add_validators(await self.aretrieve(request, *args, **kwargs), validators)
+
+
+class CourseExportView(StreamingExportMixin, CourseAccessMixin, generics.GenericAPIView):
+    """CSV/NDJSON export of the courses the user can list."""
+
+    export_filename = "courses"
+    export_columns = (
+        ("id", "id"),
+        ("title", "title"),
+        ("category", "category__name"),
+        ("instructor_email", "instructor__email"),
+        ("status", "status"),
+        ("enrollment_count", "enrollment_count"),
+        ("active_enrollment_count", "active_enrollment_count"),
+        ("created_at", "created_at"),
+        ("updated_at", "updated_at"),
+    )
@@ -5,3 +5,8 @@ class DashboardConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.dashboard"
     label = "dashboard"
+
+    def ready(self):
+        from .signals import connect_signals
+
+        connect_signals()
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from apps.dashboard.services import DashboardSnapshotService, InstructorStatsService
+
+
+class Command(BaseCommand):
+    help = "Recompute the materialized dashboard counters from the source tables"
+
+    def handle(self, *args, **options):
+        counters = DashboardSnapshotService.rebuild()
+
+        for key, value in sorted(counters.items()):
+            self.stdout.write(f"{key}: {value}")
+
+        instructor_count = InstructorStatsService.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f"\nRebuilt {len(counters)} dashboard counters"))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt enrollment stats for {instructor_count} instructors"))
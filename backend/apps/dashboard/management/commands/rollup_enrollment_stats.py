@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.services import EnrollmentRollupService
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold enrollments, cancellations and signups recorded since the last run into the daily "
+        "report rollups. Meant to run from cron every few minutes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rebuild", action="store_true", help="Drop the rollups and recompute them from scratch")
+        parser.add_argument(
+            "--settle-seconds", type=int,
+            help="Skip rows newer than this many seconds (default: ROLLUP_SETTLE_SECONDS)",
+        )
+
+    def handle(self, *args, **options):
+        run = EnrollmentRollupService.rebuild if options["rebuild"] else EnrollmentRollupService.rollup
+        result = run(options["settle_seconds"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Rolled up {result['start'].isoformat()} .. {result['end'].isoformat()}: "
+            f"{result['course_days']} course-days, {result['signup_days']} signup-days"
+        ))
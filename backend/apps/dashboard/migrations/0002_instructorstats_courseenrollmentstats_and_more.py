@@ -0,0 +1,61 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_registration_number'),
+        ('courses', '0001_initial'),
+        ('dashboard', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstructorStats',
+            fields=[
+                ('instructor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='instructor_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('course_count', models.IntegerField(default=0)),
+                ('published_courses', models.IntegerField(default=0)),
+                ('draft_courses', models.IntegerField(default=0)),
+                ('total_students', models.IntegerField(default=0)),
+                ('total_enrollments', models.IntegerField(default=0)),
+                ('active_enrollments', models.IntegerField(default=0)),
+                ('pending_enrollments', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'instructor stats',
+                'verbose_name_plural': 'instructor stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='CourseEnrollmentStats',
+            fields=[
+                ('course', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='enrollment_stats', serialize=False, to='courses.course')),
+                ('total_enrollments', models.IntegerField(default=0)),
+                ('active_enrollments', models.IntegerField(default=0)),
+                ('pending_enrollments', models.IntegerField(default=0)),
+                ('instructor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='course_enrollment_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'course enrollment stats',
+                'verbose_name_plural': 'course enrollment stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='InstructorStudent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('enrollment_count', models.IntegerField(default=0)),
+                ('instructor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('instructor', 'student')},
+            },
+        ),
+    ]
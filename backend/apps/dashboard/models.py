@@ -0,0 +1,105 @@
+from django.conf import settings
+from django.db import models
+
+from apps.courses.models import Course
+
+
+class DashboardSnapshot(models.Model):
+	key = models.CharField(max_length=100, unique=True)
+	value = models.BigIntegerField(default=0)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	class Meta:
+		verbose_name = "dashboard snapshot"
+		verbose_name_plural = "dashboard snapshots"
+		ordering = ("key",)
+
+	def __str__(self):
+		return f"{self.key}={self.value}"
+
+
+class InstructorStats(models.Model):
+	instructor = models.OneToOneField(
+		settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name="instructor_stats"
+	)
+	course_count = models.IntegerField(default=0)
+	published_courses = models.IntegerField(default=0)
+	draft_courses = models.IntegerField(default=0)
+	total_students = models.IntegerField(default=0)
+	total_enrollments = models.IntegerField(default=0)
+	active_enrollments = models.IntegerField(default=0)
+	pending_enrollments = models.IntegerField(default=0)
+
+	class Meta:
+		verbose_name = "instructor stats"
+		verbose_name_plural = "instructor stats"
+
+	def __str__(self):
+		return f"Stats for instructor {self.instructor_id}"
+
+
+class CourseEnrollmentStats(models.Model):
+	course = models.OneToOneField(Course, on_delete=models.CASCADE, primary_key=True, related_name="enrollment_stats")
+	instructor = models.ForeignKey(
+		settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="course_enrollment_stats"
+	)
+	total_enrollments = models.IntegerField(default=0)
+	active_enrollments = models.IntegerField(default=0)
+	pending_enrollments = models.IntegerField(default=0)
+
+	class Meta:
+		verbose_name = "course enrollment stats"
+		verbose_name_plural = "course enrollment stats"
+
+	def __str__(self):
+		return f"Enrollment stats for course {self.course_id}"
+
+
+class InstructorStudent(models.Model):
+	instructor = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+	student = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+	enrollment_count = models.IntegerField(default=0)
+
+	class Meta:
+		unique_together = ("instructor", "student")
+
+	def __str__(self):
+		return f"{self.student_id} -> instructor {self.instructor_id}"
+
+
+class DailyEnrollmentRollup(models.Model):
+	date = models.DateField()
+	course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="+")
+	# Category at the time the day was rolled up, so reports don't join through courses.
+	category = models.ForeignKey("courses.CourseCategory", on_delete=models.SET_NULL, null=True, related_name="+")
+	enrollments = models.IntegerField(default=0)
+	cancellations = models.IntegerField(default=0)
+
+	class Meta:
+		unique_together = ("date", "course")
+		indexes = [
+			models.Index(fields=["category", "date"], name="rollup_category_date_idx"),
+		]
+
+	def __str__(self):
+		return f"{self.date} course {self.course_id}: +{self.enrollments} -{self.cancellations}"
+
+
+class DailySignupRollup(models.Model):
+	date = models.DateField()
+	role = models.CharField(max_length=20)
+	signups = models.IntegerField(default=0)
+
+	class Meta:
+		unique_together = ("date", "role")
+
+	def __str__(self):
+		return f"{self.date} {self.role}: {self.signups}"
+
+
+class RollupWatermark(models.Model):
+	name = models.CharField(max_length=50, unique=True)
+	value = models.DateTimeField()
+
+	def __str__(self):
+		return f"{self.name} @ {self.value.isoformat()}"
@@ -1,85 +1,549 @@
-from typing import Dict, Any
-from django.db.models import Count, Q
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 from apps.courses.models import Course
 from apps.enrollments.models import Enrollment
+from core.async_views import gather_queries
+from core.routers import read_db
+from .models import (
+    CourseEnrollmentStats,
+    DailyEnrollmentRollup,
+    DailySignupRollup,
+    DashboardSnapshot,
+    InstructorStats,
+    InstructorStudent,
+    RollupWatermark,
+)
 
 User = get_user_model()
 
 
+class DashboardSnapshotService:
+    BUILT_KEY = "snapshot.built"
+
+    @staticmethod
+    def user_counters(values: Dict[str, Any]) -> Dict[str, int]:
+        return {
+            "users.active": 1 if values["is_active"] else 0,
+            f"users.role.{values['role']}": 1,
+        }
+
+    @staticmethod
+    def course_counters(values: Dict[str, Any]) -> Dict[str, int]:
+        return {
+            "courses.total": 1,
+            f"courses.status.{values['status']}": 1,
+        }
+
+    @staticmethod
+    def enrollment_counters(values: Dict[str, Any]) -> Dict[str, int]:
+        return {
+            "enrollments.total": 1,
+            f"enrollments.status.{values['status']}": 1,
+        }
+
+    @staticmethod
+    def diff(old: Dict[str, int], new: Dict[str, int]) -> Dict[str, int]:
+        deltas = {}
+        for key in set(old) | set(new):
+            delta = new.get(key, 0) - old.get(key, 0)
+            if delta:
+                deltas[key] = delta
+        return deltas
+
+    @staticmethod
+    def apply_deltas(deltas: Dict[str, int]) -> None:
+        # Key order, like rebuild(), so the two never wait on each other's row locks in a cycle.
+        for key, delta in sorted(deltas.items()):
+            if not delta:
+                continue
+            updated = DashboardSnapshot.objects.filter(key=key).update(
+                value=F("value") + delta
+            )
+            if updated:
+                continue
+            _, created = DashboardSnapshot.objects.get_or_create(
+                key=key, defaults={"value": delta}
+            )
+            if not created:
+                DashboardSnapshot.objects.filter(key=key).update(
+                    value=F("value") + delta
+                )
+
+    @staticmethod
+    def compute_counters() -> Dict[str, int]:
+        counters = {
+            "users.active": User.objects.filter(is_active=True).count(),
+            "courses.total": Course.objects.count(),
+            "enrollments.total": Enrollment.objects.count(),
+        }
+
+        for item in User.objects.values("role").annotate(count=Count("id")):
+            counters[f"users.role.{item['role']}"] = item["count"]
+
+        for item in Course.objects.values("status").annotate(count=Count("id")):
+            counters[f"courses.status.{item['status']}"] = item["count"]
+
+        for item in Enrollment.objects.values("status").annotate(count=Count("id")):
+            counters[f"enrollments.status.{item['status']}"] = item["count"]
+
+        return counters
+
+    @staticmethod
+    def rebuild() -> Dict[str, int]:
+        """Recount every snapshot row in place.
+
+        The rows are locked before counting, so concurrent rebuilds run one
+        after the other, and a delta from a transaction that commits later
+        waits for the rebuild and then lands on its totals instead of being
+        overwritten by them.
+        """
+        built_key = DashboardSnapshotService.BUILT_KEY
+        with transaction.atomic():
+            DashboardSnapshot.objects.get_or_create(key=built_key, defaults={"value": 0})
+            locked = list(DashboardSnapshot.objects.select_for_update().order_by("key").values_list("key", flat=True))
+            counters = DashboardSnapshotService.compute_counters()
+            rows = {key: 0 for key in locked}
+            rows.update(counters)
+            rows[built_key] = 1
+            DashboardSnapshot.objects.bulk_create(
+                [DashboardSnapshot(key=key, value=value) for key, value in sorted(rows.items())],
+                update_conflicts=True,
+                unique_fields=["key"],
+                update_fields=["value", "updated_at"],
+            )
+        return counters
+
+    @staticmethod
+    def stored_counters() -> Optional[Dict[str, int]]:
+        """The snapshot as stored, or ``None`` when it has not been built yet."""
+        counters = dict(DashboardSnapshot.objects.using(read_db()).values_list("key", "value"))
+        if not counters.pop(DashboardSnapshotService.BUILT_KEY, 0):
+            return None
+        return counters
+
+    @staticmethod
+    def get_counters() -> Dict[str, int]:
+        counters = DashboardSnapshotService.stored_counters()
+        if counters is None:
+            return DashboardSnapshotService.rebuild()
+        return counters
+
+
+class InstructorStatsService:
+    ENROLLMENT_COLUMNS = ("total_enrollments", "active_enrollments", "pending_enrollments")
+    COURSE_COLUMNS = ("course_count", "published_courses", "draft_courses")
+
+    @staticmethod
+    def enrollment_columns(status: Optional[str]) -> Dict[str, int]:
+        if status is None:
+            return {}
+        return {
+            "total_enrollments": 1,
+            "active_enrollments": 1 if status == 'active' else 0,
+            "pending_enrollments": 1 if status == 'pending' else 0,
+        }
+
+    @staticmethod
+    def course_columns(status: Optional[str]) -> Dict[str, int]:
+        if status is None:
+            return {}
+        return {
+            "course_count": 1,
+            "published_courses": 1 if status == Course.STATUS_PUBLISHED else 0,
+            "draft_courses": 1 if status == Course.STATUS_DRAFT else 0,
+        }
+
+    @staticmethod
+    def _bump(queryset, deltas: Dict[str, int]) -> bool:
+        changes = {column: F(column) + delta for column, delta in deltas.items() if delta}
+        if not changes:
+            return True
+        return bool(queryset.update(**changes))
+
+    @staticmethod
+    def _instructor_for_course(course_id: int) -> Optional[int]:
+        return Course.objects.filter(pk=course_id).values_list('instructor_id', flat=True).first()
+
+    @staticmethod
+    def _bump_enrollment(course_id: int, student_id: int, deltas: Dict[str, int]) -> None:
+        instructor_id = InstructorStatsService._instructor_for_course(course_id)
+        if instructor_id is None:
+            return
+
+        if not InstructorStatsService._bump(
+            CourseEnrollmentStats.objects.filter(course_id=course_id), deltas
+        ):
+            InstructorStatsService.refresh_instructor(instructor_id)
+            return
+
+        if not InstructorStatsService._bump(
+            InstructorStats.objects.filter(instructor_id=instructor_id), deltas
+        ):
+            InstructorStatsService.refresh_instructor(instructor_id)
+            return
+
+        pair_delta = deltas.get('total_enrollments', 0)
+        pairs = InstructorStudent.objects.filter(instructor_id=instructor_id, student_id=student_id)
+        if pair_delta > 0:
+            pair, created = InstructorStudent.objects.get_or_create(
+                instructor_id=instructor_id, student_id=student_id,
+                defaults={'enrollment_count': pair_delta}
+            )
+            if created:
+                InstructorStats.objects.filter(instructor_id=instructor_id).update(
+                    total_students=F('total_students') + 1
+                )
+            else:
+                pairs.update(enrollment_count=F('enrollment_count') + pair_delta)
+        elif pair_delta < 0:
+            pairs.update(enrollment_count=F('enrollment_count') + pair_delta)
+            pairs.filter(enrollment_count__lte=0).delete()
+            # Recount rather than decrement: cascading user deletes may have removed the pair row already.
+            total_students = InstructorStudent.objects.filter(instructor_id=instructor_id).count()
+            InstructorStats.objects.filter(instructor_id=instructor_id).update(
+                total_students=total_students
+            )
+
+    @staticmethod
+    def apply_enrollment_change(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        if old == new:
+            return
+
+        with transaction.atomic():
+            same_pair = bool(old and new) and (
+                old['course_id'] == new['course_id'] and old['student_id'] == new['student_id']
+            )
+            if same_pair:
+                InstructorStatsService._bump_enrollment(
+                    new['course_id'], new['student_id'],
+                    DashboardSnapshotService.diff(
+                        InstructorStatsService.enrollment_columns(old['status']),
+                        InstructorStatsService.enrollment_columns(new['status']),
+                    )
+                )
+                return
+
+            if old:
+                InstructorStatsService._bump_enrollment(
+                    old['course_id'], old['student_id'],
+                    DashboardSnapshotService.diff(InstructorStatsService.enrollment_columns(old['status']), {})
+                )
+            if new:
+                InstructorStatsService._bump_enrollment(
+                    new['course_id'], new['student_id'],
+                    InstructorStatsService.enrollment_columns(new['status'])
+                )
+
+    @staticmethod
+    def _bump_grouped(model, key: str, deltas: Dict[Any, Dict[str, int]]) -> Set[Any]:
+        """One F() UPDATE per distinct set of deltas; returns the keys that had no row."""
+        groups = {}
+        for value, columns in deltas.items():
+            changes = tuple(sorted((column, delta) for column, delta in columns.items() if delta))
+            if changes:
+                groups.setdefault(changes, []).append(value)
+        missing = set()
+        for changes, values in groups.items():
+            rows = model.objects.filter(**{f'{key}__in': values})
+            if rows.update(**{column: F(column) + delta for column, delta in changes}) != len(values):
+                missing.update(set(values) - set(rows.values_list(key, flat=True)))
+        return missing
+
+    @staticmethod
+    def _apply_pair_deltas(pair_deltas: Dict[Tuple[int, int], int]) -> Set[int]:
+        """Adjust InstructorStudent rows and total_students; returns instructors to rebuild instead."""
+        pair_deltas = {pair: delta for pair, delta in pair_deltas.items() if delta}
+        if not pair_deltas:
+            return set()
+        instructor_ids = {instructor_id for instructor_id, _ in pair_deltas}
+        existing = set(InstructorStudent.objects.select_for_update().filter(
+            instructor_id__in=instructor_ids, student_id__in={student_id for _, student_id in pair_deltas},
+        ).values_list('instructor_id', 'student_id'))
+
+        groups = {}
+        for (instructor_id, student_id), delta in pair_deltas.items():
+            if (instructor_id, student_id) in existing:
+                groups.setdefault((instructor_id, delta), []).append(student_id)
+        for (instructor_id, delta), student_ids in groups.items():
+            InstructorStudent.objects.filter(instructor_id=instructor_id, student_id__in=student_ids).update(
+                enrollment_count=F('enrollment_count') + delta
+            )
+
+        stale = set()
+        new_pairs = [pair for pair, delta in pair_deltas.items() if delta > 0 and pair not in existing]
+        try:
+            with transaction.atomic():
+                InstructorStudent.objects.bulk_create([
+                    InstructorStudent(instructor_id=instructor_id, student_id=student_id,
+                                      enrollment_count=pair_deltas[(instructor_id, student_id)])
+                    for instructor_id, student_id in new_pairs
+                ])
+        except IntegrityError:
+            # A concurrent enrollment created one of the pairs first; recount those instructors.
+            stale = {instructor_id for instructor_id, _ in new_pairs}
+
+        InstructorStudent.objects.filter(instructor_id__in=instructor_ids, enrollment_count__lte=0).delete()
+        counts = dict(InstructorStudent.objects.filter(instructor_id__in=instructor_ids - stale).order_by().values(
+            'instructor_id'
+        ).annotate(count=Count('id')).values_list('instructor_id', 'count'))
+        by_count = {}
+        for instructor_id in instructor_ids - stale:
+            by_count.setdefault(counts.get(instructor_id, 0), []).append(instructor_id)
+        for count, ids in by_count.items():
+            InstructorStats.objects.filter(instructor_id__in=ids).update(total_students=count)
+        return stale
+
+    @staticmethod
+    def apply_enrollment_changes(changes: List[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]) -> None:
+        """Apply many (old, new) enrollment states as grouped F() updates.
+
+        Deltas are summed per course, per instructor and per (instructor,
+        student) pair first, so a bulk enrollment into one course costs a
+        handful of UPDATEs. Instructors whose stats rows are missing are
+        rebuilt instead, as in :meth:`apply_enrollment_change`.
+        """
+        changes = [(old, new) for old, new in changes if old != new]
+        if not changes:
+            return
+        course_ids = {state['course_id'] for change in changes for state in change if state}
+        instructors = dict(Course.objects.filter(pk__in=course_ids).values_list('id', 'instructor_id'))
+
+        course_deltas, instructor_deltas, pair_deltas = {}, {}, {}
+        for old, new in changes:
+            for state, sign in ((old, -1), (new, 1)):
+                instructor_id = state and instructors.get(state['course_id'])
+                if not instructor_id:
+                    continue
+                for column, value in InstructorStatsService.enrollment_columns(state['status']).items():
+                    for totals, key in ((course_deltas, state['course_id']), (instructor_deltas, instructor_id)):
+                        row = totals.setdefault(key, {})
+                        row[column] = row.get(column, 0) + sign * value
+                pair = (instructor_id, state['student_id'])
+                pair_deltas[pair] = pair_deltas.get(pair, 0) + sign
+
+        with transaction.atomic():
+            stale = {
+                instructors[course_id]
+                for course_id in InstructorStatsService._bump_grouped(CourseEnrollmentStats, 'course_id', course_deltas)
+            }
+            stale |= InstructorStatsService._bump_grouped(InstructorStats, 'instructor_id', {
+                instructor_id: columns for instructor_id, columns in instructor_deltas.items()
+                if instructor_id not in stale
+            })
+            stale |= InstructorStatsService._apply_pair_deltas({
+                pair: delta for pair, delta in pair_deltas.items() if pair[0] not in stale
+            })
+            if stale:
+                InstructorStatsService._rebuild(sorted(stale))
+
+    @staticmethod
+    def apply_course_change(course_id: int, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        if old == new:
+            return
+
+        with transaction.atomic():
+            if old and new and old['instructor_id'] != new['instructor_id']:
+                CourseEnrollmentStats.objects.filter(course_id=course_id).update(
+                    instructor_id=new['instructor_id']
+                )
+                InstructorStatsService.refresh_instructor(old['instructor_id'])
+                InstructorStatsService.refresh_instructor(new['instructor_id'])
+                return
+
+            if new and not old:
+                CourseEnrollmentStats.objects.get_or_create(
+                    course_id=course_id, defaults={'instructor_id': new['instructor_id']}
+                )
+
+            instructor_id = (new or old)['instructor_id']
+            deltas = DashboardSnapshotService.diff(
+                InstructorStatsService.course_columns(old and old['status']),
+                InstructorStatsService.course_columns(new and new['status']),
+            )
+            if not InstructorStatsService._bump(
+                InstructorStats.objects.filter(instructor_id=instructor_id), deltas
+            ):
+                InstructorStatsService.refresh_instructor(instructor_id)
+
+    @staticmethod
+    def _rebuild(instructor_ids: Optional[List[int]] = None) -> int:
+        courses = Course.objects.all()
+        enrollments = Enrollment.objects.all()
+        if instructor_ids is not None:
+            courses = courses.filter(instructor_id__in=instructor_ids)
+            enrollments = enrollments.filter(course__instructor_id__in=instructor_ids)
+
+        enrollment_counts = {
+            'total_enrollments': Count('enrollments'),
+            'active_enrollments': Count('enrollments', filter=Q(enrollments__status='active')),
+            'pending_enrollments': Count('enrollments', filter=Q(enrollments__status='pending')),
+        }
+
+        course_rows = []
+        instructor_rows = {}
+        for row in courses.order_by().values('id', 'instructor_id', 'status').annotate(**enrollment_counts):
+            course_rows.append(CourseEnrollmentStats(
+                course_id=row['id'],
+                instructor_id=row['instructor_id'],
+                **{column: row[column] for column in InstructorStatsService.ENROLLMENT_COLUMNS}
+            ))
+            stats = instructor_rows.setdefault(
+                row['instructor_id'], InstructorStats(instructor_id=row['instructor_id'])
+            )
+            for column, value in InstructorStatsService.course_columns(row['status']).items():
+                setattr(stats, column, getattr(stats, column) + value)
+            for column in InstructorStatsService.ENROLLMENT_COLUMNS:
+                setattr(stats, column, getattr(stats, column) + row[column])
+
+        for instructor_id in instructor_ids or []:
+            instructor_rows.setdefault(instructor_id, InstructorStats(instructor_id=instructor_id))
+
+        pair_rows = [
+            InstructorStudent(
+                instructor_id=row['course__instructor_id'],
+                student_id=row['student_id'],
+                enrollment_count=row['count'],
+            )
+            for row in enrollments.order_by().values('course__instructor_id', 'student_id').annotate(count=Count('id'))
+        ]
+        for pair in pair_rows:
+            instructor_rows[pair.instructor_id].total_students += 1
+
+        with transaction.atomic():
+            stale = [CourseEnrollmentStats.objects, InstructorStats.objects, InstructorStudent.objects]
+            for manager in stale:
+                qs = manager.all()
+                if instructor_ids is not None:
+                    qs = qs.filter(instructor_id__in=instructor_ids)
+                qs.delete()
+            CourseEnrollmentStats.objects.bulk_create(course_rows)
+            InstructorStats.objects.bulk_create(instructor_rows.values())
+            InstructorStudent.objects.bulk_create(pair_rows)
+
+        return len(instructor_rows)
+
+    @staticmethod
+    def rebuild() -> int:
+        return InstructorStatsService._rebuild()
+
+    @staticmethod
+    def refresh_instructor(instructor_id: int) -> InstructorStats:
+        InstructorStatsService._rebuild([instructor_id])
+        return InstructorStats.objects.get(instructor_id=instructor_id)
+
+
 class DashboardStatsService:
+    """Role dashboards. Each one is built from independent queries, which the
+    async variants (``aget_*``) overlap with ``gather_queries``; the stored
+    stats they read are rebuilt, when missing, only after those reads."""
     
     @staticmethod
-    def get_admin_dashboard() -> Dict[str, Any]:
-        total_active_users = User.objects.filter(is_active=True).count()
-        role_counts = User.objects.values("role").annotate(count=Count("id"))
-        
-        total_courses = Course.objects.count()
-        published_courses = Course.objects.filter(status=Course.STATUS_PUBLISHED).count()
-        draft_courses = Course.objects.filter(status=Course.STATUS_DRAFT).count()
-        
-        total_enrollments = Enrollment.objects.count()
-        active_enrollments = Enrollment.objects.filter(status='active').count()
-        pending_enrollments = Enrollment.objects.filter(status='pending').count()
-        
-        top_courses = Course.objects.annotate(
-            enrollment_count=Count('enrollments')
-        ).order_by('-enrollment_count')[:5].values(
+    def _top_courses() -> List[Dict[str, Any]]:
+        return list(Course.objects.using(read_db()).order_by('-enrollment_count', '-id')[:5].values(
             'id', 'title', 'enrollment_count'
-        )
+        ))
+    
+    @staticmethod
+    def _admin_payload(counters: Dict[str, int], top_courses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        role_counts = [
+            {"role": key[len("users.role."):], "count": value}
+            for key, value in counters.items()
+            if key.startswith("users.role.") and value
+        ]
         
         return {
-            "total_active_users": total_active_users,
-            "total_courses": total_courses,
-            "published_courses": published_courses,
-            "draft_courses": draft_courses,
-            "total_enrollments": total_enrollments,
-            "active_enrollments": active_enrollments,
-            "pending_enrollments": pending_enrollments,
-            "role_counts": list(role_counts),
-            "top_courses": list(top_courses),
+            "total_active_users": counters.get("users.active", 0),
+            "total_courses": counters.get("courses.total", 0),
+            "published_courses": counters.get(f"courses.status.{Course.STATUS_PUBLISHED}", 0),
+            "draft_courses": counters.get(f"courses.status.{Course.STATUS_DRAFT}", 0),
+            "total_enrollments": counters.get("enrollments.total", 0),
+            "active_enrollments": counters.get("enrollments.status.active", 0),
+            "pending_enrollments": counters.get("enrollments.status.pending", 0),
+            "role_counts": role_counts,
+            "top_courses": top_courses,
         }
     
     @staticmethod
-    def get_instructor_dashboard(instructor) -> Dict[str, Any]:
-        courses = Course.objects.filter(instructor=instructor)
-        course_count = courses.count()
-        published_count = courses.filter(status=Course.STATUS_PUBLISHED).count()
-        draft_count = courses.filter(status=Course.STATUS_DRAFT).count()
-        
-        enrollments = Enrollment.objects.filter(course__in=courses)
-        total_students = enrollments.values('student').distinct().count()
-        active_enrollments = enrollments.filter(status='active').count()
-        pending_enrollments = enrollments.filter(status='pending').count()
-        
-        course_stats = courses.annotate(
-            enrollment_count=Count('enrollments'),
-            active_enrollment_count=Count(
-                'enrollments',
-                filter=Q(enrollments__status='active')
-            )
-        ).values('id', 'title', 'enrollment_count', 'active_enrollment_count')
-        
+    def get_admin_dashboard() -> Dict[str, Any]:
+        return DashboardStatsService._admin_payload(
+            DashboardSnapshotService.get_counters(),
+            DashboardStatsService._top_courses(),
+        )
+    
+    @staticmethod
+    async def aget_admin_dashboard() -> Dict[str, Any]:
+        counters, top_courses = await gather_queries(
+            DashboardSnapshotService.stored_counters,
+            DashboardStatsService._top_courses,
+        )
+        if counters is None:
+            counters = await sync_to_async(DashboardSnapshotService.rebuild)()
+        return DashboardStatsService._admin_payload(counters, top_courses)
+    
+    @staticmethod
+    def _stored_instructor_stats(instructor) -> Optional[InstructorStats]:
+        return InstructorStats.objects.using(read_db()).filter(instructor=instructor).first()
+    
+    @staticmethod
+    def _instructor_stats(instructor) -> InstructorStats:
+        stats = DashboardStatsService._stored_instructor_stats(instructor)
+        if stats is None:
+            stats = InstructorStatsService.refresh_instructor(instructor.id)
+        return stats
+    
+    @staticmethod
+    def _instructor_course_stats(instructor) -> List[Dict[str, Any]]:
+        return list(CourseEnrollmentStats.objects.using(read_db()).filter(
+            instructor=instructor
+        ).order_by('-course__created_at').values(
+            id=F('course_id'),
+            title=F('course__title'),
+            enrollment_count=F('total_enrollments'),
+            active_enrollment_count=F('active_enrollments'),
+        ))
+    
+    @staticmethod
+    def _instructor_payload(stats: InstructorStats, course_stats: List[Dict[str, Any]]) -> Dict[str, Any]:
         return {
-            "course_count": course_count,
-            "published_courses": published_count,
-            "draft_courses": draft_count,
-            "total_students": total_students,
-            "active_enrollments": active_enrollments,
-            "pending_enrollments": pending_enrollments,
-            "course_stats": list(course_stats),
+            "course_count": stats.course_count,
+            "published_courses": stats.published_courses,
+            "draft_courses": stats.draft_courses,
+            "total_students": stats.total_students,
+            "active_enrollments": stats.active_enrollments,
+            "pending_enrollments": stats.pending_enrollments,
+            "course_stats": course_stats,
         }
     
     @staticmethod
-    def get_student_dashboard(student) -> Dict[str, Any]:
-        enrollments = Enrollment.objects.filter(student=student)
-        
-        total_enrolled = enrollments.count()
-        active_courses = enrollments.filter(status='active').count()
-        completed_courses = enrollments.filter(status='completed').count()
-        pending_courses = enrollments.filter(status='pending').count()
-        
+    def get_instructor_dashboard(instructor) -> Dict[str, Any]:
+        return DashboardStatsService._instructor_payload(
+            DashboardStatsService._instructor_stats(instructor),
+            DashboardStatsService._instructor_course_stats(instructor),
+        )
+    
+    @staticmethod
+    async def aget_instructor_dashboard(instructor) -> Dict[str, Any]:
+        stats, course_stats = await gather_queries(
+            lambda: DashboardStatsService._stored_instructor_stats(instructor),
+            lambda: DashboardStatsService._instructor_course_stats(instructor),
+        )
+        if stats is None:
+            # The rebuild writes the course rows too, so read them again afterwards.
+            stats = await sync_to_async(InstructorStatsService.refresh_instructor)(instructor.id)
+            course_stats = await sync_to_async(DashboardStatsService._instructor_course_stats)(instructor)
+        return DashboardStatsService._instructor_payload(stats, course_stats)
+    
+    @staticmethod
+    def _student_queries(student) -> List[Callable[[], Any]]:
+        enrollments = Enrollment.objects.using(read_db()).filter(student=student)
         recent_enrollments = enrollments.select_related(
             'course', 'course__instructor', 'course__instructor__profile'
         ).order_by('-enrolled_at')[:5].values(
@@ -87,14 +551,29 @@ class DashboardStatsService:
             'course__instructor__email', 'course__instructor__profile__name',
             'status', 'enrolled_at'
         )
-        
-        return {
-            "total_enrolled": total_enrolled,
-            "active_courses": active_courses,
-            "completed_courses": completed_courses,
-            "pending_courses": pending_courses,
-            "recent_enrollments": list(recent_enrollments),
-        }
+        return [
+            lambda: enrollments.aggregate(
+                total_enrolled=Count('id'),
+                active_courses=Count('id', filter=Q(status='active')),
+                completed_courses=Count('id', filter=Q(status='completed')),
+                pending_courses=Count('id', filter=Q(status='pending')),
+            ),
+            lambda: list(recent_enrollments),
+        ]
+    
+    @staticmethod
+    def _student_payload(counts: Dict[str, int], recent_enrollments) -> Dict[str, Any]:
+        return {**counts, "recent_enrollments": recent_enrollments}
+    
+    @staticmethod
+    def get_student_dashboard(student) -> Dict[str, Any]:
+        results = [query() for query in DashboardStatsService._student_queries(student)]
+        return DashboardStatsService._student_payload(*results)
+    
+    @staticmethod
+    async def aget_student_dashboard(student) -> Dict[str, Any]:
+        results = await gather_queries(*DashboardStatsService._student_queries(student))
+        return DashboardStatsService._student_payload(*results)
     
     @staticmethod
     def get_dashboard_for_user(user) -> Dict[str, Any]:
@@ -106,3 +585,192 @@ class DashboardStatsService:
             return DashboardStatsService.get_student_dashboard(user)
         else:
             return {"detail": "No dashboard available for this role."}
+    
+    @staticmethod
+    async def aget_dashboard_for_user(user) -> Dict[str, Any]:
+        if user.role == User.ROLE_ADMIN or user.is_staff:
+            return await DashboardStatsService.aget_admin_dashboard()
+        elif user.role == User.ROLE_INSTRUCTOR:
+            return await DashboardStatsService.aget_instructor_dashboard(user)
+        elif user.role == User.ROLE_STUDENT:
+            return await DashboardStatsService.aget_student_dashboard(user)
+        else:
+            return {"detail": "No dashboard available for this role."}
+
+
+class EnrollmentRollupService:
+    """Per-day enrollment, cancellation and signup counts for the admin reports.
+
+    ``rollup`` only reads rows stamped after the watermark, so it is cheap to run every few
+    minutes; reports then sum at most a year of daily rows instead of scanning enrollments."""
+
+    WATERMARK = "daily"
+    EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+    MAX_REPORT_DAYS = 366
+
+    @staticmethod
+    def _daily_counts(queryset, field: str, start: datetime, end: datetime, *columns: str):
+        return (
+            queryset.filter(**{f"{field}__gt": start, f"{field}__lte": end})
+            .annotate(day=TruncDate(field))
+            .order_by()
+            .values("day", *columns)
+            .annotate(n=Count("id"))
+        )
+
+    @staticmethod
+    def _merge_course_days(start: datetime, end: datetime) -> int:
+        rows: Dict[Tuple[date, int], Dict[str, Any]] = {}
+        for column, field in (("enrollments", "enrolled_at"), ("cancellations", "cancelled_at")):
+            counts = EnrollmentRollupService._daily_counts(
+                Enrollment.objects.all(), field, start, end, "course_id", "course__category_id"
+            )
+            for item in counts:
+                row = rows.setdefault((item["day"], item["course_id"]), {
+                    "category_id": item["course__category_id"], "enrollments": 0, "cancellations": 0,
+                })
+                row[column] += item["n"]
+        if not rows:
+            return 0
+
+        existing = {
+            (rollup.date, rollup.course_id): rollup
+            for rollup in DailyEnrollmentRollup.objects.filter(
+                date__in={day for day, _ in rows}, course_id__in={course_id for _, course_id in rows}
+            )
+        }
+        updated, created = [], []
+        for (day, course_id), row in rows.items():
+            rollup = existing.get((day, course_id))
+            if rollup is None:
+                created.append(DailyEnrollmentRollup(date=day, course_id=course_id, **row))
+                continue
+            rollup.enrollments += row["enrollments"]
+            rollup.cancellations += row["cancellations"]
+            updated.append(rollup)
+        DailyEnrollmentRollup.objects.bulk_update(updated, ["enrollments", "cancellations"], batch_size=500)
+        DailyEnrollmentRollup.objects.bulk_create(created, batch_size=500)
+        return len(rows)
+
+    @staticmethod
+    def _merge_signup_days(start: datetime, end: datetime) -> int:
+        rows = {
+            (item["day"], item["role"]): item["n"]
+            for item in EnrollmentRollupService._daily_counts(User.objects.all(), "date_joined", start, end, "role")
+        }
+        if not rows:
+            return 0
+
+        existing = {
+            (rollup.date, rollup.role): rollup
+            for rollup in DailySignupRollup.objects.filter(date__in={day for day, _ in rows})
+        }
+        updated, created = [], []
+        for (day, role), signups in rows.items():
+            rollup = existing.get((day, role))
+            if rollup is None:
+                created.append(DailySignupRollup(date=day, role=role, signups=signups))
+                continue
+            rollup.signups += signups
+            updated.append(rollup)
+        DailySignupRollup.objects.bulk_update(updated, ["signups"], batch_size=500)
+        DailySignupRollup.objects.bulk_create(created, batch_size=500)
+        return len(rows)
+
+    @staticmethod
+    def rollup(settle_seconds: Optional[int] = None) -> Dict[str, Any]:
+        """Fold rows stamped between the watermark and ``now - settle_seconds`` into the daily tables.
+
+        The settle lag keeps rows whose transaction is still open (stamped earlier, committed later)
+        out of the window until they are visible."""
+        if settle_seconds is None:
+            settle_seconds = settings.ROLLUP_SETTLE_SECONDS
+        end = timezone.now() - timedelta(seconds=settle_seconds)
+
+        with transaction.atomic():
+            RollupWatermark.objects.get_or_create(
+                name=EnrollmentRollupService.WATERMARK, defaults={"value": EnrollmentRollupService.EPOCH}
+            )
+            # Locking the watermark serializes concurrent runs so no window is counted twice.
+            watermark = RollupWatermark.objects.select_for_update().get(name=EnrollmentRollupService.WATERMARK)
+            start = watermark.value
+            if end <= start:
+                return {"start": start, "end": start, "course_days": 0, "signup_days": 0}
+
+            course_days = EnrollmentRollupService._merge_course_days(start, end)
+            signup_days = EnrollmentRollupService._merge_signup_days(start, end)
+            watermark.value = end
+            watermark.save(update_fields=["value"])
+        return {"start": start, "end": end, "course_days": course_days, "signup_days": signup_days}
+
+    @staticmethod
+    def rebuild(settle_seconds: Optional[int] = None) -> Dict[str, Any]:
+        with transaction.atomic():
+            DailyEnrollmentRollup.objects.all().delete()
+            DailySignupRollup.objects.all().delete()
+            RollupWatermark.objects.filter(name=EnrollmentRollupService.WATERMARK).delete()
+            return EnrollmentRollupService.rollup(settle_seconds)
+
+    @staticmethod
+    def watermark() -> Optional[datetime]:
+        return RollupWatermark.objects.using(read_db()).filter(
+            name=EnrollmentRollupService.WATERMARK
+        ).values_list("value", flat=True).first()
+
+    @staticmethod
+    def report(days: int = 30, category_id: Optional[int] = None) -> Dict[str, Any]:
+        """Daily series and totals for the last ``days`` days (today included), read only from the rollups."""
+        db = read_db()
+        since = timezone.localdate() - timedelta(days=days - 1)
+        enrollments = DailyEnrollmentRollup.objects.using(db).filter(date__gte=since)
+        if category_id is not None:
+            enrollments = enrollments.filter(category_id=category_id)
+        signups = DailySignupRollup.objects.using(db).filter(date__gte=since)
+
+        enrollment_days = {
+            item["date"]: item
+            for item in enrollments.order_by().values("date").annotate(
+                enrollments=Sum("enrollments"), cancellations=Sum("cancellations")
+            )
+        }
+        signup_days = dict(signups.order_by().values("date").annotate(n=Sum("signups")).values_list("date", "n"))
+
+        series = []
+        for offset in range(days):
+            day = since + timedelta(days=offset)
+            counts = enrollment_days.get(day, {})
+            series.append({
+                "date": day.isoformat(),
+                "enrollments": counts.get("enrollments", 0),
+                "cancellations": counts.get("cancellations", 0),
+                "signups": signup_days.get(day, 0),
+            })
+
+        by_category = [
+            {
+                "category_id": item["category_id"],
+                "category": item["category__name"],
+                "enrollments": item["enrollments"],
+                "cancellations": item["cancellations"],
+            }
+            for item in enrollments.order_by().values("category_id", "category__name").annotate(
+                enrollments=Sum("enrollments"), cancellations=Sum("cancellations")
+            ).order_by("-enrollments", "category_id")
+        ]
+        signups_by_role = list(
+            signups.order_by().values("role").annotate(signups=Sum("signups")).order_by("role")
+        )
+
+        return {
+            "days": days,
+            "since": since.isoformat(),
+            "as_of": EnrollmentRollupService.watermark(),
+            "totals": {
+                "enrollments": sum(day["enrollments"] for day in series),
+                "cancellations": sum(day["cancellations"] for day in series),
+                "signups": sum(day["signups"] for day in series),
+            },
+            "series": series,
+            "by_category": by_category,
+            "signups_by_role": signups_by_role,
+        }
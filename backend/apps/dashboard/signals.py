@@ -0,0 +1,111 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+
+from apps.accounts.signals import users_bulk_changed
+from apps.courses.models import Course
+from apps.courses.services import CourseCounterService
+from apps.enrollments.models import Enrollment
+from apps.enrollments.signals import enrollments_bulk_changed
+from .services import DashboardSnapshotService, InstructorStatsService
+
+User = get_user_model()
+
+TRACKED_FIELDS = {
+	User: ("role", "is_active"),
+	Course: ("status", "instructor_id", "category_id"),
+	Enrollment: ("status", "course_id", "student_id"),
+}
+
+SNAPSHOT_COUNTERS = {
+	User: DashboardSnapshotService.user_counters,
+	Course: DashboardSnapshotService.course_counters,
+	Enrollment: DashboardSnapshotService.enrollment_counters,
+}
+
+
+def _loaded_state(instance):
+	fields = TRACKED_FIELDS[type(instance)]
+	if any(field not in instance.__dict__ for field in fields):
+		return None
+	return {field: instance.__dict__[field] for field in fields}
+
+
+def _current_state(instance, old=None):
+	# A field still deferred after save() was not written, so it keeps its old value without a query.
+	return {
+		field: old[field] if old and field not in instance.__dict__ else getattr(instance, field)
+		for field in TRACKED_FIELDS[type(instance)]
+	}
+
+
+def remember_state(sender, instance, **kwargs):
+	# Deferred fields are left unknown instead of triggering a query per row.
+	instance._dashboard_state = _loaded_state(instance) if instance.pk else None
+
+
+def load_missing_state(sender, instance, **kwargs):
+	if instance._state.adding or getattr(instance, "_dashboard_state", None) is not None:
+		return
+	fields = TRACKED_FIELDS[sender]
+	instance._dashboard_state = sender._default_manager.filter(pk=instance.pk).values(*fields).first()
+
+
+def _apply_change(sender, instance, old, new):
+	counters = SNAPSHOT_COUNTERS[sender]
+	DashboardSnapshotService.apply_deltas(
+		DashboardSnapshotService.diff(counters(old) if old else {}, counters(new) if new else {})
+	)
+	if sender is Course:
+		InstructorStatsService.apply_course_change(instance.pk, old, new)
+		CourseCounterService.apply_course_change(old, new)
+	elif sender is Enrollment:
+		InstructorStatsService.apply_enrollment_change(old, new)
+		CourseCounterService.apply_enrollment_changes([(old, new)])
+
+
+def update_counters_on_save(sender, instance, created, **kwargs):
+	old = None if created else getattr(instance, "_dashboard_state", None)
+	new = _current_state(instance, old)
+	_apply_change(sender, instance, old, new)
+	instance._dashboard_state = new
+
+
+def update_counters_on_delete(sender, instance, **kwargs):
+	old = getattr(instance, "_dashboard_state", None) or _current_state(instance)
+	_apply_change(sender, instance, old, None)
+
+
+def _bulk_snapshot_deltas(model, changes):
+	counters = SNAPSHOT_COUNTERS[model]
+	deltas = {}
+	for old, new in changes:
+		for key, delta in DashboardSnapshotService.diff(
+			counters(old) if old else {}, counters(new) if new else {}
+		).items():
+			deltas[key] = deltas.get(key, 0) + delta
+	return deltas
+
+
+def update_user_counters_on_bulk_change(sender, changes, **kwargs):
+	DashboardSnapshotService.apply_deltas(_bulk_snapshot_deltas(User, changes))
+
+
+def update_counters_on_bulk_change(sender, changes, **kwargs):
+	DashboardSnapshotService.apply_deltas(_bulk_snapshot_deltas(Enrollment, changes))
+	InstructorStatsService.apply_enrollment_changes(changes)
+	CourseCounterService.apply_enrollment_changes(changes)
+
+
+def connect_signals():
+	for model in TRACKED_FIELDS:
+		uid = f"dashboard_stats_{model._meta.label_lower}"
+		post_init.connect(remember_state, sender=model, dispatch_uid=uid)
+		pre_save.connect(load_missing_state, sender=model, dispatch_uid=uid)
+		post_save.connect(update_counters_on_save, sender=model, dispatch_uid=uid)
+		post_delete.connect(update_counters_on_delete, sender=model, dispatch_uid=uid)
+	enrollments_bulk_changed.connect(
+		update_counters_on_bulk_change, sender=Enrollment, dispatch_uid="dashboard_stats_bulk_enrollments"
+	)
+	users_bulk_changed.connect(
+		update_user_counters_on_bulk_change, sender=User, dispatch_uid="dashboard_stats_bulk_users"
+	)
@@ -0,0 +1,130 @@
+import threading
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APITestCase
+
+from apps.courses.tests import create_courses
+from apps.enrollments.models import Enrollment
+from apps.enrollments.services import EnrollmentManagementService
+
+from .models import CourseEnrollmentStats, DashboardSnapshot, InstructorStats, InstructorStudent
+from .services import DashboardSnapshotService, EnrollmentRollupService, InstructorStatsService
+
+User = get_user_model()
+
+
+class SnapshotRebuildTests(TestCase):
+    def setUp(self):
+        create_courses(3)
+
+    def test_rebuild_recounts_in_place(self):
+        DashboardSnapshotService.rebuild()
+        DashboardSnapshot.objects.filter(key="courses.total").update(value=99)
+        DashboardSnapshot.objects.create(key="users.role.retired", value=4)
+        counters = DashboardSnapshotService.rebuild()
+        self.assertEqual(counters, DashboardSnapshotService.compute_counters())
+        stored = DashboardSnapshotService.stored_counters()
+        self.assertEqual(stored["courses.total"], 3)
+        self.assertEqual(stored["users.role.retired"], 0)
+
+    def test_deltas_after_rebuild(self):
+        DashboardSnapshotService.rebuild()
+        create_courses(1, prefix="later")
+        self.assertEqual(DashboardSnapshotService.get_counters()["courses.total"], 4)
+
+
+class ConcurrentRebuildTests(TransactionTestCase):
+    """Cold ``get_counters()`` calls racing into ``rebuild()`` on separate connections."""
+
+    threads = 6
+
+    def test_cold_readers_rebuild_without_errors(self):
+        create_courses(2)
+        DashboardSnapshot.objects.all().delete()
+        barrier = threading.Barrier(self.threads)
+        errors = []
+
+        def read():
+            try:
+                barrier.wait()
+                DashboardSnapshotService.get_counters()
+            except Exception as exc:
+                errors.append(f"{type(exc).__name__}: {exc}")
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=read) for _ in range(self.threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(DashboardSnapshotService.stored_counters(), DashboardSnapshotService.compute_counters())
+
+
+class BulkEnrollmentStatsTests(TestCase):
+    def setUp(self):
+        self.courses = create_courses(2)
+        # Both courses under one instructor, so students shared between them count once.
+        for course in self.courses:
+            course.instructor = self.courses[0].instructor
+            course.save()
+        self.students = [User.objects.create_user(email=f"bulk{n}@example.com") for n in range(6)]
+        InstructorStatsService.rebuild()
+
+    def stats(self):
+        return (
+            sorted(InstructorStats.objects.values_list(
+                "instructor_id", "course_count", "total_students", "total_enrollments",
+                "active_enrollments", "pending_enrollments",
+            )),
+            sorted(CourseEnrollmentStats.objects.values_list(
+                "course_id", "total_enrollments", "active_enrollments", "pending_enrollments",
+            )),
+            sorted(InstructorStudent.objects.values_list("instructor_id", "student_id", "enrollment_count")),
+        )
+
+    def assertMatchesRebuild(self):
+        incremental = self.stats()
+        InstructorStatsService.rebuild()
+        self.assertEqual(incremental, self.stats())
+
+    def test_bulk_changes_match_a_rebuild(self):
+        Enrollment.objects.create(student=self.students[0], course=self.courses[0], status="pending")
+        cancelled = Enrollment.objects.create(student=self.students[1], course=self.courses[1], status="active")
+        cancelled.cancel()
+        cancelled.save()
+        pairs = [(student.pk, course.pk) for student in self.students for course in self.courses]
+        with transaction.atomic():
+            EnrollmentManagementService.activate_enrollments(pairs)
+        self.assertMatchesRebuild()
+
+    def test_bulk_changes_do_not_rebuild(self):
+        pairs = [(student.pk, self.courses[0].pk) for student in self.students]
+        with transaction.atomic():
+            EnrollmentManagementService.activate_enrollments(pairs[:1])
+        original = InstructorStatsService._rebuild
+        InstructorStatsService._rebuild = staticmethod(lambda *args: self.fail("rebuilt the stats"))
+        try:
+            with transaction.atomic():
+                EnrollmentManagementService.activate_enrollments(pairs)
+        finally:
+            InstructorStatsService._rebuild = original
+        self.assertMatchesRebuild()
+
+
+class ReportsParamTests(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(User.objects.create_user(email="admin@example.com", role=User.ROLE_ADMIN))
+
+    def test_bounded_param(self):
+        response = self.client.get("/api/dashboard/reports/", {"days": 0})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["days"], f"Must be between 1 and {EnrollmentRollupService.MAX_REPORT_DAYS}.")
+
+    def test_unbounded_param(self):
+        response = self.client.get("/api/dashboard/reports/", {"category": 0})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["category"], "Must be at least 1.")
@@ -1,7 +1,11 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import DashboardSummaryView
+from .views import AsyncDashboardSummaryView, DashboardSummaryView, ReportsView
+
+summary_view = AsyncDashboardSummaryView if settings.ASYNC_READ_VIEWS else DashboardSummaryView
 
 urlpatterns = [
-	path("summary/", DashboardSummaryView.as_view(), name="dashboard-summary"),
+	path("summary/", summary_view.as_view(), name="dashboard-summary"),
+	path("reports/", ReportsView.as_view(), name="dashboard-reports"),
 ]
@@ -1,8 +1,14 @@
+from django.utils import timezone
 from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .services import DashboardStatsService
+from apps.accounts.views import IsAdminRole
+from core.async_views import AsyncAPIViewMixin
+from core.conditional import add_validators, make_validators, not_modified
+
+from .services import DashboardStatsService, EnrollmentRollupService
 
 
 class DashboardSummaryView(APIView):
@@ -11,3 +17,43 @@ class DashboardSummaryView(APIView):
     def get(self, request):
         data = DashboardStatsService.get_dashboard_for_user(request.user)
         return Response(data)
+
+
+class AsyncDashboardSummaryView(AsyncAPIViewMixin, DashboardSummaryView):
+    async def get(self, request):
+        data = await DashboardStatsService.aget_dashboard_for_user(request.user)
+        return Response(data)
+
+
+class ReportsView(APIView):
+    """Enrollment, cancellation and signup trends, answered from the daily rollups.
+
+    Figures are as of the last ``rollup_enrollment_stats`` run, reported in ``as_of``."""
+
+    permission_classes = [IsAdminRole]
+
+    def _int_param(self, name, default=None, minimum=1, maximum=None):
+        value = self.request.query_params.get(name)
+        if value in (None, ""):
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValidationError({name: "Must be an integer."})
+        if maximum is None and value < minimum:
+            raise ValidationError({name: f"Must be at least {minimum}."})
+        if maximum is not None and not minimum <= value <= maximum:
+            raise ValidationError({name: f"Must be between {minimum} and {maximum}."})
+        return value
+
+    def get(self, request):
+        days = self._int_param("days", default=30, maximum=EnrollmentRollupService.MAX_REPORT_DAYS)
+        category_id = self._int_param("category")
+
+        # The rollups only change when the watermark moves (or the day rolls over).
+        as_of = EnrollmentRollupService.watermark()
+        validators = make_validators("reports", days, category_id, as_of, timezone.localdate(), last_modified=as_of)
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+        return add_validators(Response(EnrollmentRollupService.report(days, category_id)), validators)
@@ -0,0 +1,101 @@
+import threading
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.courses.models import Course
+from apps.enrollments.exceptions import AlreadyEnrolledError
+from apps.enrollments.models import Enrollment
+from apps.enrollments.services import EnrollmentManagementService
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Race many threads enrolling the same student into the same course, first as a new "
+        "enrollment and then as a reactivation, and check exactly one call wins each round"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=16)
+        parser.add_argument("--student-email", help="Default: a student with at least one course left to join")
+        parser.add_argument("--course-id", type=int, help="Default: a published course the student is not in")
+
+    def handle(self, *args, **options):
+        student, course = self._pick(options["student_email"], options["course_id"])
+        self.stdout.write(f"Racing {options['threads']} threads: {student.email} -> course {course.pk}")
+
+        failures = []
+        try:
+            first = self._race(student, course, options["threads"], "new", failures)
+
+            enrollment = Enrollment.objects.get(pk=first)
+            enrollment.cancel()
+            enrollment.save()
+            second = self._race(student, course, options["threads"], "reactivate", failures)
+            if first != second:
+                failures.append(f"reactivation created enrollment {second} instead of reusing {first}")
+        finally:
+            # Delete through the model so the denormalized counters follow.
+            for enrollment in Enrollment.objects.filter(student=student, course=course):
+                enrollment.delete()
+
+        if failures:
+            raise CommandError("\n".join(failures))
+        self.stdout.write(self.style.SUCCESS("No duplicate enrollments or integrity errors"))
+
+    def _pick(self, email, course_id):
+        students = User.objects.filter(role=User.ROLE_STUDENT, is_active=True)
+        student = students.filter(email=email).first() if email else students.first()
+        if student is None:
+            raise CommandError("No student found; run seed_synthetic or pass --student-email.")
+
+        courses = Course.objects.exclude(enrollments__student=student)
+        course = courses.filter(pk=course_id).first() if course_id else courses.filter(
+            status=Course.STATUS_PUBLISHED
+        ).first()
+        if course is None:
+            raise CommandError("No course the student is not already enrolled in.")
+        return student, course
+
+    def _race(self, student, course, threads, label, failures):
+        barrier = threading.Barrier(threads)
+        outcomes = Counter()
+        enrollment_ids = set()
+        lock = threading.Lock()
+
+        def enroll():
+            barrier.wait()
+            try:
+                enrollment = EnrollmentManagementService.create_enrollment(student, course, status="active")
+                outcome = "enrolled"
+                with lock:
+                    enrollment_ids.add(enrollment.pk)
+            except AlreadyEnrolledError:
+                outcome = "already_enrolled"
+            except Exception as exc:
+                outcome = f"error: {type(exc).__name__}: {exc}"
+            finally:
+                connection.close()
+            with lock:
+                outcomes[outcome] += 1
+
+        workers = [threading.Thread(target=enroll) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        rows = Enrollment.objects.filter(student=student, course=course).count()
+        self.stdout.write(f"{label:>10}: {dict(outcomes)}; rows={rows}")
+        if outcomes["enrolled"] != 1:
+            failures.append(f"{label}: {outcomes['enrolled']} calls succeeded, expected exactly 1")
+        if rows != 1:
+            failures.append(f"{label}: {rows} enrollment rows for the pair")
+        errors = [outcome for outcome in outcomes if outcome.startswith("error")]
+        if errors:
+            failures.append(f"{label}: unexpected errors {errors}")
+        return next(iter(enrollment_ids), None)
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-18 01:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0004_course_course_published_created_idx_and_more'),
+        ('enrollments', '0003_enrollment_enroll_student_enrolled_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['student', 'status', '-enrolled_at', '-id'], name='enroll_student_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['course', 'status', '-enrolled_at', '-id'], name='enroll_course_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollmentrequest',
+            index=models.Index(fields=['instructor', 'status', '-created_at', '-id'], name='enrollreq_instr_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollmentrequest',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['course', 'id'], name='enrollreq_pending_course_idx'),
+        ),
+    ]
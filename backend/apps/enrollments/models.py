@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 from apps.courses.models import Course
 
@@ -17,14 +18,29 @@ class Enrollment(models.Model):
 	course = models.ForeignKey(Course, on_delete=models.PROTECT, related_name="enrollments")
 	enrolled_at = models.DateTimeField(auto_now_add=True)
 	status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_ACTIVE)
+	# Time of the latest cancellation; kept on reactivation so reports still count it.
+	cancelled_at = models.DateTimeField(null=True, blank=True, editable=False)
 
 	class Meta:
 		unique_together = ("student", "course")
 		ordering = ("-enrolled_at",)
+		indexes = [
+			models.Index(fields=["student", "-enrolled_at", "-id"], name="enroll_student_enrolled_idx"),
+			models.Index(fields=["course", "-enrolled_at", "-id"], name="enroll_course_enrolled_idx"),
+			models.Index(fields=["student", "status", "-enrolled_at", "-id"], name="enroll_student_status_idx"),
+			models.Index(fields=["course", "status", "-enrolled_at", "-id"], name="enroll_course_status_idx"),
+			# Range scans for the daily report rollups.
+			models.Index(fields=["enrolled_at"], name="enroll_enrolled_at_idx"),
+			models.Index(fields=["cancelled_at"], name="enroll_cancelled_at_idx", condition=models.Q(cancelled_at__isnull=False)),
+		]
 
 	def __str__(self):
 		return f"{self.student.email} -> {self.course.title}"
 
+	def cancel(self):
+		self.status = self.STATUS_CANCELLED
+		self.cancelled_at = timezone.now()
+
 
 class EnrollmentRequest(models.Model):
 	STATUS_PENDING = "pending"
@@ -48,6 +64,13 @@ class EnrollmentRequest(models.Model):
 	class Meta:
 		unique_together = ("student", "course")
 		ordering = ("-created_at",)
+		indexes = [
+			models.Index(fields=["instructor", "-created_at", "-id"], name="enrollreq_instr_created_idx"),
+			models.Index(fields=["student", "-created_at", "-id"], name="enrollreq_student_created_idx"),
+			models.Index(fields=["instructor", "status", "-created_at", "-id"], name="enrollreq_instr_status_idx"),
+			# Batch approval walks a course's pending queue; decided requests are never scanned.
+			models.Index(fields=["course", "id"], name="enrollreq_pending_course_idx", condition=models.Q(status="pending")),
+		]
 
 	def __str__(self):
 		return f"{self.student.email} -> {self.course.title} ({self.status})"
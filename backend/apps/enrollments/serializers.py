@@ -1,13 +1,17 @@
+import csv
+import io
+
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
 from apps.courses.models import Course
+from core.projection import ProjectedSerializerMixin
 from .models import Enrollment, EnrollmentRequest
 
 User = get_user_model()
 
 
-class EnrollmentSerializer(serializers.ModelSerializer):
+class EnrollmentSerializer(ProjectedSerializerMixin, serializers.ModelSerializer):
     course_title = serializers.ReadOnlyField(source="course.title")
     course_status = serializers.ReadOnlyField(source="course.status")
 
@@ -15,6 +19,7 @@ class EnrollmentSerializer(serializers.ModelSerializer):
         model = Enrollment
         fields = ["id", "course", "course_title", "course_status", "enrolled_at", "status"]
         read_only_fields = ["id", "course_title", "course_status", "enrolled_at", "status"]
+        summary_fields = ["id", "course", "course_title", "status", "enrolled_at"]
 
 
 class EnrollmentCreateSerializer(serializers.Serializer):
@@ -77,6 +82,64 @@ class InstructorEnrollSerializer(serializers.Serializer):
         return enrollment
 
 
+class BulkEnrollSerializer(serializers.Serializer):
+    MAX_ROWS = 5000
+
+    student_emails = serializers.ListField(child=serializers.CharField(allow_blank=True), required=False)
+    file = serializers.FileField(required=False)
+
+    def validate(self, attrs):
+        if "file" in attrs:
+            emails = self._read_csv(attrs["file"])
+        elif "student_emails" in attrs:
+            emails = attrs["student_emails"]
+        else:
+            raise serializers.ValidationError("Provide student_emails or a CSV file.")
+
+        if not emails:
+            raise serializers.ValidationError("No student emails provided.")
+        if len(emails) > self.MAX_ROWS:
+            raise serializers.ValidationError(f"At most {self.MAX_ROWS} rows can be enrolled at once.")
+        attrs["emails"] = emails
+        return attrs
+
+    def _read_csv(self, upload):
+        try:
+            text = upload.read().decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise serializers.ValidationError({"file": "CSV file must be UTF-8 encoded."})
+
+        rows = [row for row in csv.reader(io.StringIO(text)) if any(cell.strip() for cell in row)]
+        if not rows:
+            return []
+
+        header = [cell.strip().lower() for cell in rows[0]]
+        if "email" in header:
+            column = header.index("email")
+            rows = rows[1:]
+        elif "student_email" in header:
+            column = header.index("student_email")
+            rows = rows[1:]
+        else:
+            column = 0
+        return [row[column] if len(row) > column else "" for row in rows]
+
+
+class EnrollmentRequestBatchActionSerializer(serializers.Serializer):
+    MAX_REQUESTS = 5000
+
+    action = serializers.ChoiceField(choices=["approve", "reject"])
+    request_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=False, max_length=MAX_REQUESTS
+    )
+    course_id = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        if ("request_ids" in attrs) == ("course_id" in attrs):
+            raise serializers.ValidationError("Provide either request_ids or course_id.")
+        return attrs
+
+
 class EnrollmentRequestSerializer(serializers.ModelSerializer):
     course_title = serializers.ReadOnlyField(source="course.title")
     student_email = serializers.ReadOnlyField(source="student.email")
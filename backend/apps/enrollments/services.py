@@ -1,7 +1,13 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import connections, router, transaction
 from django.db.models import QuerySet, Q, Count
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+from core.routers import read_db, stick_to_primary
 from .models import Enrollment, EnrollmentRequest
+from .signals import enrollments_bulk_changed
 from .validators import EnrollmentValidator, EnrollmentRequestValidator
 from .exceptions import EnrollmentNotFoundError, EnrollmentRequestNotFoundError
 
@@ -10,22 +16,81 @@ User = get_user_model()
 
 class EnrollmentManagementService:
     
+    # Rows per INSERT statement; four parameters each.
+    INSERT_BATCH_SIZE = 500
+    
+    @staticmethod
+    def _insert_many_if_absent(pairs: List[Tuple[int, int]], status: str, enrolled_at) -> Dict[Tuple[int, int], int]:
+        """INSERT ... ON CONFLICT DO NOTHING for (student_id, course_id) pairs.
+
+        Returns the new id of each pair actually inserted; pairs that already existed are left out.
+        """
+        connection = connections[router.db_for_write(Enrollment)]
+        quote = connection.ops.quote_name
+        opts = Enrollment._meta
+        student, course, status_field, enrolled = (
+            opts.get_field(name) for name in ('student', 'course', 'status', 'enrolled_at')
+        )
+        enrolled_value = enrolled.get_db_prep_save(enrolled_at, connection)
+        inserted = {}
+        for start in range(0, len(pairs), EnrollmentManagementService.INSERT_BATCH_SIZE):
+            batch = pairs[start:start + EnrollmentManagementService.INSERT_BATCH_SIZE]
+            sql = (
+                f"INSERT INTO {quote(opts.db_table)} "
+                f"({quote(student.column)}, {quote(course.column)}, {quote(status_field.column)}, {quote(enrolled.column)}) "
+                f"VALUES {', '.join(['(%s, %s, %s, %s)'] * len(batch))} "
+                f"ON CONFLICT ({quote(student.column)}, {quote(course.column)}) DO NOTHING "
+                f"RETURNING {quote(opts.pk.column)}, {quote(student.column)}, {quote(course.column)}"
+            )
+            params = [value for student_id, course_id in batch for value in (student_id, course_id, status, enrolled_value)]
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                inserted.update({(student_id, course_id): pk for pk, student_id, course_id in cursor.fetchall()})
+        return inserted
+    
     @staticmethod
+    def _insert_if_absent(student_id: int, course_id: int, status: str, enrolled_at) -> Optional[int]:
+        """INSERT ... ON CONFLICT DO NOTHING; the new id, or None when the pair already exists."""
+        inserted = EnrollmentManagementService._insert_many_if_absent([(student_id, course_id)], status, enrolled_at)
+        return inserted.get((student_id, course_id))
+    
+    @staticmethod
+    @transaction.atomic
     def create_enrollment(student, course, status: str = 'pending') -> Enrollment:
-        existing = Enrollment.objects.filter(
-            student=student, course=course
-        ).first()
-        
-        EnrollmentValidator.validate_new_enrollment(student, course, existing)
-        
-        if existing and existing.status in ['cancelled', 'completed']:
-            existing.delete()
+        """Enroll with a single INSERT ... ON CONFLICT DO NOTHING.
+
+        If the pair already exists its row is locked instead: a cancelled or
+        completed enrollment is reactivated in place, anything else raises
+        ``AlreadyEnrolledError``. Concurrent calls never hit the unique constraint.
+        """
+        # The student's next reads (my courses, dashboard) must see the row.
+        transaction.on_commit(lambda: stick_to_primary(student.pk))
         
-        return Enrollment.objects.create(
-            student=student,
-            course=course,
-            status=status
-        )
+        while True:
+            now = timezone.now()
+            enrollment_id = EnrollmentManagementService._insert_if_absent(student.pk, course.pk, status, now)
+            if enrollment_id is not None:
+                enrollment = Enrollment(
+                    id=enrollment_id, student=student, course=course, status=status, enrolled_at=now
+                )
+                enrollment._state.adding = False
+                enrollment._state.db = router.db_for_write(Enrollment)
+                # The raw INSERT skips post_save.
+                enrollments_bulk_changed.send(sender=Enrollment, changes=[
+                    (None, {'status': status, 'course_id': course.pk, 'student_id': student.pk})
+                ])
+                return enrollment
+            
+            existing = Enrollment.objects.select_for_update().filter(student=student, course=course).first()
+            if existing is None:
+                # Deleted between the INSERT and the lock; insert again.
+                continue
+            
+            EnrollmentValidator.validate_new_enrollment(student, course, existing)
+            existing.status = status
+            existing.enrolled_at = now
+            existing.save(update_fields=['status', 'enrolled_at'])
+            return existing
     
     @staticmethod
     def enroll_student_by_email(instructor, course, student_email: str) -> Enrollment:
@@ -44,13 +109,137 @@ class EnrollmentManagementService:
         )
     
     @staticmethod
+    def activate_enrollments(pairs: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Tuple[str, Enrollment]]:
+        """Activate (student_id, course_id) pairs in bulk inside the caller's transaction.
+
+        Returns ``new``, ``reactivated`` or ``already_enrolled`` with the enrollment for each pair.
+        New rows go in with INSERT ... ON CONFLICT DO NOTHING, so a pair enrolled concurrently
+        (a student enrolling during a bulk enroll) is reported as ``already_enrolled``
+        instead of failing the batch on the unique constraint.
+        """
+        pending = set(pairs)
+        outcomes = {}
+        to_reactivate = []
+        changes = []
+        now = timezone.now()
+        while pending:
+            existing = {
+                (enrollment.student_id, enrollment.course_id): enrollment
+                for enrollment in Enrollment.objects.select_for_update().filter(
+                    student_id__in={student_id for student_id, _ in pending},
+                    course_id__in={course_id for _, course_id in pending},
+                )
+            }
+            absent = []
+            for student_id, course_id in pending:
+                state = {'status': 'active', 'course_id': course_id, 'student_id': student_id}
+                enrollment = existing.get((student_id, course_id))
+                if enrollment is None:
+                    absent.append((student_id, course_id))
+                elif enrollment.status in ['cancelled', 'completed']:
+                    changes.append(({**state, 'status': enrollment.status}, state))
+                    enrollment.status = 'active'
+                    enrollment.enrolled_at = now
+                    to_reactivate.append(enrollment)
+                    outcomes[(student_id, course_id)] = ('reactivated', enrollment)
+                else:
+                    outcomes[(student_id, course_id)] = ('already_enrolled', enrollment)
+            
+            inserted = EnrollmentManagementService._insert_many_if_absent(sorted(absent), 'active', now)
+            db = router.db_for_write(Enrollment)
+            for (student_id, course_id), enrollment_id in inserted.items():
+                enrollment = Enrollment(
+                    id=enrollment_id, student_id=student_id, course_id=course_id, status='active', enrolled_at=now
+                )
+                enrollment._state.adding = False
+                enrollment._state.db = db
+                changes.append((None, {'status': 'active', 'course_id': course_id, 'student_id': student_id}))
+                outcomes[(student_id, course_id)] = ('new', enrollment)
+            # Pairs another transaction inserted meanwhile: read them back (locked) on the next pass.
+            pending = set(absent) - set(inserted)
+            if pending:
+                raced = {
+                    (enrollment.student_id, enrollment.course_id): enrollment
+                    for enrollment in Enrollment.objects.select_for_update().filter(
+                        student_id__in={student_id for student_id, _ in pending},
+                        course_id__in={course_id for _, course_id in pending},
+                    )
+                }
+                for pair in list(pending):
+                    if pair in raced:
+                        outcomes[pair] = ('already_enrolled', raced[pair])
+                        pending.discard(pair)
+        
+        Enrollment.objects.bulk_update(to_reactivate, ['status', 'enrolled_at'], batch_size=1000)
+        
+        if changes:
+            enrollments_bulk_changed.send(sender=Enrollment, changes=changes)
+            student_ids = {state['student_id'] for _, state in changes}
+            transaction.on_commit(lambda: stick_to_primary(*student_ids))
+        
+        return outcomes
+    
+    @staticmethod
+    def bulk_enroll_students(instructor, course, student_emails: List[str]) -> Dict[str, Any]:
+        if course.instructor_id != instructor.id and instructor.role != 'admin' and not instructor.is_staff:
+            from .exceptions import EnrollmentPermissionError
+            raise EnrollmentPermissionError(
+                "You can only enroll students in your own courses"
+            )
+        
+        rows = []
+        seen = set()
+        for index, raw_email in enumerate(student_emails, start=1):
+            email = (raw_email or '').strip()
+            row = {'row': index, 'email': email}
+            try:
+                validate_email(email)
+            except DjangoValidationError:
+                row['result'] = 'invalid'
+            else:
+                if email in seen:
+                    row['result'] = 'duplicate'
+                seen.add(email)
+            rows.append(row)
+        
+        with transaction.atomic():
+            students = dict(
+                User.objects.filter(email__in=seen, role='student').values_list('email', 'id')
+            )
+            outcomes = EnrollmentManagementService.activate_enrollments(
+                [(student_id, course.id) for student_id in students.values()]
+            )
+        
+        for row in rows:
+            if 'result' in row:
+                continue
+            student_id = students.get(row['email'])
+            if student_id is None:
+                row['result'] = 'not_found'
+                continue
+            row['result'], row['enrollment'] = outcomes[(student_id, course.id)]
+        
+        summary = {}
+        for row in rows:
+            enrollment = row.pop('enrollment', None)
+            if enrollment is not None:
+                row['enrollment_id'] = enrollment.id
+            summary[row['result']] = summary.get(row['result'], 0) + 1
+        
+        return {'summary': summary, 'rows': rows}
+    
+    @staticmethod
+    @transaction.atomic
     def update_enrollment_status(user, enrollment_id: int, new_status: str) -> Enrollment:
         enrollment = EnrollmentManagementService.get_enrollment_by_id(enrollment_id)
         
         EnrollmentValidator.validate_enrollment_update_permissions(user, enrollment)
         EnrollmentValidator.validate_status_transition(enrollment.status, new_status)
         
-        enrollment.status = new_status
+        if new_status == Enrollment.STATUS_CANCELLED:
+            enrollment.cancel()
+        else:
+            enrollment.status = new_status
         enrollment.save()
         
         return enrollment
@@ -69,7 +258,7 @@ class EnrollmentQueryService:
     
     @staticmethod
     def get_student_enrollments(student, status: Optional[str] = None) -> QuerySet:
-        qs = Enrollment.objects.filter(
+        qs = Enrollment.objects.using(read_db()).filter(
             student=student
         ).select_related('course', 'course__category').order_by('-enrolled_at')
         
@@ -78,9 +267,15 @@ class EnrollmentQueryService:
         
         return qs
     
+    @staticmethod
+    def get_instructor_enrollments(instructor) -> QuerySet:
+        return Enrollment.objects.using(read_db()).filter(
+            course__instructor=instructor
+        ).select_related('course', 'student')
+    
     @staticmethod
     def get_course_enrollments(course, status: Optional[str] = None) -> QuerySet:
-        qs = Enrollment.objects.filter(
+        qs = Enrollment.objects.using(read_db()).filter(
             course=course
         ).select_related('student').order_by('-enrolled_at')
         
@@ -91,11 +286,12 @@ class EnrollmentQueryService:
     
     @staticmethod
     def get_enrollment_statistics() -> Dict[str, Any]:
-        total_enrollments = Enrollment.objects.count()
-        active_enrollments = Enrollment.objects.filter(status='active').count()
-        completed_enrollments = Enrollment.objects.filter(status='completed').count()
+        enrollments = Enrollment.objects.using(read_db())
+        total_enrollments = enrollments.count()
+        active_enrollments = enrollments.filter(status='active').count()
+        completed_enrollments = enrollments.filter(status='completed').count()
         
-        enrollments_by_status = Enrollment.objects.values('status').annotate(
+        enrollments_by_status = enrollments.values('status').annotate(
             count=Count('id')
         )
         
@@ -152,6 +348,73 @@ class EnrollmentRequestService:
         
         return request
     
+    @staticmethod
+    def batch_process_requests(instructor, action: str, request_ids: Optional[List[int]] = None,
+                               course_id: Optional[int] = None) -> Dict[str, Any]:
+        is_admin = instructor.role == 'admin'
+        
+        with transaction.atomic():
+            qs = EnrollmentRequest.objects.select_for_update()
+            if request_ids is not None:
+                qs = qs.filter(id__in=request_ids)
+            else:
+                qs = qs.filter(course_id=course_id, status='pending')
+                if not is_admin:
+                    qs = qs.filter(instructor=instructor)
+            requests = {request.id: request for request in qs.order_by('id')}
+            
+            results = {}
+            actionable = []
+            for request in requests.values():
+                if request.instructor_id != instructor.id and not is_admin:
+                    results[request.id] = {'request_id': request.id, 'result': 'forbidden'}
+                elif request.status != 'pending':
+                    results[request.id] = {'request_id': request.id, 'result': 'not_pending'}
+                else:
+                    actionable.append(request)
+            
+            if action == 'approve':
+                outcomes = EnrollmentManagementService.activate_enrollments(
+                    [(request.student_id, request.course_id) for request in actionable]
+                )
+                processed = []
+                for request in actionable:
+                    outcome, enrollment = outcomes[(request.student_id, request.course_id)]
+                    if outcome == 'already_enrolled':
+                        results[request.id] = {'request_id': request.id, 'result': 'already_enrolled'}
+                        continue
+                    processed.append(request)
+                    results[request.id] = {
+                        'request_id': request.id, 'result': 'approved', 'enrollment_id': enrollment.id
+                    }
+                new_status = 'approved'
+            else:
+                processed = actionable
+                for request in processed:
+                    results[request.id] = {'request_id': request.id, 'result': 'rejected'}
+                new_status = 'rejected'
+            
+            now = timezone.now()
+            for request in processed:
+                request.status = new_status
+                request.updated_at = now
+            EnrollmentRequest.objects.bulk_update(processed, ['status', 'updated_at'], batch_size=1000)
+        
+        if request_ids is not None:
+            ordered_ids = list(dict.fromkeys(request_ids))
+        else:
+            ordered_ids = sorted(results)
+        ordered = [
+            results.get(request_id, {'request_id': request_id, 'result': 'not_found'})
+            for request_id in ordered_ids
+        ]
+        
+        summary = {}
+        for result in ordered:
+            summary[result['result']] = summary.get(result['result'], 0) + 1
+        
+        return {'summary': summary, 'results': ordered}
+    
     @staticmethod
     def get_request_by_id(request_id: int) -> EnrollmentRequest:
         try:
@@ -163,7 +426,7 @@ class EnrollmentRequestService:
     
     @staticmethod
     def get_instructor_requests(instructor, status: Optional[str] = None) -> QuerySet:
-        qs = EnrollmentRequest.objects.filter(
+        qs = EnrollmentRequest.objects.using(read_db()).filter(
             instructor=instructor
         ).select_related('student', 'course').order_by('-created_at')
         
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Sent after bulk or raw writes that bypass post_save/post_delete.
+# ``changes`` is a list of (old_state, new_state) pairs; each state is None or a
+# dict with ``status``, ``course_id`` and ``student_id``.
+enrollments_bulk_changed = Signal()
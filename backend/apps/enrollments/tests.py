@@ -0,0 +1,103 @@
+import threading
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TransactionTestCase
+from rest_framework.test import APITestCase
+
+from apps.courses.tests import create_courses
+from core.testing import QueryCountAssertionsMixin
+
+from .exceptions import AlreadyEnrolledError
+from .models import Enrollment, EnrollmentRequest
+from .services import EnrollmentManagementService
+
+User = get_user_model()
+
+
+class EnrollmentListQueryTests(QueryCountAssertionsMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = User.objects.create_user(email="student@example.com")
+        cls.instructor = User.objects.create_user(email="instructor@example.com", role=User.ROLE_INSTRUCTOR)
+        for course in create_courses(20):
+            Enrollment.objects.create(student=cls.student, course=course)
+            course.instructor = cls.instructor
+            course.save()
+            requester = User.objects.create_user(email=f"requester.{course.pk}@example.com")
+            EnrollmentRequest.objects.create(student=requester, course=course, instructor=cls.instructor)
+
+    def test_my_courses_student(self):
+        self.client.force_authenticate(self.student)
+        self.assertConstantListQueries("/api/my-courses/")
+
+    def test_my_courses_instructor(self):
+        self.client.force_authenticate(self.instructor)
+        self.assertConstantListQueries("/api/my-courses/")
+
+    def test_my_courses_keyset(self):
+        self.client.force_authenticate(self.student)
+        self.assertConstantListQueries("/api/my-courses/", params={"pagination": "cursor"})
+
+    def test_enrollment_requests_instructor(self):
+        self.client.force_authenticate(self.instructor)
+        self.assertConstantListQueries("/api/enrollment-requests/list/")
+
+    def test_enrollment_requests_student(self):
+        requester = EnrollmentRequest.objects.first().student
+        for course in create_courses(19, prefix="requested"):
+            EnrollmentRequest.objects.create(student=requester, course=course, instructor=course.instructor)
+        self.client.force_authenticate(requester)
+        self.assertConstantListQueries("/api/enrollment-requests/list/")
+
+
+class CreateEnrollmentConcurrencyTests(TransactionTestCase):
+    """Threads racing ``create_enrollment`` for one pair, each on its own connection."""
+
+    threads = 8
+
+    def setUp(self):
+        self.student = User.objects.create_user(email="racer@example.com")
+        self.course = create_courses(1)[0]
+
+    def race(self):
+        barrier = threading.Barrier(self.threads)
+        outcomes = []
+        lock = threading.Lock()
+
+        def enroll():
+            try:
+                barrier.wait()
+                EnrollmentManagementService.create_enrollment(self.student, self.course, status="active")
+                outcome = "enrolled"
+            except AlreadyEnrolledError:
+                outcome = "already_enrolled"
+            except Exception as exc:
+                outcome = f"{type(exc).__name__}: {exc}"
+            finally:
+                connection.close()
+            with lock:
+                outcomes.append(outcome)
+
+        workers = [threading.Thread(target=enroll) for _ in range(self.threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return sorted(outcomes)
+
+    def assertSingleActiveEnrollment(self, outcomes):
+        self.assertEqual(outcomes, ["already_enrolled"] * (self.threads - 1) + ["enrolled"])
+        self.assertEqual(Enrollment.objects.filter(student=self.student, course=self.course).count(), 1)
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.enrollment_count, self.course.active_enrollment_count), (1, 1))
+
+    def test_new_enrollment(self):
+        self.assertSingleActiveEnrollment(self.race())
+
+    def test_reactivation(self):
+        enrollment = Enrollment.objects.create(student=self.student, course=self.course, status="active")
+        enrollment.cancel()
+        enrollment.save()
+        self.assertSingleActiveEnrollment(self.race())
+        self.assertEqual(Enrollment.objects.get(student=self.student, course=self.course).pk, enrollment.pk)
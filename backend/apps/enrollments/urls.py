@@ -1,21 +1,31 @@
+from django.conf import settings
 from django.urls import path
 
 from .views import (
+    AsyncMyCoursesView,
     EnrollView, 
+    EnrollmentExportView,
     InstructorEnrollView, 
+    InstructorBulkEnrollView,
     MyCoursesView,
     EnrollmentRequestCreateView,
     EnrollmentRequestListView,
     EnrollmentRequestActionView,
+    EnrollmentRequestBatchActionView,
     UnenrollStudentView
 )
 
+my_courses_view = AsyncMyCoursesView if settings.ASYNC_READ_VIEWS else MyCoursesView
+
 urlpatterns = [
 	path("enroll/<int:course_id>/", EnrollView.as_view(), name="enroll-course"),
 	path("instructor-enroll/<int:course_id>/", InstructorEnrollView.as_view(), name="instructor-enroll"),
-	path("my-courses/", MyCoursesView.as_view(), name="my-courses"),
+	path("instructor-enroll/<int:course_id>/bulk/", InstructorBulkEnrollView.as_view(), name="instructor-bulk-enroll"),
+	path("my-courses/", my_courses_view.as_view(), name="my-courses"),
+	path("my-courses/export/", EnrollmentExportView.as_view(), name="my-courses-export"),
 	path("enrollment-requests/", EnrollmentRequestCreateView.as_view(), name="enrollment-request-create"),
 	path("enrollment-requests/list/", EnrollmentRequestListView.as_view(), name="enrollment-request-list"),
+	path("enrollment-requests/batch-action/", EnrollmentRequestBatchActionView.as_view(), name="enrollment-request-batch-action"),
 	path("enrollment-requests/<int:request_id>/action/", EnrollmentRequestActionView.as_view(), name="enrollment-request-action"),
 	path("unenroll/<int:enrollment_id>/", UnenrollStudentView.as_view(), name="unenroll-student"),
 ]
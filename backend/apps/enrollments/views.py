@@ -3,15 +3,24 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import PermissionDenied, ValidationError, NotFound
 from django.contrib.auth import get_user_model
+from django.db import transaction
 
 from apps.courses.models import Course
+from core.async_views import AsyncAPIViewMixin, AsyncListModelMixin
+from core.exports import StreamingExportMixin
+from core.middleware import SerializationTimingMixin
+from core.prefetch import PrefetchPlanMixin
+from core.projection import ProjectionMixin
+from core.routers import read_db
 from .models import Enrollment, EnrollmentRequest
 from .serializers import (
+    BulkEnrollSerializer,
     EnrollmentCreateSerializer, 
     EnrollmentSerializer, 
     InstructorEnrollSerializer,
     EnrollmentRequestSerializer,
-    EnrollmentRequestCreateSerializer
+    EnrollmentRequestCreateSerializer,
+    EnrollmentRequestBatchActionSerializer
 )
 from .services import (
     EnrollmentManagementService,
@@ -55,9 +64,10 @@ class EnrollView(APIView):
             raise ValidationError(str(e))
 
 
-class MyCoursesView(generics.ListAPIView):
+class MyCoursesView(SerializationTimingMixin, PrefetchPlanMixin, ProjectionMixin, generics.ListAPIView):
     serializer_class = EnrollmentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    keyset_ordering = "-enrolled_at"
 
     def get_queryset(self):
         user = self.request.user
@@ -69,13 +79,49 @@ class MyCoursesView(generics.ListAPIView):
             return EnrollmentQueryService.get_student_enrollments(user)
         
         if user.role == User.ROLE_INSTRUCTOR:
-            return Enrollment.objects.filter(
-                course__instructor=user
-            ).select_related("course", "student")
+            return EnrollmentQueryService.get_instructor_enrollments(user)
         
         return Enrollment.objects.none()
 
 
+class AsyncMyCoursesView(AsyncAPIViewMixin, AsyncListModelMixin, MyCoursesView):
+    async def get(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
+
+
+class EnrollmentExportView(StreamingExportMixin, MyCoursesView):
+    """Roster export: a student's own enrollments, an instructor's course enrollments, or all for admins."""
+
+    export_filename = "enrollments"
+    export_columns = (
+        ("id", "id"),
+        ("course_id", "course_id"),
+        ("course", "course__title"),
+        ("student_id", "student_id"),
+        ("student_email", "student__email"),
+        ("registration_number", "student__registration_number"),
+        ("status", "status"),
+        ("enrolled_at", "enrolled_at"),
+    )
+
+    def get_queryset(self):
+        user = self.request.user
+        if user.role == User.ROLE_ADMIN or user.is_staff:
+            queryset = Enrollment.objects.using(read_db()).all()
+        else:
+            queryset = super().get_queryset()
+
+        course_id = self.request.query_params.get("course")
+        if course_id:
+            if not course_id.isdigit():
+                raise ValidationError({"course": "Must be an integer."})
+            queryset = queryset.filter(course_id=course_id)
+        status_filter = self.request.query_params.get("status")
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        return queryset.order_by("-enrolled_at", "-id")
+
+
 class InstructorEnrollView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -120,6 +166,32 @@ class InstructorEnrollView(APIView):
             )
 
 
+class InstructorBulkEnrollView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, course_id):
+        user = request.user
+        
+        if user.role not in [User.ROLE_INSTRUCTOR, User.ROLE_ADMIN] and not user.is_staff:
+            raise PermissionDenied("Only instructors can enroll students.")
+        
+        serializer = BulkEnrollSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        try:
+            course = Course.objects.get(pk=course_id)
+            report = EnrollmentManagementService.bulk_enroll_students(
+                instructor=user,
+                course=course,
+                student_emails=serializer.validated_data["emails"]
+            )
+            return Response(report, status=status.HTTP_200_OK)
+        except Course.DoesNotExist:
+            raise NotFound("Course not found.")
+        except EnrollmentPermissionError as e:
+            raise PermissionDenied(str(e))
+
+
 class EnrollmentRequestCreateView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -156,9 +228,10 @@ class EnrollmentRequestCreateView(APIView):
             raise ValidationError(str(e))
 
 
-class EnrollmentRequestListView(generics.ListAPIView):
+class EnrollmentRequestListView(SerializationTimingMixin, PrefetchPlanMixin, generics.ListAPIView):
     serializer_class = EnrollmentRequestSerializer
     permission_classes = [permissions.IsAuthenticated]
+    keyset_ordering = "-created_at"
 
     def get_queryset(self):
         user = self.request.user
@@ -166,7 +239,7 @@ class EnrollmentRequestListView(generics.ListAPIView):
         if user.role == User.ROLE_INSTRUCTOR:
             return EnrollmentRequestService.get_instructor_requests(user)
         elif user.role == User.ROLE_STUDENT:
-            return EnrollmentRequest.objects.filter(
+            return EnrollmentRequest.objects.using(read_db()).filter(
                 student=user
             ).select_related("course", "instructor")
         
@@ -213,6 +286,27 @@ class EnrollmentRequestActionView(APIView):
             raise ValidationError(str(e))
 
 
+class EnrollmentRequestBatchActionView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        user = request.user
+        
+        if user.role != User.ROLE_INSTRUCTOR:
+            raise PermissionDenied("Only instructors can approve/reject requests.")
+        
+        serializer = EnrollmentRequestBatchActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        report = EnrollmentRequestService.batch_process_requests(
+            instructor=user,
+            action=serializer.validated_data["action"],
+            request_ids=serializer.validated_data.get("request_ids"),
+            course_id=serializer.validated_data.get("course_id")
+        )
+        return Response(report, status=status.HTTP_200_OK)
+
+
 class UnenrollStudentView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -231,8 +325,9 @@ class UnenrollStudentView(APIView):
             student_email = enrollment.student.email
             course_title = enrollment.course.title
             
-            enrollment.status = Enrollment.STATUS_CANCELLED
-            enrollment.save()
+            with transaction.atomic():
+                enrollment.cancel()
+                enrollment.save()
             
             return Response(
                 {"detail": f"Student {student_email} unenrolled from {course_title}."},
@@ -0,0 +1,51 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.notifications.services import EmailOutboxService
+
+
+class Command(BaseCommand):
+    help = "Deliver pending outgoing emails in batches, retrying failures with exponential backoff"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--loop", action="store_true", help="Keep polling instead of exiting once the queue is empty")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to wait when the queue is empty")
+        parser.add_argument(
+            "--retention-days", type=int, default=settings.EMAIL_OUTBOX_RETENTION_DAYS,
+            help="Delete sent and failed emails older than this whenever the queue drains; 0 keeps them",
+        )
+
+    def handle(self, *args, **options):
+        totals = {"sent": 0, "retry": 0, "failed": 0, "dropped": 0}
+        purge_due = True
+        try:
+            while True:
+                results = EmailOutboxService.process_batch(options["batch_size"])
+                for key, value in results.items():
+                    totals[key] += value
+                if any(results.values()):
+                    self.stdout.write(
+                        f"sent={results['sent']} retry={results['retry']} failed={results['failed']} "
+                        f"dropped={results['dropped']}"
+                    )
+                    purge_due = True
+                    continue
+                # Purge once each time the queue drains rather than on every idle poll.
+                if purge_due:
+                    purged = EmailOutboxService.purge(options["retention_days"])
+                    if purged:
+                        self.stdout.write(f"purged={purged}")
+                    purge_due = False
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {totals['sent']} emails, {totals['retry']} scheduled for retry, {totals['failed']} failed permanently, "
+            f"{totals['dropped']} dropped"
+        ))
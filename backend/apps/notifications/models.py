@@ -0,0 +1,41 @@
+from django.db import models
+from django.utils import timezone
+
+
+class OutgoingEmail(models.Model):
+	STATUS_PENDING = "pending"
+	STATUS_SENT = "sent"
+	STATUS_FAILED = "failed"
+	STATUS_DROPPED = "dropped"
+
+	STATUS_CHOICES = (
+		(STATUS_PENDING, "Pending"),
+		(STATUS_SENT, "Sent"),
+		(STATUS_FAILED, "Failed"),
+		(STATUS_DROPPED, "Dropped"),
+	)
+
+	to = models.EmailField()
+	subject = models.CharField(max_length=255)
+	template = models.CharField(max_length=255)
+	context = models.JSONField(default=dict, blank=True)
+	status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+	attempts = models.PositiveSmallIntegerField(default=0)
+	# Earliest time a worker may pick the row up; also serves as the lease while it is being sent.
+	next_attempt_at = models.DateTimeField(default=timezone.now)
+	last_error = models.TextField(blank=True)
+	# Queued only so the request does the same work as for a real email; the worker discards it unsent.
+	drop = models.BooleanField(default=False)
+	created_at = models.DateTimeField(auto_now_add=True)
+	sent_at = models.DateTimeField(null=True, blank=True)
+
+	class Meta:
+		verbose_name = "outgoing email"
+		verbose_name_plural = "outgoing emails"
+		ordering = ("-created_at",)
+		indexes = [
+			models.Index(fields=["status", "next_attempt_at"], name="outemail_status_next_idx"),
+		]
+
+	def __str__(self):
+		return f"{self.subject} -> {self.to} ({self.status})"
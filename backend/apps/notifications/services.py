@@ -0,0 +1,133 @@
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import OutgoingEmail
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxService:
+
+    @staticmethod
+    def enqueue(to: str, subject: str, template: str, context: Optional[Dict[str, Any]] = None,
+                drop: bool = False) -> OutgoingEmail:
+        if drop:
+            # Same insert as a real email, but nothing caller-supplied is kept; the worker deletes the row.
+            to, context = "", None
+        return OutgoingEmail.objects.create(
+            to=to, subject=subject, template=template, context=context or {}, drop=drop
+        )
+
+    @staticmethod
+    def backoff(attempts: int) -> timedelta:
+        seconds = settings.EMAIL_OUTBOX_BACKOFF_SECONDS * (2 ** max(0, attempts - 1))
+        return timedelta(seconds=min(seconds, settings.EMAIL_OUTBOX_MAX_BACKOFF_SECONDS))
+
+    @staticmethod
+    @transaction.atomic
+    def claim_batch(batch_size: int) -> List[OutgoingEmail]:
+        now = timezone.now()
+        emails = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutgoingEmail.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        if not emails:
+            return []
+        # Push the rows out of reach of other workers; if this one dies they come back after the lease.
+        lease_until = now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS)
+        OutgoingEmail.objects.filter(id__in=[email.id for email in emails]).update(
+            next_attempt_at=lease_until, attempts=F("attempts") + 1
+        )
+        for email in emails:
+            email.attempts += 1
+        return emails
+
+    @staticmethod
+    def build_message(email: OutgoingEmail, connection) -> EmailMultiAlternatives:
+        body = render_to_string(email.template, context=email.context)
+        return EmailMultiAlternatives(email.subject, body, to=[email.to], connection=connection)
+
+    @staticmethod
+    def mark_sent(email: OutgoingEmail) -> None:
+        email.status = OutgoingEmail.STATUS_SENT
+        email.sent_at = timezone.now()
+        email.last_error = ""
+        # The context can hold secrets such as reset tokens; they are not needed once delivered.
+        email.context = {}
+        email.save(update_fields=["status", "sent_at", "last_error", "context"])
+
+    @staticmethod
+    def mark_failed(email: OutgoingEmail, error: Exception) -> None:
+        email.last_error = f"{type(error).__name__}: {error}"[:2000]
+        if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+            email.status = OutgoingEmail.STATUS_FAILED
+            email.context = {}
+        else:
+            email.next_attempt_at = timezone.now() + EmailOutboxService.backoff(email.attempts)
+        email.save(update_fields=["status", "next_attempt_at", "last_error", "context"])
+
+    @staticmethod
+    def mark_dropped(emails: List[OutgoingEmail]) -> int:
+        deleted, _ = OutgoingEmail.objects.filter(id__in=[email.id for email in emails]).delete()
+        return deleted
+
+    @staticmethod
+    def purge(retention_days: int) -> int:
+        """Delete finished rows older than ``retention_days``; dropped rows are deleted regardless of age."""
+        finished = Q(status=OutgoingEmail.STATUS_DROPPED)
+        if retention_days > 0:
+            cutoff = timezone.now() - timedelta(days=retention_days)
+            finished |= Q(
+                status__in=[OutgoingEmail.STATUS_SENT, OutgoingEmail.STATUS_FAILED], created_at__lt=cutoff
+            )
+        deleted, _ = OutgoingEmail.objects.filter(finished).delete()
+        return deleted
+
+    @staticmethod
+    def deliver(emails: List[OutgoingEmail]) -> Dict[str, int]:
+        """Send a claimed batch over one SMTP connection."""
+        results = {"sent": 0, "retry": 0, "failed": 0, "dropped": 0}
+        dropped = [email for email in emails if email.drop]
+        if dropped:
+            results["dropped"] = EmailOutboxService.mark_dropped(dropped)
+        emails = [email for email in emails if not email.drop]
+        if not emails:
+            return results
+
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as exc:
+            logger.warning("Could not open email connection: %s", exc)
+            for email in emails:
+                EmailOutboxService.mark_failed(email, exc)
+                results["failed" if email.status == OutgoingEmail.STATUS_FAILED else "retry"] += 1
+            return results
+
+        try:
+            for email in emails:
+                try:
+                    EmailOutboxService.build_message(email, connection).send()
+                except Exception as exc:
+                    logger.warning("Sending email %s to %s failed: %s", email.id, email.to, exc)
+                    EmailOutboxService.mark_failed(email, exc)
+                    results["failed" if email.status == OutgoingEmail.STATUS_FAILED else "retry"] += 1
+                else:
+                    EmailOutboxService.mark_sent(email)
+                    results["sent"] += 1
+        finally:
+            connection.close()
+        return results
+
+    @staticmethod
+    def process_batch(batch_size: int) -> Dict[str, int]:
+        return EmailOutboxService.deliver(EmailOutboxService.claim_batch(batch_size))
@@ -0,0 +1,48 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from .models import OutgoingEmail
+from .services import EmailOutboxService
+
+
+class PasswordResetOutboxTests(APITestCase):
+    def test_unknown_address_is_not_stored(self):
+        response = self.client.post("/api/auth/forgot-password/", {"email": "nobody@example.com"})
+        self.assertEqual(response.status_code, 200)
+        email = OutgoingEmail.objects.get()
+        self.assertTrue(email.drop)
+        self.assertEqual((email.to, email.context), ("", {}))
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class OutboxRetentionTests(TestCase):
+    def enqueue(self, status, age_days=0):
+        email = EmailOutboxService.enqueue("user@example.com", "Subject", "emails/password_reset.txt")
+        OutgoingEmail.objects.filter(pk=email.pk).update(
+            status=status, created_at=timezone.now() - timedelta(days=age_days)
+        )
+        return email
+
+    def test_dropped_rows_are_deleted(self):
+        EmailOutboxService.enqueue("nobody@example.com", "Subject", "emails/password_reset.txt", drop=True)
+        self.assertEqual(EmailOutboxService.process_batch(10)["dropped"], 1)
+        self.assertFalse(OutgoingEmail.objects.exists())
+
+    def test_purge_keeps_pending_and_recent_rows(self):
+        pending = self.enqueue(OutgoingEmail.STATUS_PENDING, age_days=90)
+        recent = self.enqueue(OutgoingEmail.STATUS_SENT, age_days=1)
+        self.enqueue(OutgoingEmail.STATUS_SENT, age_days=90)
+        self.enqueue(OutgoingEmail.STATUS_FAILED, age_days=90)
+        self.enqueue(OutgoingEmail.STATUS_DROPPED)
+        self.assertEqual(EmailOutboxService.purge(30), 3)
+        self.assertCountEqual(OutgoingEmail.objects.values_list("pk", flat=True), [pending.pk, recent.pk])
+
+    def test_send_queued_emails_purges(self):
+        self.enqueue(OutgoingEmail.STATUS_SENT, age_days=90)
+        call_command("send_queued_emails", retention_days=30, stdout=StringIO())
+        self.assertFalse(OutgoingEmail.objects.exists())
@@ -2,4 +2,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+# Under ASGI the hot read endpoints run as native async views instead of in a thread each.
+os.environ.setdefault("ASYNC_READ_VIEWS", "true")
 application = get_asgi_application()
@@ -0,0 +1,188 @@
+import asyncio
+import threading
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import Http404
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+_slots = None
+_slots_lock = threading.Lock()
+
+
+def _connection_slots():
+    """Process-wide budget of extra connections ``gather_queries`` may hold at once."""
+    global _slots
+    if _slots is None:
+        with _slots_lock:
+            if _slots is None:
+                _slots = threading.BoundedSemaphore(max(settings.ASYNC_QUERY_CONNECTIONS, 0) or 1)
+    return _slots
+
+
+class _Slot:
+    """One unit of the connection budget, returned exactly once."""
+
+    def __init__(self, slots):
+        self._slots = slots
+        self._lock = threading.Lock()
+        self._state = "held"
+
+    def start(self):
+        with self._lock:
+            if self._state != "held":
+                return False
+            self._state = "running"
+            return True
+
+    def release(self, unless_running=False):
+        with self._lock:
+            if self._state == "released" or (unless_running and self._state == "running"):
+                return
+            self._state = "released"
+        self._slots.release()
+
+
+def _on_own_connection(func, slot):
+    def run():
+        if not slot.start():
+            # The caller was cancelled before this thread got going.
+            return None
+        try:
+            return func()
+        finally:
+            # Worker threads outlive the request, so release their connection like a request would.
+            try:
+                close_old_connections()
+            finally:
+                slot.release()
+    return run
+
+
+def _in_order(funcs):
+    return lambda: [func() for func in funcs]
+
+
+async def gather_queries(*funcs):
+    """Run independent, read-only blocking ORM callables at the same time.
+
+    The first callable, and any callable that finds the connection budget
+    (``ASYNC_QUERY_CONNECTIONS``) used up, runs on the request's own
+    connection; the others each borrow a worker thread and a connection of
+    their own, so one request never holds more than ``ASYNC_QUERY_FANOUT``
+    extra connections and the process never more than the budget. Callables
+    that write must not be passed here. Results come back in argument order.
+    """
+    slots = _connection_slots()
+    budget = min(settings.ASYNC_QUERY_CONNECTIONS, settings.ASYNC_QUERY_FANOUT)
+    local, spread = [], []
+    try:
+        for index, func in enumerate(funcs):
+            if index and len(spread) < budget and slots.acquire(blocking=False):
+                spread.append((index, func, _Slot(slots)))
+            else:
+                local.append((index, func))
+        *spread_results, local_results = await asyncio.gather(
+            *(sync_to_async(_on_own_connection(func, slot), thread_sensitive=False)() for _, func, slot in spread),
+            sync_to_async(_in_order([func for _, func in local]))(),
+        )
+    finally:
+        # Threads that got going return their own slot once their connection is closed.
+        for _, _, slot in spread:
+            slot.release(unless_running=True)
+    results = [None] * len(funcs)
+    for (index, _, _), result in zip(spread, spread_results):
+        results[index] = result
+    for (index, _), result in zip(local, local_results):
+        results[index] = result
+    return results
+
+
+class AsyncAPIViewMixin:
+    """Let an ``APIView`` declare ``async def`` handlers.
+
+    DRF dispatch is synchronous, so authentication, permission and throttle
+    checks run in a worker thread; the handler itself runs on the event loop.
+    Methods without an async handler are forwarded to ``sync_view`` when set,
+    so an async read view can share its URL with the synchronous write view.
+    """
+
+    sync_view = None
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        method = request.method.lower()
+        handler = getattr(self, method, None) if method in self.http_method_names else None
+
+        # Read through the class so the stored view function is not bound as a method.
+        sync_view = type(self).sync_view
+        if sync_view is not None and method != "options" and not iscoroutinefunction(handler):
+            return await sync_to_async(sync_view)(request, *args, **kwargs)
+
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if handler is None:
+                handler = self.http_method_not_allowed
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncListModelMixin:
+    """Async counterpart of ``ListModelMixin``; count and page rows are fetched concurrently."""
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        # Views with ``ProjectionMixin`` may read plain ``values()`` rows instead of instances.
+        plan = self.get_values_plan() if hasattr(self, "get_values_plan") else None
+        if plan is not None:
+            queryset = self.values_queryset(plan, queryset)
+            serialize = plan.build
+        else:
+            serialize = lambda rows: self._serialize(rows, many=True)
+
+        if self.paginator is None:
+            rows = await sync_to_async(list)(queryset)
+            return Response(await sync_to_async(serialize)(rows))
+
+        page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        data = await sync_to_async(serialize)(page)
+        return self.get_paginated_response(data)
+
+    def _serialize(self, instance, many=False):
+        return self.get_serializer(instance, many=many).data
+
+
+class AsyncRetrieveModelMixin:
+    """Async counterpart of ``RetrieveModelMixin`` using the async ORM for the lookup."""
+
+    async def aretrieve(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        instance = await queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}).afirst()
+        if instance is None:
+            raise Http404("No %s matches the given query." % queryset.model._meta.object_name)
+        self.check_object_permissions(request, instance)
+        data = await sync_to_async(self._serialize)(instance)
+        return Response(data)
+
+    def _serialize(self, instance, many=False):
+        return self.get_serializer(instance, many=many).data
+
+
+class AsyncAPIView(AsyncAPIViewMixin, APIView):
+    pass
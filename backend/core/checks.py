@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Backends whose entries only the process that wrote them can see.
+PROCESS_LOCAL_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+@register(Tags.caches)
+def check_shared_caches(app_configs, **kwargs):
+    """Caches in ``SHARED_CACHES`` hold state every worker must agree on (revoked tokens, sticky reads).
+
+    A warning rather than an error: the LocMemCache defaults are right for a
+    single process (development, tests) and only wrong once there are several.
+    """
+    if settings.ALLOW_PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            f"The '{alias}' cache uses a per-process backend, so other workers would not see its writes.",
+            hint="Point it at a shared backend (Redis, Memcached, DatabaseCache), or set "
+                 "ALLOW_PROCESS_LOCAL_CACHES=true when running a single worker process.",
+            id="core.W001",
+        )
+        for alias in settings.SHARED_CACHES
+        if settings.CACHES[alias]["BACKEND"] in PROCESS_LOCAL_BACKENDS
+    ]
+
+
+@register(Tags.async_support)
+def check_async_query_connections(app_configs, **kwargs):
+    """``gather_queries`` borrows connections on top of the one each request holds."""
+    budget = settings.ASYNC_QUERY_CONNECTIONS
+    return [
+        Warning(
+            f"ASYNC_QUERY_CONNECTIONS ({budget}) leaves no room in the '{alias}' pool "
+            f"(max_size {pool['max_size']}) for the requests themselves.",
+            hint="Lower ASYNC_QUERY_CONNECTIONS or raise DB_POOL_MAX_SIZE.",
+            id="core.W002",
+        )
+        for alias, db in settings.DATABASES.items()
+        for pool in [db.get("OPTIONS", {}).get("pool")]
+        if isinstance(pool, dict) and budget >= pool.get("max_size", 0)
+    ]
@@ -0,0 +1,41 @@
+import hashlib
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: Optional[datetime]
+
+
+def make_validators(*parts: Any, last_modified: Optional[datetime] = None) -> Validators:
+    """Build an ETag from cheap state (row counts, timestamps, scope), not from the payload."""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return Validators(quote_etag(digest), last_modified)
+
+
+def not_modified(request, validators: Optional[Validators]):
+    """A 304 (or 412) response when the client's copy is current, else ``None``."""
+    if validators is None:
+        return None
+    response = get_conditional_response(
+        request,
+        etag=validators.etag,
+        last_modified=validators.last_modified and int(validators.last_modified.timestamp()),
+    )
+    return response and add_validators(response, validators)
+
+
+def add_validators(response, validators: Optional[Validators]):
+    if validators is None or response.status_code not in (200, 304):
+        return response
+    response["ETag"] = validators.etag
+    if validators.last_modified is not None:
+        response["Last-Modified"] = http_date(validators.last_modified.timestamp())
+    # Per-user payloads: browsers may keep a copy but must revalidate, shared caches must not.
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ["Authorization"])
+    return response
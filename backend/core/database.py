@@ -0,0 +1,176 @@
+"""Build ``DATABASES`` from the environment.
+
+PostgreSQL settings:
+
+``DB_CONN_MAX_AGE``
+    Seconds to keep a connection open between requests (persistent
+    connections). Ignored when pooling is on; Django forbids combining them.
+``DB_CONN_HEALTH_CHECKS``
+    Ping reused persistent connections before handing them to a request.
+``DB_POOL`` / ``DB_POOL_MIN_SIZE`` / ``DB_POOL_MAX_SIZE`` / ``DB_POOL_TIMEOUT``
+    psycopg connection pool per process (needs ``psycopg[pool]``).
+``DB_CONNECT_TIMEOUT`` / ``DB_STATEMENT_TIMEOUT_MS``
+    libpq connect timeout and a server-side ``statement_timeout``.
+``POSTGRES_REPLICA_HOST`` (``_PORT``, ``_DB``, ``_USER``, ``_PASSWORD``)
+    Adds a ``replica`` alias; unset parts default to the primary's values.
+
+SQLite settings:
+
+``SQLITE_REPLICA_PATH``
+    A second database file served as the ``replica`` alias, for trying the
+    replica router locally; refresh it with ``manage.py sync_sqlite_replica``.
+"""
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() == "true"
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def sqlite_database(name) -> Dict[str, Any]:
+    return {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": name,
+        "OPTIONS": {
+            # Seconds a writer waits on a locked database before failing
+            "timeout": _env_int("SQLITE_BUSY_TIMEOUT", 20),
+            # Take the write lock at BEGIN, so concurrent transactions queue on the timeout above
+            # instead of failing when a reader tries to upgrade.
+            "transaction_mode": "IMMEDIATE",
+        },
+        # A file rather than shared-cache memory, whose table locks fail at once instead of
+        # waiting; the concurrency tests run threads on separate connections.
+        "TEST": {"NAME": f"{name}.test"},
+    }
+
+
+def sqlite_databases(base_dir) -> Dict[str, Dict[str, Any]]:
+    databases = {"default": sqlite_database(base_dir / "db.sqlite3")}
+    replica_path = os.getenv("SQLITE_REPLICA_PATH")
+    if replica_path:
+        replica = sqlite_database(base_dir / replica_path)
+        replica["TEST"] = {"MIRROR": "default"}
+        databases["replica"] = replica
+    return databases
+
+
+def postgres_options() -> Dict[str, Any]:
+    options: Dict[str, Any] = {"connect_timeout": _env_int("DB_CONNECT_TIMEOUT", 5)}
+
+    statement_timeout = _env_int("DB_STATEMENT_TIMEOUT_MS", 30000)
+    if statement_timeout:
+        options["options"] = f"-c statement_timeout={statement_timeout}"
+
+    if _env_bool("DB_POOL", False):
+        options["pool"] = {
+            "min_size": _env_int("DB_POOL_MIN_SIZE", 2),
+            "max_size": _env_int("DB_POOL_MAX_SIZE", 10),
+            # Seconds a request waits for a free connection before erroring
+            "timeout": _env_int("DB_POOL_TIMEOUT", 10),
+        }
+    return options
+
+
+def postgres_database(prefix: str = "POSTGRES", fallback: Dict[str, Any] = None) -> Dict[str, Any]:
+    fallback = fallback or {}
+    options = postgres_options()
+    pooled = "pool" in options
+    return {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.getenv(f"{prefix}_DB", fallback.get("NAME")),
+        "USER": os.getenv(f"{prefix}_USER", fallback.get("USER")),
+        "PASSWORD": os.getenv(f"{prefix}_PASSWORD", fallback.get("PASSWORD")),
+        "HOST": os.getenv(f"{prefix}_HOST", fallback.get("HOST", "localhost")),
+        "PORT": os.getenv(f"{prefix}_PORT", fallback.get("PORT", "5432")),
+        "CONN_MAX_AGE": 0 if pooled else _env_int("DB_CONN_MAX_AGE", 60),
+        "CONN_HEALTH_CHECKS": not pooled and _env_bool("DB_CONN_HEALTH_CHECKS", True),
+        "OPTIONS": options,
+    }
+
+
+def build_databases(base_dir, use_sqlite: bool) -> Dict[str, Dict[str, Any]]:
+    if use_sqlite:
+        return sqlite_databases(base_dir)
+
+    default = postgres_database()
+    if not (default["NAME"] and default["USER"] and default["PASSWORD"]):
+        # Fallback to SQLite if PostgreSQL not configured
+        return sqlite_databases(base_dir)
+
+    databases = {"default": default}
+    if os.getenv("POSTGRES_REPLICA_HOST"):
+        replica = postgres_database("POSTGRES_REPLICA", fallback=default)
+        # Tests run against a single database; the replica mirrors it.
+        replica["TEST"] = {"MIRROR": "default"}
+        databases["replica"] = replica
+    return databases
+
+
+@contextmanager
+def statement_timeout(using: str, milliseconds: int):
+    """Run the block in a transaction whose statements PostgreSQL cancels after ``milliseconds``.
+
+    A cancelled statement raises ``OperationalError``. Other backends run the block unchanged.
+    """
+    from django.db import connections, transaction
+
+    if connections[using].vendor != "postgresql" or not milliseconds:
+        yield
+        return
+    with transaction.atomic(using=using):
+        with connections[using].cursor() as cursor:
+            cursor.execute("SET LOCAL statement_timeout = %s", [int(milliseconds)])
+        yield
+
+
+def pool_stats() -> Dict[str, Dict[str, int]]:
+    """psycopg pool counters per alias, for pools this process has opened."""
+    try:
+        from django.db.backends.postgresql.base import DatabaseWrapper
+    except ImportError:
+        return {}
+
+    stats = {}
+    for alias, pool in list(DatabaseWrapper._connection_pools.items()):
+        raw = pool.get_stats()
+        stats[alias] = {
+            "size": raw.get("pool_size", 0),
+            "available": raw.get("pool_available", 0),
+            "in_use": raw.get("pool_size", 0) - raw.get("pool_available", 0),
+            "waiting": raw.get("requests_waiting", 0),
+            "max_size": raw.get("pool_max", 0),
+            "connections_created": raw.get("connections_num", 0),
+            "requests_queued": raw.get("requests_queued", 0),
+            "requests_errors": raw.get("requests_errors", 0) + raw.get("connections_errors", 0),
+        }
+    return stats
+
+
+def pool_prometheus_lines() -> Iterable[str]:
+    stats = pool_stats()
+    if not stats:
+        return []
+    metrics = {
+        "size": ("gauge", "Connections currently held by the pool"),
+        "available": ("gauge", "Idle connections in the pool"),
+        "in_use": ("gauge", "Connections checked out by requests"),
+        "waiting": ("gauge", "Requests waiting for a connection"),
+        "max_size": ("gauge", "Configured maximum pool size"),
+        "connections_created": ("counter", "Connections opened by the pool"),
+        "requests_queued": ("counter", "Requests that had to wait for a connection"),
+        "requests_errors": ("counter", "Failed connection requests and attempts"),
+    }
+    lines = []
+    for key, (kind, help_text) in metrics.items():
+        name = f"lms_db_pool_{key}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for alias, values in sorted(stats.items()):
+            lines.append(f'{name}{{alias="{alias}"}} {values[key]}')
+    return lines
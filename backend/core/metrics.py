@@ -0,0 +1,122 @@
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .database import pool_prometheus_lines
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+OVERFLOW_LABEL = "__other__"
+
+
+class Histogram:
+    """Fixed-bucket histogram; memory stays constant however many values are observed."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.observations = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.observations += 1
+
+
+class MetricsRegistry:
+    """In-process request metrics keyed by (route, method).
+
+    The number of distinct label sets is capped; once full, new routes are
+    folded into a single overflow series so a scan of random URLs cannot
+    grow memory without bound.
+    """
+
+    HISTOGRAMS = {
+        "lms_http_request_duration_seconds": ("Total request latency", LATENCY_BUCKETS),
+        "lms_http_request_db_duration_seconds": ("Time spent in database queries", LATENCY_BUCKETS),
+        "lms_http_request_db_queries": ("Database queries per request", QUERY_COUNT_BUCKETS),
+        "lms_http_response_serialize_seconds": (
+            "Time spent in serializers building the response data, queries they trigger included", LATENCY_BUCKETS
+        ),
+        "lms_http_response_render_seconds": ("Time spent encoding the response body", LATENCY_BUCKETS),
+    }
+
+    def __init__(self, max_series: int = 500):
+        self.max_series = max_series
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], Dict[str, Histogram]] = {}
+        self._responses: Dict[Tuple[str, str, str], int] = {}
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def _labels(self, route: str, method: str) -> Tuple[str, str]:
+        key = (route, method)
+        if key not in self._series and len(self._series) >= self.max_series:
+            key = (OVERFLOW_LABEL, method)
+        if key not in self._series:
+            self._series[key] = {
+                name: Histogram(buckets) for name, (_, buckets) in self.HISTOGRAMS.items()
+            }
+        return key
+
+    def observe_request(self, route: str, method: str, status: int, duration: float,
+                        db_time: float, queries: int, serialize_time: float, render_time: float) -> None:
+        with self._lock:
+            key = self._labels(route, method)
+            series = self._series[key]
+            series["lms_http_request_duration_seconds"].observe(duration)
+            series["lms_http_request_db_duration_seconds"].observe(db_time)
+            series["lms_http_request_db_queries"].observe(queries)
+            series["lms_http_response_serialize_seconds"].observe(serialize_time)
+            series["lms_http_response_render_seconds"].observe(render_time)
+            response_key = key + (f"{status // 100}xx",)
+            self._responses[response_key] = self._responses.get(response_key, 0) + 1
+
+    def register_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """Add a callable returning extra Prometheus exposition lines."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._responses.clear()
+
+    def render_prometheus(self) -> str:
+        lines = []
+        with self._lock:
+            for name, (help_text, buckets) in self.HISTOGRAMS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (route, method), series in sorted(self._series.items()):
+                    histogram = series[name]
+                    labels = f'route="{_escape(route)}",method="{method}"'
+                    cumulative = 0
+                    for bound, count in zip(buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.observations}')
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.total}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.observations}")
+
+            lines.append("# HELP lms_http_responses_total Responses by route, method and status class")
+            lines.append("# TYPE lms_http_responses_total counter")
+            for (route, method, status), count in sorted(self._responses.items()):
+                lines.append(
+                    f'lms_http_responses_total{{route="{_escape(route)}",method="{method}",status="{status}"}} {count}'
+                )
+
+            collectors = list(self._collectors)
+
+        for collector in collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+registry.register_collector(pool_prometheus_lines)
@@ -1 +1,244 @@
-# Placeholder for custom middleware (e.g., audit/logging). Add implementations as needed.
+import logging
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.permissions import SAFE_METHODS
+
+from . import routers
+from .metrics import registry
+
+logger = logging.getLogger("core.metrics")
+
+_current_timer = ContextVar("request_query_timer", default=None)
+_current_serialize_timer = ContextVar("request_serialize_timer", default=None)
+
+
+class QueryTimer:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.duration += elapsed
+                self.count += 1
+
+
+def _time_query(execute, sql, params, many, context):
+    # Async views run queries on worker threads with their own connections;
+    # the request's timer follows them there through the context variable.
+    timer = _current_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    return timer(execute, sql, params, many, context)
+
+
+def install_query_timer(connection, **kwargs):
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_time_query)
+
+
+connection_created.connect(install_query_timer)
+
+
+class SerializeTimer:
+    """Time spent building response data; nested calls only count once."""
+
+    def __init__(self):
+        self.duration = 0.0
+        self._depth = threading.local()
+
+    def __call__(self, func, *args, **kwargs):
+        depth = getattr(self._depth, "value", 0)
+        self._depth.value = depth + 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._depth.value = depth
+            if depth == 0:
+                self.duration += time.perf_counter() - start
+
+
+def time_serialization(func, *args, **kwargs):
+    """Call ``func``, counting it as serialization time of the current request."""
+    timer = _current_serialize_timer.get()
+    if timer is None:
+        return func(*args, **kwargs)
+    return timer(func, *args, **kwargs)
+
+
+class _TimedSerializer:
+    """Proxy whose ``data`` counts as serialization time; everything else goes to the serializer."""
+
+    def __init__(self, serializer):
+        object.__setattr__(self, "_serializer", serializer)
+
+    def __getattr__(self, name):
+        return getattr(self._serializer, name)
+
+    def __setattr__(self, name, value):
+        # Views set ``serializer.instance`` after saving through a service.
+        setattr(self._serializer, name, value)
+
+    @property
+    def data(self):
+        return time_serialization(lambda: self._serializer.data)
+
+
+class SerializationTimingMixin:
+    """Generic view mixin: record building ``get_serializer(...).data`` as serializer time.
+
+    ``to_representation`` runs when the view reads ``.data``, before the
+    response is rendered, so the middleware can report the two apart.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        return _TimedSerializer(super().get_serializer(*args, **kwargs))
+
+
+class RequestMetricsMiddleware:
+    """Record latency, query count, DB time, serializer time and render time per resolved route."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        timer, tokens, start = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            self.reset(tokens)
+        self.finish(request, response, timer, start)
+        return response
+
+    async def __acall__(self, request):
+        if not settings.METRICS_ENABLED:
+            return await self.get_response(request)
+
+        timer, tokens, start = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.reset(tokens)
+        self.finish(request, response, timer, start)
+        return response
+
+    def start(self, request):
+        for connection in connections.all(initialized_only=True):
+            install_query_timer(connection)
+        timer = QueryTimer()
+        request._metrics_serialize_timer = SerializeTimer()
+        tokens = (_current_timer.set(timer), _current_serialize_timer.set(request._metrics_serialize_timer))
+        request._metrics_render_time = 0.0
+        return timer, tokens, time.perf_counter()
+
+    def reset(self, tokens):
+        query_token, serialize_token = tokens
+        _current_timer.reset(query_token)
+        _current_serialize_timer.reset(serialize_token)
+
+    def finish(self, request, response, timer, start):
+        duration = time.perf_counter() - start
+
+        route = self.route_for(request)
+        registry.observe_request(
+            route=route,
+            method=request.method,
+            status=response.status_code,
+            duration=duration,
+            db_time=timer.duration,
+            queries=timer.count,
+            serialize_time=request._metrics_serialize_timer.duration,
+            render_time=request._metrics_render_time,
+        )
+        self.log_if_slow(request, route, response, duration, timer)
+
+    def process_template_response(self, request, response):
+        # DRF encodes the response (JSON) after the view returns; time that step separately.
+        started = time.perf_counter()
+
+        def record_render_time(rendered):
+            request._metrics_render_time = time.perf_counter() - started
+
+        response.add_post_render_callback(record_render_time)
+        return response
+
+    def route_for(self, request):
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return "unresolved"
+        return match.view_name or match.route
+
+    def log_if_slow(self, request, route, response, duration, timer):
+        slow_ms = settings.METRICS_SLOW_REQUEST_MS
+        max_queries = settings.METRICS_SLOW_REQUEST_QUERIES
+        if (slow_ms and duration * 1000 >= slow_ms) or (max_queries and timer.count >= max_queries):
+            logger.warning(
+                "Slow request %s %s (%s): %.1fms, %d queries, %.1fms in database, status %s",
+                request.method,
+                request.path,
+                route,
+                duration * 1000,
+                timer.count,
+                timer.duration * 1000,
+                response.status_code,
+            )
+
+
+class ReplicaRoutingMiddleware:
+    """Scope replica routing to the request and start the sticky window after writes."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = self.start(request)
+        try:
+            return self.get_response(request)
+        finally:
+            self.finish(request, token)
+
+    async def __acall__(self, request):
+        token = self.start(request)
+        try:
+            return await self.get_response(request)
+        finally:
+            self.finish(request, token)
+
+    def start(self, request):
+        return routers.begin_request(request, pinned=request.method not in SAFE_METHODS)
+
+    def finish(self, request, token):
+        state = routers.end_request(token)
+        user = getattr(request, "user", None)
+        if state.wrote and user is not None and user.is_authenticated:
+            routers.stick_to_primary(user.pk)
@@ -0,0 +1,176 @@
+import base64
+import json
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .async_views import gather_queries
+from .projection import row_value
+
+
+class KeysetPagination(BasePagination):
+    """Seek pagination on a single ordering field with the primary key as tie-breaker.
+
+    Unlike OFFSET pagination the cost of a page does not depend on its depth,
+    and no COUNT(*) is issued.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, ordering, page_size=None):
+        self.field = ordering.lstrip("-")
+        self.descending = ordering.startswith("-")
+        self.page_size = page_size or api_settings.PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        cursor = self.decode_cursor(request, queryset.model)
+
+        reverse = bool(cursor and cursor["reverse"])
+        # Walking backwards flips the scan direction; the page is re-reversed below.
+        descending = self.descending != reverse
+        prefix = "-" if descending else ""
+        queryset = queryset.order_by(f"{prefix}{self.field}", f"{prefix}pk")
+
+        if cursor:
+            lookup = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{self.field}__{lookup}": cursor["value"]}) |
+                Q(**{self.field: cursor["value"], f"pk__{lookup}": cursor["pk"]})
+            )
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, item, reverse):
+        value = row_value(item, self.field)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = json.dumps({"v": value, "pk": row_value(item, "pk"), "r": reverse}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            return {
+                "value": model._meta.get_field(self.field).to_python(payload["v"]),
+                "pk": model._meta.pk.to_python(payload["pk"]),
+                "reverse": bool(payload["r"]),
+            }
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+
+class PageOrKeysetPagination(PageNumberPagination):
+    """Page number pagination by default; keyset pagination when the client asks for it.
+
+    Views opt in by declaring ``keyset_ordering`` (e.g. ``"-created_at"``).
+    Clients select the mode with ``?pagination=cursor`` and then follow the
+    ``next``/``previous`` links.
+    """
+
+    mode_query_param = "pagination"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = getattr(view, "keyset_ordering", None)
+        self.keyset = None
+        if ordering and self.wants_keyset(request):
+            self.keyset = KeysetPagination(ordering, page_size=self.get_page_size(request))
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async variant that fetches the total count and the requested page concurrently."""
+        ordering = getattr(view, "keyset_ordering", None)
+        self.keyset = None
+        if ordering and self.wants_keyset(request):
+            self.keyset = KeysetPagination(ordering, page_size=self.get_page_size(request))
+            return await sync_to_async(self.keyset.paginate_queryset)(queryset, request, view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        page_number = request.query_params.get(self.page_query_param) or 1
+        if page_number in self.last_page_strings:
+            # The last page depends on the count, so there is nothing to overlap.
+            return await sync_to_async(super().paginate_queryset)(queryset, request, view)
+        try:
+            number = int(page_number)
+        except (TypeError, ValueError):
+            number = None
+        if number is None or number < 1:
+            key = "invalid_page" if number is None else "min_page"
+            raise NotFound(self.invalid_page_message.format(
+                page_number=page_number, message=paginator.error_messages[key]
+            ))
+        offset = (number - 1) * page_size
+        count, rows = await gather_queries(queryset.count, lambda: list(queryset[offset:offset + page_size]))
+
+        # Seed the paginator with the count so page() validates without querying again; its
+        # object_list is a lazy slice that nothing evaluates, since ``rows`` is returned instead.
+        paginator.count = count
+        try:
+            self.page = paginator.page(number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        self.request = request
+        return rows
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def wants_keyset(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or KeysetPagination.cursor_query_param in request.query_params
+        )
@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+@dataclass
+class PrefetchPlan:
+    select_related: Set[str] = field(default_factory=set)
+    prefetch_related: Set[str] = field(default_factory=set)
+    only: Optional[Set[str]] = field(default_factory=set)
+
+    def apply(self, queryset, extra_only: Iterable[str] = ()):
+        queryset = queryset.select_related(None)
+        if self.select_related:
+            queryset = queryset.select_related(*sorted(self.select_related))
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(self.prefetch_related))
+        if self.only is not None:
+            queryset = queryset.only(*sorted(self.only.union(extra_only)))
+        return queryset
+
+
+_plans: Dict[Tuple[type, Optional[Tuple[str, ...]]], PrefetchPlan] = {}
+
+
+def build_plan(serializer_class, fields: Optional[Tuple[str, ...]] = None) -> PrefetchPlan:
+    """Derive the relations a serializer reads from its declared fields.
+
+    Dotted sources and nested serializers become ``select_related`` (or
+    ``prefetch_related`` for to-many relations) and every concrete column
+    read ends up in ``only()``. Fields whose source cannot be resolved to a
+    model field (methods, ``SerializerMethodField``) switch ``only()`` off;
+    serializers can list what such fields touch in ``Meta.select_related``
+    and ``Meta.prefetch_related``. ``fields`` plans a projected serializer
+    (see ``core.projection``).
+    """
+    key = (serializer_class, fields)
+    if key not in _plans:
+        plan = PrefetchPlan()
+        meta = getattr(serializer_class, "Meta", None)
+        serializer = serializer_class(fields=fields) if fields is not None else serializer_class()
+        _walk(serializer, meta.model, "", (), plan)
+        plan.select_related.update(getattr(meta, "select_related", ()))
+        plan.prefetch_related.update(getattr(meta, "prefetch_related", ()))
+        _plans[key] = plan
+    return _plans[key]
+
+
+def _walk(serializer, model, prefix, hops, plan):
+    if plan.only is not None:
+        plan.only.add(f"{prefix}{model._meta.pk.name}")
+
+    for serializer_field in serializer.fields.values():
+        if serializer_field.write_only:
+            continue
+        if serializer_field.source == "*" or isinstance(serializer_field, serializers.SerializerMethodField):
+            plan.only = None
+            continue
+
+        child = serializer_field
+        if isinstance(child, serializers.ListSerializer):
+            child = child.child
+        _resolve(serializer_field, child, model, prefix, hops, plan)
+
+
+def _resolve(serializer_field, child, model, prefix, hops, plan):
+    # ``hops`` holds (prefix, model, field) for each relation followed so far, so a
+    # source that walks back over the relation it came from (profile.user) resolves
+    # against the already-loaded parent instead of adding another join.
+    path_prefix, path_model, path_hops = prefix, model, hops
+    attrs = serializer_field.source_attrs
+    many = isinstance(serializer_field, (serializers.ListSerializer, serializers.ManyRelatedField))
+
+    for index, attr in enumerate(attrs):
+        try:
+            model_field = path_model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            plan.only = None
+            return
+
+        is_last = index == len(attrs) - 1
+        if not model_field.is_relation:
+            if plan.only is not None:
+                plan.only.add(f"{path_prefix}{model_field.name}")
+            return
+
+        if path_hops and model_field.remote_field is path_hops[-1][2]:
+            path_prefix, path_model, _ = path_hops[-1]
+            path_hops = path_hops[:-1]
+            if is_last and not isinstance(child, serializers.BaseSerializer):
+                return
+            continue
+
+        to_many = model_field.many_to_many or model_field.one_to_many
+        if is_last and not to_many and not isinstance(child, serializers.BaseSerializer):
+            # Related primary keys are read from the local column.
+            if plan.only is not None and model_field.concrete:
+                plan.only.add(f"{path_prefix}{model_field.name}")
+            return
+
+        if to_many or many:
+            plan.prefetch_related.add(f"{path_prefix}{model_field.name}")
+            # Prefetched querysets are planned separately; only() stops at this boundary.
+            if plan.only is not None and model_field.concrete:
+                plan.only.add(f"{path_prefix}{model_field.name}")
+            return
+
+        if plan.only is not None and model_field.concrete:
+            plan.only.add(f"{path_prefix}{model_field.name}")
+        plan.select_related.add(f"{path_prefix}{model_field.name}")
+        path_hops = path_hops + ((path_prefix, path_model, model_field),)
+        path_prefix = f"{path_prefix}{model_field.name}__"
+        path_model = model_field.related_model
+
+    if isinstance(child, serializers.BaseSerializer):
+        _walk(child, path_model, path_prefix, path_hops, plan)
+
+
+def plan_queryset(serializer_class, queryset, extra_only: Iterable[str] = (), fields: Optional[Tuple[str, ...]] = None):
+    return build_plan(serializer_class, fields).apply(queryset, extra_only)
+
+
+class PrefetchPlanMixin:
+    """Shape list querysets to exactly what the view's serializer reads."""
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method == "GET" and getattr(self, "action", "list") == "list":
+            # Keyset pagination reads the ordering column from each row.
+            ordering = getattr(self, "keyset_ordering", None)
+            extra_only = [ordering.lstrip("-")] if ordering else []
+            projection = self.get_projection() if hasattr(self, "get_projection") else None
+            queryset = plan_queryset(self.get_serializer_class(), queryset, extra_only, projection)
+        return queryset
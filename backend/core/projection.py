@@ -0,0 +1,236 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .middleware import time_serialization
+
+SUMMARY_VIEW = "summary"
+FULL_VIEW = "full"
+
+# Fields whose representation of a column value is the value itself.
+PASSTHROUGH_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+    serializers.ReadOnlyField,
+    serializers.PrimaryKeyRelatedField,
+)
+# Fields that format a column value; their own ``to_representation`` is reused.
+CONVERTED_FIELDS = (
+    serializers.DateTimeField,
+    serializers.DateField,
+    serializers.FloatField,
+    serializers.UUIDField,
+)
+# Subclasses of the above that need the request or the model instance.
+UNSUPPORTED_FIELDS = (
+    serializers.FileField,
+    serializers.MultipleChoiceField,
+    serializers.HyperlinkedRelatedField,
+    serializers.SerializerMethodField,
+)
+
+
+class ProjectedSerializerMixin:
+    """Narrow a serializer to ``fields``; ``Meta.summary_fields`` is the ``?view=summary`` set."""
+
+    def __init__(self, *args, fields: Optional[Iterable[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            keep = set(fields)
+            for name in [name for name in self.fields if name not in keep]:
+                self.fields.pop(name)
+
+
+_readable: Dict[type, Tuple[str, ...]] = {}
+
+
+def readable_fields(serializer_class) -> Tuple[str, ...]:
+    if serializer_class not in _readable:
+        _readable[serializer_class] = tuple(
+            name for name, field in serializer_class().fields.items() if not field.write_only
+        )
+    return _readable[serializer_class]
+
+
+# (output name, values() lookup, converter) for a column, or
+# (output name, lookup of the related pk, nested shape) for a nested serializer.
+Shape = List[Tuple[str, str, Any]]
+
+
+@dataclass
+class ValuesPlan:
+    """Reads a list straight from ``values()`` rows into the dicts the serializer would produce."""
+
+    lookups: Tuple[str, ...]
+    shape: Shape
+
+    def values(self, queryset, extra: Iterable[str] = ()):
+        return queryset.prefetch_related(None).values(*dict.fromkeys((*self.lookups, *extra)))
+
+    def build(self, rows) -> List[Dict[str, Any]]:
+        return time_serialization(lambda: [_build_row(row, self.shape) for row in rows])
+
+
+def _build_row(row, shape):
+    data = {}
+    for name, lookup, convert in shape:
+        value = row[lookup]
+        if value is None:
+            data[name] = None
+        elif isinstance(convert, list):
+            data[name] = _build_row(row, convert)
+        else:
+            data[name] = convert(value) if convert else value
+    return data
+
+
+def _lookup(model, attrs, relation_ok):
+    """The ``values()`` path for ``attrs``, following to-one relations only, or ``None``."""
+    path = []
+    for index, attr in enumerate(attrs):
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None, None
+        path.append(model_field.name)
+        is_last = index == len(attrs) - 1
+        if not model_field.is_relation:
+            return ("__".join(path), None) if is_last else (None, None)
+        if model_field.many_to_many or model_field.one_to_many:
+            return None, None
+        if is_last:
+            return ("__".join(path), model_field.related_model) if relation_ok else (None, None)
+        model = model_field.related_model
+    return None, None
+
+
+def _shape(serializer, model, prefix, lookups) -> Optional[Shape]:
+    shape = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if field.source == "*" or isinstance(field, (serializers.ListSerializer, *UNSUPPORTED_FIELDS)):
+            return None
+
+        nested = isinstance(field, serializers.ModelSerializer)
+        lookup, related_model = _lookup(model, field.source_attrs, relation_ok=nested or isinstance(
+            field, serializers.PrimaryKeyRelatedField
+        ))
+        if lookup is None:
+            return None
+
+        if nested:
+            sub_shape = _shape(field, related_model, f"{prefix}{lookup}__", lookups)
+            if sub_shape is None:
+                return None
+            # The related pk tells a missing relation (null) apart from one with null columns.
+            pk_lookup = f"{prefix}{lookup}__{related_model._meta.pk.name}"
+            lookups.append(pk_lookup)
+            shape.append((name, pk_lookup, sub_shape))
+        elif isinstance(field, CONVERTED_FIELDS):
+            lookups.append(prefix + lookup)
+            shape.append((name, prefix + lookup, field.to_representation))
+        elif isinstance(field, PASSTHROUGH_FIELDS):
+            lookups.append(prefix + lookup)
+            shape.append((name, prefix + lookup, None))
+        else:
+            return None
+    return shape
+
+
+_values_plans: Dict[Tuple[type, Optional[Tuple[str, ...]]], Optional[ValuesPlan]] = {}
+
+
+def build_values_plan(serializer_class, fields: Optional[Tuple[str, ...]] = None) -> Optional[ValuesPlan]:
+    """A :class:`ValuesPlan` matching ``serializer_class`` narrowed to ``fields``, or ``None``
+    when some field needs the model instance (methods, files, to-many relations)."""
+    key = (serializer_class, fields)
+    if key not in _values_plans:
+        serializer = serializer_class(fields=fields) if fields is not None else serializer_class()
+        lookups: List[str] = []
+        shape = _shape(serializer, serializer.Meta.model, "", lookups)
+        _values_plans[key] = ValuesPlan(tuple(dict.fromkeys(lookups)), shape) if shape is not None else None
+    return _values_plans[key]
+
+
+class ProjectionMixin:
+    """``?fields=a,b`` or ``?view=summary`` narrows GET responses, and the SQL behind them.
+
+    Lists whose (projected) serializer only reads columns skip DRF's per-field machinery:
+    rows come from ``values()`` and are shaped into the same dicts the serializer returns.
+    """
+
+    fields_query_param = "fields"
+    view_query_param = "view"
+
+    def get_projection(self) -> Optional[Tuple[str, ...]]:
+        if not hasattr(self, "_projection"):
+            self._projection = self._parse_projection()
+        return self._projection
+
+    def _parse_projection(self):
+        serializer_class = self.get_serializer_class()
+        if self.request.method != "GET" or not issubclass(serializer_class, ProjectedSerializerMixin):
+            return None
+
+        params = self.request.query_params
+        view = params.get(self.view_query_param) or FULL_VIEW
+        if view not in (SUMMARY_VIEW, FULL_VIEW):
+            raise ValidationError({self.view_query_param: f"Must be {SUMMARY_VIEW} or {FULL_VIEW}."})
+        raw = params.get(self.fields_query_param)
+        if raw:
+            requested = tuple(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+        elif view == SUMMARY_VIEW:
+            requested = tuple(serializer_class.Meta.summary_fields)
+        else:
+            return None
+
+        readable = readable_fields(serializer_class)
+        unknown = [name for name in requested if name not in readable]
+        if unknown or not requested:
+            raise ValidationError({
+                self.fields_query_param: f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(readable)}."
+            })
+        return requested
+
+    def get_serializer(self, *args, **kwargs):
+        projection = self.get_projection()
+        if projection is not None:
+            kwargs.setdefault("fields", projection)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_values_plan(self) -> Optional[ValuesPlan]:
+        if self.request.method != "GET" or getattr(self, "action", "list") != "list":
+            return None
+        serializer_class = self.get_serializer_class()
+        if not issubclass(serializer_class, ProjectedSerializerMixin):
+            return None
+        return build_values_plan(serializer_class, self.get_projection())
+
+    def values_queryset(self, plan: ValuesPlan, queryset):
+        # Keyset pagination reads the ordering column and pk from each row.
+        ordering = getattr(self, "keyset_ordering", None)
+        extra = ("pk", ordering.lstrip("-")) if ordering else ()
+        return plan.values(queryset, extra)
+
+    def list(self, request, *args, **kwargs):
+        plan = self.get_values_plan()
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.values_queryset(plan, self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(plan.build(page))
+        return Response(plan.build(list(queryset)))
+
+
+def row_value(item, name: str) -> Any:
+    """Read ``name`` from a model instance or a ``values()`` row."""
+    return item[name] if isinstance(item, dict) else getattr(item, name)
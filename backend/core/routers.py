@@ -0,0 +1,111 @@
+"""Primary/replica routing.
+
+Query services read through ``read_db()``, which names the ``replica`` alias
+when one is configured and the caller can tolerate replication lag. Every
+other query, and every write, goes to ``default``. Once a request writes,
+the rest of it reads from the primary, and so do its user's requests for the
+next ``DB_REPLICA_STICKY_SECONDS`` so they see their own changes. The sticky
+flags live in the shared ``DB_REPLICA_STICKY_CACHE`` so every worker sees
+them.
+"""
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PRIMARY = DEFAULT_DB_ALIAS
+REPLICA = "replica"
+
+
+class RoutingState:
+    """Per-request routing flags; a mutable object so worker threads share it."""
+
+    def __init__(self, request=None, pinned=False):
+        self.request = request
+        self.pinned = pinned
+        self.wrote = False
+        self.sticky = None
+
+
+_state = ContextVar("db_routing_state", default=None)
+
+
+def replica_configured() -> bool:
+    return REPLICA in settings.DATABASES
+
+
+def _sticky_key(user_id) -> str:
+    return f"db:sticky:{user_id}"
+
+
+def _sticky_cache():
+    return caches[settings.DB_REPLICA_STICKY_CACHE]
+
+
+def stick_to_primary(*user_ids) -> None:
+    """Send these users' replica reads to the primary for the sticky window."""
+    if replica_configured() and settings.DB_REPLICA_STICKY_SECONDS:
+        _sticky_cache().set_many(
+            {_sticky_key(user_id): 1 for user_id in user_ids}, settings.DB_REPLICA_STICKY_SECONDS
+        )
+
+
+def _user_is_sticky(state: RoutingState) -> bool:
+    if state.sticky is None:
+        # The user is only known once DRF has authenticated the request.
+        user = getattr(state.request, "user", None)
+        if user is None or not user.is_authenticated:
+            return False
+        state.sticky = _sticky_cache().get(_sticky_key(user.pk)) is not None
+    return state.sticky
+
+
+def read_db() -> str:
+    """Alias for lag-tolerant reads in the current request or task."""
+    if not replica_configured():
+        return PRIMARY
+    if connections[PRIMARY].in_atomic_block:
+        # Reads inside a transaction must see its uncommitted writes.
+        return PRIMARY
+    state = _state.get()
+    if state is None:
+        return REPLICA
+    if state.pinned or state.wrote or _user_is_sticky(state):
+        return PRIMARY
+    return REPLICA
+
+
+def begin_request(request, pinned=False):
+    return _state.set(RoutingState(request, pinned))
+
+
+def end_request(token) -> RoutingState:
+    state = _state.get()
+    _state.reset(token)
+    return state
+
+
+class PrimaryReplicaRouter:
+    """Write to the primary; leave reads on the alias the caller picked."""
+
+    def db_for_read(self, model, **hints):
+        # None lets Django follow the instance hint (related lookups stay on
+        # the alias their object came from) and otherwise use the primary.
+        return None
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if {obj1._state.db, obj2._state.db} <= {PRIMARY, REPLICA}:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA:
+            return False
+        return None
@@ -2,8 +2,11 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 
+from .database import build_databases
+
 # Load environment variables from backend/.env if present
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env")
@@ -28,9 +31,11 @@ INSTALLED_APPS = [
     "apps.courses",
     "apps.enrollments",
     "apps.dashboard",
+    "apps.notifications",
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -39,6 +44,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.ReplicaRoutingMiddleware",
 ]
 
 ROOT_URLCONF = "core.urls"
@@ -64,41 +70,16 @@ ASGI_APPLICATION = "core.asgi.application"
 
 USE_SQLITE = os.getenv("USE_SQLITE", "false").lower() == "true"
 
-if USE_SQLITE:
-    # SQLite for development
-    DATABASES = {
-        "default": {
-            "ENGINE": "django.db.backends.sqlite3",
-            "NAME": BASE_DIR / "db.sqlite3",
-        }
-    }
-else:
-    # PostgreSQL for production
-    POSTGRES_DB = os.getenv("POSTGRES_DB")
-    POSTGRES_USER = os.getenv("POSTGRES_USER")
-    POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD")
-    POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
-    POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5432")
-
-    if POSTGRES_DB and POSTGRES_USER and POSTGRES_PASSWORD:
-        DATABASES = {
-            "default": {
-                "ENGINE": "django.db.backends.postgresql",
-                "NAME": POSTGRES_DB,
-                "USER": POSTGRES_USER,
-                "PASSWORD": POSTGRES_PASSWORD,
-                "HOST": POSTGRES_HOST,
-                "PORT": POSTGRES_PORT,
-            }
-        }
-    else:
-        # Fallback to SQLite if PostgreSQL not configured
-        DATABASES = {
-            "default": {
-                "ENGINE": "django.db.backends.sqlite3",
-                "NAME": BASE_DIR / "db.sqlite3",
-            }
-        }
+# SQLite for development, PostgreSQL (persistent or pooled connections, optional replica) otherwise;
+# see core/database.py for the environment variables.
+DATABASES = build_databases(BASE_DIR, USE_SQLITE)
+DATABASE_ROUTERS = ["core.routers.PrimaryReplicaRouter"]
+# Seconds a user's reads stay on the primary after one of their requests writes
+DB_REPLICA_STICKY_SECONDS = int(os.getenv("DB_REPLICA_STICKY_SECONDS", "10"))
+# Cache alias holding those sticky flags; listed in SHARED_CACHES
+DB_REPLICA_STICKY_CACHE = os.getenv("DB_REPLICA_STICKY_CACHE", "auth")
+# rollup_enrollment_stats leaves the newest rows alone until transactions that stamped them have committed
+ROLLUP_SETTLE_SECONDS = int(os.getenv("ROLLUP_SETTLE_SECONDS", "60"))
 
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -121,16 +102,53 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "default"),
+    },
+    "catalog": {
+        "BACKEND": os.getenv("CATALOG_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CATALOG_CACHE_LOCATION", "catalog"),
+        "TIMEOUT": int(os.getenv("CATALOG_CACHE_TIMEOUT", "300")),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "1000"))},
+    },
+    # Token versions and blacklist lookups; must be shared by all workers (see SHARED_CACHES).
+    "auth": {
+        "BACKEND": os.getenv("AUTH_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("AUTH_CACHE_LOCATION", "auth"),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "50000"))},
+    },
+}
+# Aliases every worker must share; the core.W001 check warns about per-process backends for them
+SHARED_CACHES = tuple(dict.fromkeys(("auth", DB_REPLICA_STICKY_CACHE)))
+# Silence core.W001 when SHARED_CACHES use LocMemCache, which is only safe with a single worker process
+ALLOW_PROCESS_LOCAL_CACHES = os.getenv("ALLOW_PROCESS_LOCAL_CACHES", str(DEBUG)).lower() == "true"
+# Serialized catalog pages larger than this are not cached
+CATALOG_CACHE_MAX_PAGE_BYTES = int(os.getenv("CATALOG_CACHE_MAX_PAGE_BYTES", "262144"))
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.PageOrKeysetPagination",
     "PAGE_SIZE": 20,
 }
+# Processes hashing passwords in the import_users command; 0 means one per CPU (the API hashes in-process)
+USER_IMPORT_HASH_WORKERS = int(os.getenv("USER_IMPORT_HASH_WORKERS", "0"))
+# Rows fetched per server-side cursor round trip (and per streamed chunk) by the CSV/NDJSON exports
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+
+# Dotted path to a CourseSearchBackend; empty picks one from the database vendor
+COURSE_SEARCH_BACKEND = os.getenv("COURSE_SEARCH_BACKEND", "")
+COURSE_SEARCH_CONFIG = os.getenv("COURSE_SEARCH_CONFIG", "english")
+# Dotted path to a UserSearchBackend; empty picks one from the database vendor
+USER_SEARCH_BACKEND = os.getenv("USER_SEARCH_BACKEND", "")
+# PostgreSQL cancels a typeahead query after this long and the endpoint returns what it has
+USER_TYPEAHEAD_TIMEOUT_MS = int(os.getenv("USER_TYPEAHEAD_TIMEOUT_MS", "150"))
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=int(os.getenv("JWT_ACCESS_MINUTES", "5"))),
@@ -141,10 +159,22 @@ SIMPLE_JWT = {
     "ALGORITHM": "HS256",
     "SIGNING_KEY": SECRET_KEY,
 }
+# How long a user's token version is cached
+AUTH_TOKEN_VERSION_CACHE_SECONDS = int(os.getenv("AUTH_TOKEN_VERSION_CACHE_SECONDS", "60"))
+# Per-process Bloom filter in front of the refresh token blacklist lookups
+TOKEN_BLACKLIST_BLOOM = os.getenv("TOKEN_BLACKLIST_BLOOM", "False").lower() == "true"
+TOKEN_BLACKLIST_BLOOM_CAPACITY = int(os.getenv("TOKEN_BLACKLIST_BLOOM_CAPACITY", "200000"))
+TOKEN_BLACKLIST_BLOOM_ERROR_RATE = float(os.getenv("TOKEN_BLACKLIST_BLOOM_ERROR_RATE", "0.001"))
+TOKEN_BLACKLIST_BLOOM_SYNC_SECONDS = int(os.getenv("TOKEN_BLACKLIST_BLOOM_SYNC_SECONDS", "5"))
+# How long a "not blacklisted" answer is cached; 0 disables negative caching
+TOKEN_BLACKLIST_NEGATIVE_CACHE_SECONDS = int(os.getenv("TOKEN_BLACKLIST_NEGATIVE_CACHE_SECONDS", "2"))
 
 CORS_ALLOWED_ORIGINS = [o for o in os.getenv("CORS_ALLOWED_ORIGINS", "").split(",") if o]
 CORS_ALLOW_ALL_ORIGINS = not CORS_ALLOWED_ORIGINS
 CORS_ALLOW_CREDENTIALS = True
+# Conditional GETs: clients send If-None-Match and need to read ETag back.
+CORS_ALLOW_HEADERS = (*default_headers, "if-none-match")
+CORS_EXPOSE_HEADERS = ["ETag", "Last-Modified"]
 
 CSRF_TRUSTED_ORIGINS = [o for o in os.getenv("CSRF_TRUSTED_ORIGINS", "").split(",") if o]
 
@@ -159,6 +189,27 @@ EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "false").lower() == "true"
 EMAIL_USE_SSL = os.getenv("EMAIL_USE_SSL", "false").lower() == "true"
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "noreply@example.com")
 
+# Outbox delivery (send_queued_emails)
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+EMAIL_OUTBOX_BACKOFF_SECONDS = int(os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", "60"))
+EMAIL_OUTBOX_MAX_BACKOFF_SECONDS = int(os.getenv("EMAIL_OUTBOX_MAX_BACKOFF_SECONDS", "3600"))
+EMAIL_OUTBOX_LEASE_SECONDS = int(os.getenv("EMAIL_OUTBOX_LEASE_SECONDS", "300"))
+# Sent and failed rows older than this are purged by send_queued_emails; 0 keeps them forever
+EMAIL_OUTBOX_RETENTION_DAYS = int(os.getenv("EMAIL_OUTBOX_RETENTION_DAYS", "30"))
+
+# Serve the catalog, dashboard and my-courses reads from async views (core/asgi.py turns this on)
+ASYNC_READ_VIEWS = os.getenv("ASYNC_READ_VIEWS", "false").lower() == "true"
+# Extra connections the async views may open per process to overlap queries; keep below DB_POOL_MAX_SIZE.
+# SQLite serialises access anyway, so it gets none by default.
+ASYNC_QUERY_CONNECTIONS = int(os.getenv("ASYNC_QUERY_CONNECTIONS", "0" if USE_SQLITE else "4"))
+# ...and at most this many of them for a single request
+ASYNC_QUERY_FANOUT = int(os.getenv("ASYNC_QUERY_FANOUT", "2"))
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+# Log requests slower than this many milliseconds or issuing at least this many queries (0 disables)
+METRICS_SLOW_REQUEST_MS = int(os.getenv("METRICS_SLOW_REQUEST_MS", "1000"))
+METRICS_SLOW_REQUEST_QUERIES = int(os.getenv("METRICS_SLOW_REQUEST_QUERIES", "50"))
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -0,0 +1,77 @@
+import re
+from contextlib import ExitStack
+
+from django.db import connections, transaction
+from django.test.utils import CaptureQueriesContext
+
+
+def count_queries(client, url, params=None):
+    """Queries run by ``GET url`` on every database alias (list reads may go to the replica)."""
+    with ExitStack() as stack:
+        captured = [stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in connections]
+        response = client.get(url, params or {})
+    if response.status_code != 200:
+        raise AssertionError(f"GET {url} returned {response.status_code}")
+    queries = [query for context in captured for query in context.captured_queries]
+    return len(queries), queries
+
+
+def count_list_queries(client, url, page_size, params=None):
+    return count_queries(client, url, dict(params or {}, page_size=page_size))
+
+
+def assert_constant_list_queries(client, url, small=1, large=20, params=None):
+    """Fail if the number of queries for a list endpoint grows with page size.
+
+    The endpoint must have at least ``large`` rows visible to ``client``.
+    """
+    small_count, _ = count_list_queries(client, url, small, params)
+    large_count, queries = count_list_queries(client, url, large, params)
+    if large_count > small_count:
+        statements = "\n".join(query["sql"] for query in queries)
+        raise AssertionError(
+            f"GET {url} ran {small_count} queries for {small} rows but {large_count} for {large} rows:\n"
+            f"{statements}"
+        )
+
+
+class QueryCountAssertionsMixin:
+    """TestCase mixin exposing :func:`assert_constant_list_queries`."""
+
+    databases = "__all__"
+
+    def assertConstantListQueries(self, url, small=1, large=20, params=None, client=None):
+        assert_constant_list_queries(client or self.client, url, small, large, params)
+
+
+def explain_plan(queryset, no_seqscan=False):
+    """The database's plan for ``queryset`` (``EXPLAIN`` / ``EXPLAIN QUERY PLAN``).
+
+    ``no_seqscan`` discourages PostgreSQL from sequential scans, which it
+    prefers on the small tables of a test database.
+    """
+    connection = connections[queryset.db]
+    if not (no_seqscan and connection.vendor == "postgresql"):
+        return queryset.explain()
+    with transaction.atomic(using=queryset.db):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+
+def planned_index(plan, index_names):
+    """The first of ``index_names`` that ``plan`` mentions, or ``None``."""
+    for name in index_names:
+        if re.search(rf"\b{re.escape(name)}\b", plan):
+            return name
+    return None
+
+
+def assert_uses_index(queryset, *index_names, no_seqscan=True):
+    """Fail unless the planner reads ``queryset`` through one of ``index_names``."""
+    plan = explain_plan(queryset, no_seqscan)
+    if planned_index(plan, index_names) is None:
+        raise AssertionError(
+            f"Expected the plan to use {' or '.join(index_names)}:\n{plan}\n\nSQL: {queryset.query}"
+        )
+    return plan
@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.urls import include, path
 
+from .views import MetricsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/auth/", include("apps.accounts.urls")),
@@ -8,4 +10,5 @@ urlpatterns = [
     path("api/courses/", include("apps.courses.urls")),
     path("api/", include("apps.enrollments.urls")),
     path("api/dashboard/", include("apps.dashboard.urls")),
+    path("api/metrics/", MetricsView.as_view(), name="metrics"),
 ]
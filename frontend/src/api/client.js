@@ -3,19 +3,40 @@ import { clearAuthTokens, getStoredTokens, setAuthTokens } from '../utils/tokens
 
 const api = axios.create({
   baseURL: `${import.meta.env.VITE_API_BASE}/api`,
+  validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
 })
 
+// Last GET response per URL that carried an ETag; replayed when the server answers 304.
+const etagCache = new Map()
+const cacheKey = (config) => api.getUri(config)
+
 api.interceptors.request.use((config) => {
   const tokens = getStoredTokens()
   if (tokens?.access) {
     config.headers.Authorization = `Bearer ${tokens.access}`
   }
+  if (config.method === 'get') {
+    const cached = etagCache.get(cacheKey(config))
+    if (cached) {
+      config.headers['If-None-Match'] = cached.etag
+    }
+  }
   return config
 })
 
 let refreshing = null
 api.interceptors.response.use(
-  (resp) => resp,
+  (resp) => {
+    if (resp.config.method !== 'get') return resp
+    const key = cacheKey(resp.config)
+    if (resp.status === 304 && etagCache.has(key)) {
+      return { ...resp, status: 200, data: etagCache.get(key).data }
+    }
+    if (resp.headers.etag) {
+      etagCache.set(key, { etag: resp.headers.etag, data: resp.data })
+    }
+    return resp
+  },
   async (error) => {
     const status = error.response?.status
     const original = error.config
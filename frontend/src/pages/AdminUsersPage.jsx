@@ -20,6 +20,7 @@ const AdminUsersPage = () => {
   const [busyId, setBusyId] = useState(null)
   const [filters, setFilters] = useState({ q: '', role: '', active: '' })
   const [refreshKey, setRefreshKey] = useState(0)
+  const [suggestions, setSuggestions] = useState([])
 
   const activeOptions = useMemo(
     () => [
@@ -51,6 +52,24 @@ const AdminUsersPage = () => {
     fetchUsers()
   }, [filters.role, filters.active, refreshKey])
 
+  useEffect(() => {
+    const term = filters.q.trim()
+    if (!term) {
+      setSuggestions([])
+      return undefined
+    }
+    // Debounced: the typeahead endpoint is indexed, but there is no need to query on every keystroke.
+    const timer = setTimeout(async () => {
+      try {
+        const { data } = await api.get('/auth/users/typeahead/', { params: { q: term, limit: 8 } })
+        setSuggestions(data.results || [])
+      } catch (err) {
+        setSuggestions([])
+      }
+    }, 200)
+    return () => clearTimeout(timer)
+  }, [filters.q])
+
   const onSearchSubmit = (e) => {
     e.preventDefault()
     setRefreshKey((v) => v + 1)
@@ -82,11 +101,19 @@ const AdminUsersPage = () => {
           style={{ display: 'flex', gap: '1rem', alignItems: 'center', flexWrap: 'wrap' }}
         >
           <input
-            placeholder="🔍 Search by email"
+            placeholder="🔍 Search by email, name or registration number"
+            list="user-suggestions"
             value={filters.q}
             onChange={(e) => setFilters((prev) => ({ ...prev, q: e.target.value }))}
             style={{ minWidth: '200px', padding: '0.75rem', borderRadius: '8px', border: '2px solid #cbd5e0', fontSize: '1rem', flex: 1 }}
           />
+          <datalist id="user-suggestions">
+            {suggestions.map((s) => (
+              <option key={s.id} value={s.email}>
+                {[s.name, s.registration_number].filter(Boolean).join(' · ')}
+              </option>
+            ))}
+          </datalist>
           <select
             value={filters.role}
             onChange={(e) => setFilters((prev) => ({ ...prev, role: e.target.value }))}